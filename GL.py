@@ -2,6 +2,8 @@
 # Monkey-patch: Locale ayarlarını güvenli hale getiriyoruz.
 #########################################
 import os
+import time
+STARTUP_STARTED = time.perf_counter()  # Açılış süresi (ilk çizim) ölçümü bu andan itibaren yapılır
 os.environ["LC_ALL"] = "C"
 os.environ["LANG"] = "C"
 SETTINGS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "settings.json")
@@ -19,20 +21,40 @@ locale.setlocale = safe_setlocale
 #########################################
 # Gerekli modüllerin import edilmesi
 #########################################
-import pystray  # Sistem tepsisi için
-
+# Not: pystray, requests, PIL ve psutil açılışı yavaşlattığı için ihtiyaç duyuldukları fonksiyonlarda
+# import ediliyor; açılıştan sonra arka planda önceden yükleniyorlar (GameLauncher.background_startup).
 import json
+import math
+import collections
+import contextlib
+import re
+import difflib
 import subprocess
 import threading
-import time
-import requests
-import winreg  # Sadece Windows için
+import queue
+import atexit
+import tempfile
+import sqlite3
+import select
+import struct
+import ctypes
+import sys
+import argparse
+import importlib
+import bisect
+import hashlib
+import heapq
+import random
+import urllib.parse
+try:
+    import winreg  # Sadece Windows için
+except ImportError:
+    winreg = None
 from io import BytesIO
-from PIL import Image, ImageTk, ImageOps
-import concurrent.futures
 from tkinter import filedialog  # Tkinter'ın dosya seçme penceresi için
 from tkinter import messagebox  # Mesaj kutuları için
 from tkinter import simpledialog  # API key sorgulaması için
+from tkinter import TclError  # Tk hataları için
 
 import webbrowser  # Link açmak için
 
@@ -41,15 +63,2457 @@ import ttkbootstrap as tb
 from ttkbootstrap import ttk
 from ttkbootstrap.constants import *
 
-# Çalışan süreçleri kontrol etmek için ekliyoruz:
-import psutil
+#########################################
+# Çalıştırılabilir dosya (exe) arama ayarları
+#########################################
+EXE_SEARCH_MAX_DEPTH = 4      # Oyun klasöründe inilecek en fazla klasör derinliği
+EXE_CONFIDENT_SCORE = 95      # Bu puana ulaşan aday bulunursa arama erken biter
+# Aranmayacak asset / redistributable klasörleri (küçük harf)
+EXE_SKIP_DIRS = {
+    'redist', '_redist', 'redists', '_commonredist', 'commonredist', 'directx', 'dotnet', 'vcredist',
+    'prereqs', 'prerequisites', '__installer', 'installer', 'installers', 'support', 'thirdparty',
+    'content', 'paks', 'assets', 'streamingassets', 'textures', 'audio', 'sound', 'sounds', 'music',
+    'movies', 'videos', 'video', 'localization', 'shaders', 'shadercache', 'cache', 'logs', 'saves',
+    'screenshots', 'docs', 'manual', 'fonts', 'maps', 'platforms', 'mono', 'monobleedingedge'
+}
+# İsminde bu kelimeler geçen exe'ler (crash reporter, kurulum vb.) düşük puan alır
+EXE_PENALTY_WORDS = (
+    'crash', 'report', 'redist', 'setup', 'install', 'vcredist', 'dxsetup', 'helper', 'update',
+    'prereq', 'anticheat', 'battleye', 'cefprocess', 'webhelper', 'uninst', 'dotnet', 'touchup',
+    'cleanup', 'config', 'settings', 'benchmark', 'server', 'editor', 'sdk'
+)
+
+#########################################
+# Artımlı tarama indeksi ayarları
+#########################################
+SCAN_INDEX_FILE = "scan_index.json"
+SCAN_INDEX_VERSION = 1
+SCAN_INDEX_MAX_AGE = 30 * 24 * 3600  # Bu süre boyunca görülmeyen klasör kayıtları silinir (saniye)
+SCAN_INDEX_MISS_TTL = 15 * 60        # exe bulunamayan klasör bu süreden sonra tekrar aranır (kurulum sürüyor olabilir)
+
+#########################################
+# Valve KeyValues (VDF/ACF) ayrıştırıcı
+#########################################
+_VDF_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"'}
+
+def tokenize_vdf(text):
+    """VDF metnini ('str', değer), ('open', '{'), ('close', '}') token'larına ayırır."""
+    i, length = 0, len(text)
+    while i < length:
+        ch = text[i]
+        if ch.isspace():
+            i += 1
+        elif ch == '/' and text.startswith('//', i):
+            end = text.find('\n', i)
+            i = length if end == -1 else end + 1
+        elif ch == '{':
+            yield ('open', ch)
+            i += 1
+        elif ch == '}':
+            yield ('close', ch)
+            i += 1
+        elif ch == '[':
+            # Koşullu ifadeler ([$WIN32] gibi) yok sayılır.
+            end = text.find(']', i)
+            i = length if end == -1 else end + 1
+        elif ch == '"':
+            i += 1
+            chars = []
+            while i < length and text[i] != '"':
+                if text[i] == '\\' and i + 1 < length:
+                    chars.append(_VDF_ESCAPES.get(text[i + 1], text[i + 1]))
+                    i += 2
+                else:
+                    chars.append(text[i])
+                    i += 1
+            i += 1
+            yield ('str', ''.join(chars))
+        else:
+            start = i
+            while i < length and not text[i].isspace() and text[i] not in '{}"':
+                i += 1
+            yield ('str', text[start:i])
+
+def parse_vdf(text):
+    """VDF metnini iç içe sözlüklere çevirir. Bozuk/eksik kapanışlar hata vermeden tolere edilir."""
+    root = {}
+    stack = [root]
+    key = None
+    for kind, value in tokenize_vdf(text):
+        if kind == 'str':
+            if key is None:
+                key = value
+            else:
+                stack[-1][key] = value
+                key = None
+        elif kind == 'open':
+            child = {}
+            stack[-1][key if key is not None else ''] = child
+            stack.append(child)
+            key = None
+        elif len(stack) > 1:
+            stack.pop()
+            key = None
+    return root
+
+def vdf_get(data, key, default=None):
+    """VDF anahtarları büyük/küçük harf duyarsız olduğu için sözlükte duyarsız arama yapar."""
+    if not isinstance(data, dict):
+        return default
+    if key in data:
+        return data[key]
+    lower = key.lower()
+    for k, v in data.items():
+        if k.lower() == lower:
+            return v
+    return default
+
+#########################################
+# Kütüphane İzleyici: Kurulum/kaldırma değişikliklerini canlı takip
+#########################################
+class PollingWatchBackend:
+    """Her klasörün ve doğrudan alt girdilerinin mtime bilgisini periyodik olarak karşılaştıran yedek backend."""
+    name = "polling"
+
+    def __init__(self, interval=2.0):
+        self.interval = interval
+        self.signatures = {}
+        self.closed = threading.Event()
+
+    def add(self, path):
+        self.signatures[path] = self.signature(path)
+
+    def remove(self, path):
+        self.signatures.pop(path, None)
+
+    def signature(self, path):
+        try:
+            st = os.stat(path)
+            with os.scandir(path) as entries:
+                children = sorted((e.name, e.stat(follow_symlinks=False).st_mtime_ns) for e in entries)
+            return (st.st_mtime_ns, tuple(children))
+        except OSError:
+            return None
+
+    def wait(self, timeout):
+        if self.closed.wait(min(timeout, self.interval)):
+            return set()
+        changed = set()
+        for path, old in list(self.signatures.items()):
+            new = self.signature(path)
+            if new != old:
+                self.signatures[path] = new
+                changed.add(path)
+        return changed
+
+    def close(self):
+        self.closed.set()
+
+
+class InotifyWatchBackend:
+    """Linux inotify ile klasör değişikliklerini bildiren backend (ctypes üzerinden libc)."""
+    name = "inotify"
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    # IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    WATCH_MASK = 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200 | 0x400 | 0x800
+    EVENT_HEADER = struct.Struct("iIII")
+
+    @classmethod
+    def available(cls):
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            return hasattr(ctypes.CDLL(None, use_errno=True), "inotify_init1")
+        except OSError:
+            return False
+
+    def __init__(self):
+        self.libc = ctypes.CDLL(None, use_errno=True)
+        self.libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = self.libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 başarısız")
+        self.paths = {}  # watch descriptor -> klasör
+        self.wds = {}    # klasör -> watch descriptor
+
+    def add(self, path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch başarısız: {path}")
+        self.paths[wd] = path
+        self.wds[path] = wd
+
+    def remove(self, path):
+        wd = self.wds.pop(path, None)
+        if wd is not None:
+            self.paths.pop(wd, None)
+            self.libc.inotify_rm_watch(self.fd, wd)
+
+    def wait(self, timeout):
+        if self.fd < 0:
+            return set()
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, _mask, _cookie, name_len = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size + name_len
+            if wd in self.paths:
+                changed.add(self.paths[wd])
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class WindowsWatchBackend:
+    """Windows FindFirstChangeNotification ile klasör değişikliklerini bildiren backend."""
+    name = "win32"
+    # FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_DIR_NAME | FILE_NOTIFY_CHANGE_LAST_WRITE
+    NOTIFY_FILTER = 0x001 | 0x002 | 0x010
+    MAX_HANDLES = 64  # WaitForMultipleObjects sınırı
+    WAIT_TIMEOUT = 0x102
+
+    @classmethod
+    def available(cls):
+        return sys.platform == "win32"
+
+    def __init__(self):
+        self.kernel32 = ctypes.windll.kernel32
+        self.kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+        self.kernel32.FindFirstChangeNotificationW.argtypes = [ctypes.c_wchar_p, ctypes.c_int, ctypes.c_uint32]
+        self.kernel32.FindNextChangeNotification.argtypes = [ctypes.c_void_p]
+        self.kernel32.FindCloseChangeNotification.argtypes = [ctypes.c_void_p]
+        self.handles = {}  # klasör -> handle
+
+    def add(self, path):
+        if len(self.handles) >= self.MAX_HANDLES:
+            raise OSError(f"En fazla {self.MAX_HANDLES} klasör izlenebilir")
+        handle = self.kernel32.FindFirstChangeNotificationW(path, False, self.NOTIFY_FILTER)
+        if not handle or handle == ctypes.c_void_p(-1).value:
+            raise OSError(f"FindFirstChangeNotification başarısız: {path}")
+        self.handles[path] = handle
+
+    def remove(self, path):
+        handle = self.handles.pop(path, None)
+        if handle:
+            self.kernel32.FindCloseChangeNotification(handle)
+
+    def wait(self, timeout):
+        if not self.handles:
+            time.sleep(timeout)
+            return set()
+        paths = list(self.handles)
+        array = (ctypes.c_void_p * len(paths))(*[self.handles[p] for p in paths])
+        changed = set()
+        wait_ms = int(timeout * 1000)
+        while True:
+            result = self.kernel32.WaitForMultipleObjects(len(paths), array, False, wait_ms)
+            if result >= len(paths):  # WAIT_TIMEOUT veya hata
+                return changed
+            path = paths[result]
+            changed.add(path)
+            self.kernel32.FindNextChangeNotification(self.handles[path])
+            wait_ms = 0  # Aynı anda sinyallenmiş diğer klasörleri de topla
+
+    def close(self):
+        for path in list(self.handles):
+            self.remove(path)
+
+
+def create_watch_backend():
+    """Platformda varsa yerel bildirim backend'ini, yoksa polling backend'ini döndürür."""
+    for backend_class in (WindowsWatchBackend, InotifyWatchBackend):
+        if backend_class.available():
+            try:
+                return backend_class()
+            except Exception as e:
+                print(f"{backend_class.name} izleyici başlatılamadı, polling kullanılacak:", e)
+    return PollingWatchBackend()
+
+
+class LibraryWatcher:
+    """
+    Verilen kütüphane klasörlerini arka planda izler. Değişiklikler debounce süresi boyunca toplanır,
+    sonra callback(değişen_klasörler) izleyici thread'inden çağrılır.
+    """
+
+    def __init__(self, callback, backend=None, debounce=1.5):
+        self.callback = callback
+        self.backend = backend or create_watch_backend()
+        self.debounce = debounce
+        self.paths = set()
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def set_paths(self, paths):
+        paths = {p for p in paths if os.path.isdir(p)}
+        with self.lock:
+            for path in self.paths - paths:
+                self.backend.remove(path)
+            for path in paths - self.paths:
+                try:
+                    self.backend.add(path)
+                except OSError as e:
+                    print("Klasör izlemeye eklenemedi:", e)
+                    continue
+                self.paths.add(path)
+            self.paths &= paths
+
+    def start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+            self.thread = None
+        with self.lock:
+            self.backend.close()
+
+    def run(self):
+        pending = set()
+        last_change = 0.0
+        while not self.stop_event.is_set():
+            changed = self.backend.wait(0.5)
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+            elif pending and time.monotonic() - last_change >= self.debounce:
+                batch, pending = pending, set()
+                try:
+                    self.callback(batch)
+                except Exception as e:
+                    print("Kütüphane değişikliği işlenirken hata:", e)
+
+#########################################
+# Launcher Konum Bulucu (registry + dosya sistemi, önbellekli)
+#########################################
+# launcher -> (registry anahtarı, değer adı, kök klasör, istemci exe, process adı)
+# Kök ve istemci, registry değerinden türetilir; process None ise istemci exe'sinin adı kullanılır.
+LAUNCHER_LOCATIONS = {
+    'Steam': (r"SOFTWARE\WOW6432Node\Valve\Steam", "InstallPath",
+              lambda value: value,
+              lambda value: os.path.join(value, "steam.exe"),
+              'steam.exe'),
+    'Epic Games': (r"SOFTWARE\WOW6432Node\Epic Games\EpicGamesLauncher", "AppDataPath",
+                   lambda value: value,
+                   lambda value: os.path.join(os.path.dirname(value), "Portal", "Binaries", "Win32", "EpicGamesLauncher.exe"),
+                   'EpicGamesLauncher.exe'),
+    'GOG Galaxy': (r"SOFTWARE\WOW6432Node\GOG.com\GalaxyClient\paths", "client",
+                   lambda value: os.path.dirname(value),
+                   lambda value: value,
+                   None),
+    'Ubisoft Connect': (r"SOFTWARE\WOW6432Node\Ubisoft\Launcher", "InstallDir",
+                        lambda value: value,
+                        lambda value: os.path.join(value, "UbisoftConnect.exe"),
+                        'UbisoftConnect.exe'),
+    'Origin': (r"SOFTWARE\WOW6432Node\Origin", "ClientPath",
+               lambda value: os.path.dirname(value),
+               lambda value: value,
+               None),
+}
+
+
+class WinRegistryBackend:
+    """Gerçek Windows registry'si (HKEY_LOCAL_MACHINE) ve dosya sistemi üzerinden çalışan backend."""
+
+    def __init__(self):
+        self.stats = {'registry_reads': 0, 'exists_checks': 0}
+
+    def read_value(self, key_path, value_name):
+        self.stats['registry_reads'] += 1
+        if winreg is None:
+            raise OSError("winreg bu platformda kullanılamıyor")
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
+            return winreg.QueryValueEx(key, value_name)[0]
+
+    def exists(self, path):
+        self.stats['exists_checks'] += 1
+        return os.path.exists(path)
+
+
+class InMemoryRegistryBackend:
+    """Test ve ölçüm için sahte backend: registry değerleri ve var olan dosyalar bellekte tutulur."""
+
+    def __init__(self, values=None, existing_paths=None):
+        self.values = dict(values or {})  # (anahtar, değer adı) -> değer
+        self.existing_paths = set(existing_paths or ())
+        self.stats = {'registry_reads': 0, 'exists_checks': 0}
+
+    def read_value(self, key_path, value_name):
+        self.stats['registry_reads'] += 1
+        try:
+            return self.values[(key_path, value_name)]
+        except KeyError:
+            raise FileNotFoundError(2, "Sistem belirtilen dosyayı bulamıyor", key_path) from None
+
+    def exists(self, path):
+        self.stats['exists_checks'] += 1
+        return path in self.existing_paths
+
+
+class ClientLocator:
+    """
+    Her launcher'ın kurulum kökünü, istemci exe'sini ve process adını bir kez çözer ve önbellekte tutar.
+    invalidate() ile önbellek (tamamen ya da launcher bazında) temizlenebilir.
+    """
+
+    def __init__(self, backend=None, locations=None):
+        self.backend = backend or WinRegistryBackend()
+        self.locations = locations or LAUNCHER_LOCATIONS
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def resolve(self, launcher_name):
+        with self.lock:
+            cached = self.cache.get(launcher_name)
+        if cached is not None:
+            return cached
+        key_path, value_name, root_fn, client_fn, process = self.locations[launcher_name]
+        info = {'value': None, 'root': None, 'client': None, 'process': process, 'error': None}
+        try:
+            value = str(self.backend.read_value(key_path, value_name)).strip('"')
+            info['value'] = value
+            info['root'] = root_fn(value)
+            client = client_fn(value)
+            if self.backend.exists(client):
+                info['client'] = client
+                if process is None:
+                    info['process'] = os.path.basename(client)
+        except OSError as e:
+            info['error'] = str(e)
+        with self.lock:
+            self.cache[launcher_name] = info
+        return info
+
+    def install_root(self, launcher_name):
+        """Launcher'ın kök klasörünü döndürür; registry kaydı yoksa OSError fırlatır (tarayıcılar loglar)."""
+        info = self.resolve(launcher_name)
+        if info['error'] is not None:
+            raise OSError(info['error'])
+        return info['root']
+
+    def client_path(self, launcher_name):
+        info = self.resolve(launcher_name)
+        if info['error'] is not None:
+            print(f"{launcher_name} client yolu alınamadı: {info['error']}")
+        return info['client']
+
+    def clients(self):
+        """GameLauncher.clients yapısını (launcher -> {'path', 'process'}) üretir."""
+        result = {}
+        for launcher_name in self.locations:
+            info = self.resolve(launcher_name)
+            result[launcher_name] = {'path': info['client'], 'process': info['process']}
+        return result
+
+    def invalidate(self, launcher_name=None):
+        with self.lock:
+            if launcher_name is None:
+                self.cache.clear()
+            else:
+                self.cache.pop(launcher_name, None)
+
+#########################################
+# Xbox (Microsoft Store) Uygulama Kataloğu
+#########################################
+XBOX_APPS_CACHE_FILE = "xbox_apps_cache.json"
+XBOX_RULES_FILE = "xbox_rules.json"  # Kullanıcının düzenleyebileceği oyun eşleştirme kuralları
+DEFAULT_XBOX_RULES = {
+    # İsminde bu ifadelerden biri geçen uygulamalar oyun kabul edilir (büyük/küçük harf duyarsız).
+    "keywords": [
+        "halo", "forza", "minecraft", "gears", "sea of thieves",
+        "destiny", "witcher", "assassin", "battlefield", "cod", "persona", "no man's sky"
+    ],
+    # İsminde bu ifadelerden biri geçen uygulamalar, anahtar kelime eşleşse bile atlanır.
+    "exclude": []
+}
+
+
+def run_powershell(command):
+    return subprocess.check_output(
+        ["powershell", "-Command", command],
+        universal_newlines=True,
+        encoding="utf-8",
+        errors="replace"
+    )
+
+
+class XboxAppCatalog:
+    """
+    Get-StartApps sonucunu diskte saklar ve paket klasörlerinin mtime'ı değişmedikçe PowerShell'i tekrar çalıştırmaz.
+    Oyun eşleştirme, kurallar dosyasından derlenen tek bir düzenli ifade ile yapılır.
+    runner, komut çıktısını döndüren bir fonksiyondur (testlerde hazır JSON döndüren bir fonksiyon verilebilir).
+    """
+
+    def __init__(self, runner=None, cache_file=XBOX_APPS_CACHE_FILE, rules_file=XBOX_RULES_FILE, signature_paths=None):
+        self.runner = runner or run_powershell
+        self.cache_file = cache_file
+        self.rules_file = rules_file
+        if signature_paths is None:
+            signature_paths = [
+                os.path.join(os.environ.get("LOCALAPPDATA", ""), "Packages"),
+                os.path.join(os.environ.get("ProgramFiles", r"C:\Program Files"), "WindowsApps"),
+                os.path.join(os.environ.get("ProgramData", r"C:\ProgramData"), "Microsoft", "Windows", "Start Menu", "Programs")
+            ]
+        self.signature_paths = signature_paths
+        self.stats = {'runs': 0, 'cache_hits': 0}
+        self.matcher = None
+        self.excluder = None
+        self.rules_mtime = None
+
+    def change_signature(self):
+        """Paket klasörlerinin mtime'larından oluşan ucuz değişiklik sinyali; hiçbiri okunamıyorsa None."""
+        signature = []
+        for path in self.signature_paths:
+            try:
+                signature.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return signature if any(v is not None for v in signature) else None
+
+    def list_apps(self):
+        signature = self.change_signature()
+        if signature is not None:
+            try:
+                with open(self.cache_file, "r", encoding="utf-8") as f:
+                    cache = json.load(f)
+                if cache.get('signature') == signature:
+                    self.stats['cache_hits'] += 1
+                    return cache.get('apps', [])
+            except (OSError, ValueError):
+                pass
+        self.stats['runs'] += 1
+        apps = json.loads(self.runner("Get-StartApps | ConvertTo-Json") or "[]")
+        # apps, bir sözlük ya da liste olabilir; listeye dönüştürelim:
+        if isinstance(apps, dict):
+            apps = [apps]
+        apps = [{'Name': a.get('Name', ''), 'AppID': a.get('AppID', '')} for a in apps if isinstance(a, dict)]
+        if signature is not None:
+            try:
+                atomic_write_json(self.cache_file, {'signature': signature, 'apps': apps})
+            except OSError as e:
+                print("Xbox uygulama önbelleği kaydedilemedi:", e)
+        return apps
+
+    def compile_pattern(self, words):
+        words = sorted({w.lower() for w in words if w}, key=len, reverse=True)
+        if not words:
+            return None
+        return re.compile("|".join(re.escape(w) for w in words), re.IGNORECASE)
+
+    def load_rules(self):
+        """Kurallar dosyasını (yoksa varsayılanla oluşturarak) okur; dosya değişmediyse derli matcher kullanılır."""
+        try:
+            mtime = os.stat(self.rules_file).st_mtime_ns
+        except OSError:
+            try:
+                with open(self.rules_file, "w", encoding="utf-8") as f:
+                    json.dump(DEFAULT_XBOX_RULES, f, indent=4, ensure_ascii=False)
+                mtime = os.stat(self.rules_file).st_mtime_ns
+            except OSError:
+                mtime = None
+        if self.matcher is not None and mtime == self.rules_mtime:
+            return
+        rules = DEFAULT_XBOX_RULES
+        if mtime is not None:
+            try:
+                with open(self.rules_file, "r", encoding="utf-8") as f:
+                    rules = json.load(f)
+            except (OSError, ValueError) as e:
+                print("Xbox kuralları okunamadı, varsayılanlar kullanılıyor:", e)
+        self.matcher = self.compile_pattern(rules.get("keywords", []))
+        self.excluder = self.compile_pattern(rules.get("exclude", []))
+        self.rules_mtime = mtime
+
+    def find_games(self):
+        """Oyun olarak eşleşen uygulamaları (isim, AppID) listesi olarak döndürür."""
+        self.load_rules()
+        if self.matcher is None:
+            return []
+        matches = []
+        for app in self.list_apps():
+            name = app.get("Name", "")
+            if self.matcher.search(name) and not (self.excluder and self.excluder.search(name)):
+                matches.append((name, app.get("AppID", "")))
+        return matches
+
+#########################################
+# Tarama Profilleyici: launcher ve aşama bazında süre/sayaç
+#########################################
+class ScanProfiler:
+    """
+    Tarama aşamalarının (registry, listeleme, find_exe, manifest ...) süre ve sayılarını launcher bazında toplar.
+    Tarayıcılar ayrı thread'lerde çalıştığı için aktif launcher thread'e özel tutulur.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.data = {}
+
+    def reset(self):
+        with self.lock:
+            self.data = {}
+
+    def set_launcher(self, launcher_name):
+        self.local.launcher = launcher_name
+
+    def bucket(self, launcher_name):
+        return self.data.setdefault(launcher_name, {'phases': {}, 'counters': {}})
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self.lock:
+                phases = self.bucket(getattr(self.local, 'launcher', 'Diğer'))['phases']
+                entry = phases.setdefault(name, {'seconds': 0.0, 'count': 0})
+                entry['seconds'] += elapsed
+                entry['count'] += 1
+
+    def count(self, name, n=1):
+        with self.lock:
+            counters = self.bucket(getattr(self.local, 'launcher', 'Diğer'))['counters']
+            counters[name] = counters.get(name, 0) + n
+
+    def report(self):
+        with self.lock:
+            return {
+                launcher: {
+                    'phases': {k: {'seconds': round(v['seconds'], 4), 'count': v['count']} for k, v in b['phases'].items()},
+                    'counters': dict(b['counters'])
+                }
+                for launcher, b in self.data.items()
+            }
+
+#########################################
+# Oyun Kütüphanesi Veritabanı (SQLite, WAL)
+#########################################
+LIBRARY_DB_FILE = "library.db"
+# Oyun kaydında "metadata" tablosunda tutulan alanlar; geri kalanlar games.data (JSON) içinde saklanır.
+METADATA_FIELDS = ('giantbomb_info', 'image', 'image_attempted', 'info_attempted', 'next_request_time')
+GAME_COLUMNS = ('unique', 'name', 'launcher', 'path', 'source')
+# GiantBomb arama yanıtları api_cache tablosunda saklanır; süresi dolanlar koşullu istekle yenilenir.
+GIANTBOMB_SEARCH_URL = "https://www.giantbomb.com/api/search/"
+GIANTBOMB_CACHE_TTL = 30 * 24 * 3600      # Bulunan oyunlar için
+GIANTBOMB_MISS_TTL = 24 * 3600            # Sonuç çıkmayan aramalar için
+
+
+class LibraryStore:
+    """
+    Oyunları, manuel eklenen/düzenlenen oyunları ve GiantBomb/resim bilgilerini SQLite'ta saklar.
+    Tek bağlantı kilitle paylaşılır; yazmalar satır bazlı upsert olarak yapılır.
+    """
+
+    def __init__(self, path=LIBRARY_DB_FILE):
+        self.path = path
+        self.lock = threading.RLock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS games (
+                unique_key TEXT PRIMARY KEY,
+                name TEXT,
+                launcher TEXT,
+                path TEXT,
+                source TEXT,
+                position INTEGER,
+                data TEXT
+            );
+            CREATE INDEX IF NOT EXISTS games_launcher ON games(launcher);
+            CREATE INDEX IF NOT EXISTS games_name ON games(name COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS games_path ON games(path);
+            CREATE TABLE IF NOT EXISTS manual_games (
+                unique_key TEXT PRIMARY KEY,
+                position INTEGER,
+                data TEXT
+            );
+            CREATE TABLE IF NOT EXISTS metadata (
+                unique_key TEXT PRIMARY KEY,
+                giantbomb_info TEXT,
+                image TEXT,
+                image_attempted INTEGER,
+                info_attempted INTEGER,
+                next_request_time REAL,
+                updated_at REAL
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS api_cache (
+                cache_key TEXT PRIMARY KEY,
+                body TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL
+            );
+        """)
+
+    @contextlib.contextmanager
+    def transaction(self):
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def row_to_game(self, row):
+        game = json.loads(row['data']) if row['data'] else {}
+        for column in GAME_COLUMNS:
+            key = 'unique_key' if column == 'unique' else column
+            if row[key] is not None:
+                game[column] = row[key]
+        if 'giantbomb_info' in row.keys():
+            for field in METADATA_FIELDS:
+                value = row[field]
+                if value is not None:
+                    game[field] = bool(value) if field in ('image_attempted', 'info_attempted') else value
+        return game
+
+    def write_game(self, conn, game, position):
+        extra = {k: v for k, v in game.items() if k not in GAME_COLUMNS and k not in METADATA_FIELDS}
+        conn.execute(
+            "INSERT INTO games (unique_key, name, launcher, path, source, position, data) VALUES (?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(unique_key) DO UPDATE SET name=excluded.name, launcher=excluded.launcher, path=excluded.path, "
+            "source=excluded.source, position=excluded.position, data=excluded.data",
+            (game['unique'], game.get('name'), game.get('launcher'), game.get('path'), game.get('source'),
+             position, json.dumps(extra, ensure_ascii=False))
+        )
+        self.write_metadata(conn, game)
+
+    def write_metadata(self, conn, game):
+        # Sadece kayıtta bulunan alanlar güncellenir; diğer sütunlar olduğu gibi kalır.
+        fields = [f for f in METADATA_FIELDS if f in game]
+        if not fields:
+            return
+        columns = ", ".join(fields)
+        placeholders = ", ".join("?" for _ in fields)
+        updates = ", ".join(f"{f}=excluded.{f}" for f in fields)
+        conn.execute(
+            f"INSERT INTO metadata (unique_key, {columns}, updated_at) VALUES (?, {placeholders}, ?) "
+            f"ON CONFLICT(unique_key) DO UPDATE SET {updates}, updated_at=excluded.updated_at",
+            (game['unique'], *[game[f] for f in fields], time.time())
+        )
+
+    def load_games(self, hot_only=False):
+        """
+        Oyun listesini sırasıyla döndürür. hot_only=True ise sadece listeleme/arama için gereken alanlar
+        (games tablosu) okunur; açıklama ve resim bilgileri sonradan load_metadata ile yüklenir.
+        """
+        with self.lock:
+            if hot_only:
+                rows = self.conn.execute("SELECT * FROM games ORDER BY position").fetchall()
+            else:
+                rows = self.conn.execute(
+                    "SELECT g.*, m.giantbomb_info, m.image, m.image_attempted, m.info_attempted, m.next_request_time "
+                    "FROM games g LEFT JOIN metadata m ON m.unique_key = g.unique_key ORDER BY g.position"
+                ).fetchall()
+        return [self.row_to_game(row) for row in rows]
+
+    def metadata_row_to_dict(self, row):
+        result = {}
+        for field in row.keys():
+            value = row[field]
+            if field in METADATA_FIELDS and value is not None:
+                result[field] = bool(value) if field in ('image_attempted', 'info_attempted') else value
+        return result
+
+    def load_metadata(self, unique):
+        """Tek oyunun açıklama/resim bilgilerini döndürür (kayıt yoksa boş sözlük)."""
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM metadata WHERE unique_key = ?", (unique,)).fetchone()
+        return self.metadata_row_to_dict(row) if row else {}
+
+    def load_metadata_fields(self, fields):
+        """Tüm oyunlar için sadece istenen (küçük) metadata alanlarını unique -> {alan: değer} olarak döndürür."""
+        fields = [f for f in fields if f in METADATA_FIELDS]
+        with self.lock:
+            rows = self.conn.execute(f"SELECT unique_key, {', '.join(fields)} FROM metadata").fetchall()
+        return {row['unique_key']: self.metadata_row_to_dict(row) for row in rows}
+
+    def replace_games(self, games):
+        """Oyun listesini tek transaction'da yazar; listede olmayan oyunlar ve bilgileri silinir."""
+        with self.transaction() as conn:
+            keys = [g['unique'] for g in games]
+            conn.execute("CREATE TEMP TABLE IF NOT EXISTS keep_keys (unique_key TEXT PRIMARY KEY)")
+            conn.execute("DELETE FROM keep_keys")
+            conn.executemany("INSERT OR IGNORE INTO keep_keys VALUES (?)", [(k,) for k in keys])
+            conn.execute("DELETE FROM games WHERE unique_key NOT IN (SELECT unique_key FROM keep_keys)")
+            conn.execute("DELETE FROM metadata WHERE unique_key NOT IN (SELECT unique_key FROM keep_keys)")
+            for position, game in enumerate(games):
+                self.write_game(conn, game, position)
+
+    def upsert_game(self, game, position=None):
+        with self.transaction() as conn:
+            if position is None:
+                row = conn.execute("SELECT position FROM games WHERE unique_key = ?", (game['unique'],)).fetchone()
+                if row is not None:
+                    position = row['position']
+                else:
+                    position = conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM games").fetchone()[0]
+            self.write_game(conn, game, position)
+
+    def upsert_metadata(self, game):
+        with self.transaction() as conn:
+            self.write_metadata(conn, game)
+
+    def delete_game(self, unique):
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM games WHERE unique_key = ?", (unique,))
+            conn.execute("DELETE FROM metadata WHERE unique_key = ?", (unique,))
+            conn.execute("DELETE FROM manual_games WHERE unique_key = ?", (unique,))
+
+    def load_manual_games(self):
+        with self.lock:
+            rows = self.conn.execute("SELECT data FROM manual_games ORDER BY position").fetchall()
+        return [json.loads(row['data']) for row in rows]
+
+    def replace_manual_games(self, manual_games):
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM manual_games")
+            conn.executemany(
+                "INSERT OR REPLACE INTO manual_games (unique_key, position, data) VALUES (?, ?, ?)",
+                [(g['unique'], i, json.dumps(g, ensure_ascii=False)) for i, g in enumerate(manual_games) if 'unique' in g]
+            )
+
+    def get_meta(self, key, default=None):
+        with self.lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else default
+
+    def set_meta(self, key, value):
+        with self.transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def get_api_cache(self, key):
+        """Önbellekteki API yanıtını {'body', 'etag', 'last_modified', 'fetched_at'} olarak döndürür (yoksa None)."""
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM api_cache WHERE cache_key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        return {'body': json.loads(row['body']), 'etag': row['etag'], 'last_modified': row['last_modified'],
+                'fetched_at': row['fetched_at']}
+
+    def put_api_cache(self, key, body, etag=None, last_modified=None):
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO api_cache (cache_key, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (key, json.dumps(body, ensure_ascii=False), etag, last_modified, time.time())
+            )
+
+    def touch_api_cache(self, key):
+        # Sunucu "değişmedi" (304) dediğinde kayıt tazelenmiş sayılır.
+        with self.transaction() as conn:
+            conn.execute("UPDATE api_cache SET fetched_at = ? WHERE cache_key = ?", (time.time(), key))
+
+    def migrate_from_json(self, scan_results_file="scan_results.json", manual_games_file="manual_games.json"):
+        """Eski JSON dosyalarını bir kereye mahsus veritabanına aktarır. Eski dosyalar silinmez."""
+        if self.get_meta('json_migrated'):
+            return False
+        for filename, loader in ((scan_results_file, self.replace_games), (manual_games_file, self.replace_manual_games)):
+            try:
+                with open(filename, "r", encoding="utf-8") as f:
+                    records = [g for g in json.load(f) if isinstance(g, dict) and 'unique' in g]
+                loader(records)
+                print(f"{filename} veritabanına aktarıldı ({len(records)} kayıt).")
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"{filename} aktarılırken hata:", e)
+        self.set_meta('json_migrated', str(time.time()))
+        return True
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+#########################################
+# Kalıcı Kayıt Servisi: Birleştirilmiş (write-behind) ve atomik yazma
+#########################################
+def atomic_write_json(path, data, compact=True):
+    """
+    JSON'u önce aynı klasördeki geçici dosyaya yazar, sonra hedefin üzerine taşır (os.replace).
+    Yazma yarıda kesilirse eski dosya bozulmadan kalır. compact=False ise okunabilir (girintili) yazılır.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            if compact:
+                json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+            else:
+                json.dump(data, f, indent=4, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        for attempt in range(5):
+            try:
+                os.replace(tmp_path, path)
+                break
+            except PermissionError:
+                # Windows'ta hedef dosya başka bir süreç tarafından kısa süreliğine açık olabilir.
+                if attempt == 4:
+                    raise
+                time.sleep(0.05 * (attempt + 1))
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class PersistenceService:
+    """
+    Kayıt isteklerini hemen yazmak yerine ilgili kaydı "kirli" olarak işaretler; debounce süresi dolunca
+    ya da çıkışta tek seferde yazar. Arka arkaya gelen kayıt istekleri tek yazmaya indirgenir.
+    """
+
+    def __init__(self, debounce=1.0):
+        self.debounce = debounce
+        self.stores = {}  # isim -> yazma fonksiyonu
+        self.dirty = set()
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.closed = False
+        self.stats = {'saves': 0, 'coalesced': 0, 'flushes': 0, 'errors': 0}
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def register(self, name, flush_fn):
+        self.stores[name] = flush_fn
+
+    def register_json(self, name, path, snapshot_fn, compact=True):
+        self.register(name, lambda: atomic_write_json(path, snapshot_fn(), compact=compact))
+
+    def mark_dirty(self, name):
+        with self.lock:
+            self.stats['saves'] += 1
+            if name in self.dirty:
+                self.stats['coalesced'] += 1
+            self.dirty.add(name)
+        if self.closed:
+            self.flush()
+        else:
+            self.wakeup.set()
+
+    def run(self):
+        while not self.closed:
+            self.wakeup.wait()
+            # İlk istekten sonra debounce kadar bekleyip bu sürede gelen istekleri birlikte yazıyoruz.
+            time.sleep(self.debounce)
+            self.wakeup.clear()
+            self.flush()
+
+    def flush(self, name=None):
+        with self.flush_lock:
+            with self.lock:
+                names = [name] if name is not None else list(self.dirty)
+                names = [n for n in names if n in self.dirty]
+                self.dirty.difference_update(names)
+            for store_name in names:
+                try:
+                    self.stores[store_name]()
+                    with self.lock:
+                        self.stats['flushes'] += 1
+                except Exception as e:
+                    with self.lock:
+                        self.stats['errors'] += 1
+                    print(f"{store_name} kaydedilirken hata:", e)
+
+    def close(self):
+        """Bekleyen tüm kayıtları hemen yazar; sonraki kayıt istekleri senkron yazılır."""
+        self.closed = True
+        self.wakeup.set()
+        self.flush()
+
+#########################################
+# Açılış süresi ölçümü ayarları
+#########################################
+STARTUP_METRICS_FILE = "startup_metrics.json"
+STARTUP_METRICS_HISTORY = 50        # Saklanacak son açılış sayısı
+STARTUP_REGRESSION_FACTOR = 1.5     # İlk çizim, önceki medyanın bu katını aşarsa uyarı verilir
+
+#########################################
+# Oyun Kütüphanesi Modeli: İndeksli kayıtlar ve değişiklik olayları
+#########################################
+def normalize_game_name(name):
+    """Arama/eşleştirme için ismi sadeleştirir: küçük harf, sadece harf/rakam, tek boşluk."""
+    cleaned = ''.join(ch if ch.isalnum() else ' ' for ch in (name or '').casefold())
+    return ' '.join(cleaned.split())
+
+
+def natural_sort_key(text):
+    """
+    Harf duyarsız ve içindeki sayıları sayı olarak karşılaştıran sıralama anahtarı ("Halo 2" < "Halo 10").
+    Süreç LC_ALL=C ile çalıştığı için yerel ayara göre harf sıralaması yapılmaz; harfler casefold sonrası
+    kod noktasına göre sıralanır.
+    """
+    parts = re.split(r'(\d+)', (text or '').casefold())
+    return tuple(int(part) if i % 2 else part for i, part in enumerate(parts))
+
+
+# Taramada bulunmayan, kullanıcıya ait oynama bilgileri (yeniden taramalarda korunur)
+PLAY_STAT_FIELDS = ('launch_time', 'play_count')
+
+# Sütun -> oyundan sıralama anahtarı üreten fonksiyon (GameLibrary.sort_key ile önbelleklenir)
+SORT_KEY_FUNCTIONS = {
+    'Name': lambda game: natural_sort_key(game.get('name', '')),
+    'Launcher': lambda game: natural_sort_key(game.get('launcher', '')),
+    'Path': lambda game: (game.get('path') or '').casefold(),
+    'Size': lambda game: game.get('size_on_disk') or 0,
+    'LastPlayed': lambda game: game.get('launch_time') or 0,
+    'PlayCount': lambda game: game.get('play_count') or 0,
+}
+
+
+class GameLibrary:
+    """
+    Tüm oyun kayıtlarının sahibi. unique anahtar, launcher, exe adı ve normalize isim için O(1) indeksler tutar.
+    Her değişiklik abonelere callback(event, game, old_unique, reason) olarak bildirilir;
+    event: 'add', 'update', 'remove' ya da 'reset' (tüm liste değişti, game=None).
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.records = {}       # unique -> oyun (ekleme sırasını korur)
+        self.by_launcher = {}   # launcher -> {unique: oyun}
+        self.by_exe = {}        # exe adı (küçük harf) -> {unique}
+        self.by_name = {}       # normalize isim -> {unique}
+        self.sort_keys = {}     # unique -> {sütun: sıralama anahtarı}; kayıt değişince silinir
+        self.listeners = []
+
+    def subscribe(self, callback):
+        self.listeners.append(callback)
+
+    def emit(self, event, game=None, old_unique=None, reason=None):
+        for callback in list(self.listeners):
+            try:
+                callback(event, game, old_unique, reason)
+            except Exception as e:
+                print(f"Kütüphane olayı ({event}) işlenirken hata:", e)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.snapshot())
+
+    def __contains__(self, unique):
+        return unique in self.records
+
+    def snapshot(self):
+        with self.lock:
+            return list(self.records.values())
+
+    def keys(self):
+        with self.lock:
+            return set(self.records)
+
+    def get(self, unique):
+        return self.records.get(unique)
+
+    def games_by_launcher(self, launcher_name):
+        with self.lock:
+            return list(self.by_launcher.get(launcher_name, {}).values())
+
+    def find_by_exe(self, exe_name):
+        with self.lock:
+            return [self.records[u] for u in self.by_exe.get(exe_name.lower(), ())]
+
+    def find_by_name(self, name):
+        with self.lock:
+            return [self.records[u] for u in self.by_name.get(normalize_game_name(name), ())]
+
+    def sort_key(self, game, column):
+        """Sütunun sıralama anahtarını kayıt başına bir kez hesaplayıp saklar."""
+        keys = self.sort_keys.setdefault(game['unique'], {})
+        if column not in keys:
+            keys[column] = SORT_KEY_FUNCTIONS[column](game)
+        return keys[column]
+
+    def sorted_games(self, games, column, descending=False, group_by_launcher=False):
+        """Oyunları önbellekteki anahtarlarla tek seferde sıralar (isteğe bağlı launcher gruplamasıyla)."""
+        for name in (column, 'Launcher' if group_by_launcher else None):
+            if name is None:
+                continue
+            keys = [self.sort_key(game, name) for game in games]
+            order = sorted(range(len(games)), key=keys.__getitem__, reverse=descending and name == column)
+            games = [games[i] for i in order]
+        return games
+
+    def index(self, game):
+        unique = game['unique']
+        self.by_launcher.setdefault(game.get('launcher', ''), {})[unique] = game
+        self.by_exe.setdefault(os.path.basename(game.get('path', '')).lower(), set()).add(unique)
+        self.by_name.setdefault(normalize_game_name(game.get('name', '')), set()).add(unique)
+
+    def unindex(self, game):
+        unique = game['unique']
+        self.sort_keys.pop(unique, None)
+        for table, key in ((self.by_exe, os.path.basename(game.get('path', '')).lower()),
+                           (self.by_name, normalize_game_name(game.get('name', '')))):
+            keys = table.get(key)
+            if keys is not None:
+                keys.discard(unique)
+                if not keys:
+                    del table[key]
+        launcher_games = self.by_launcher.get(game.get('launcher', ''))
+        if launcher_games is not None:
+            launcher_games.pop(unique, None)
+            if not launcher_games:
+                del self.by_launcher[game.get('launcher', '')]
+
+    def add(self, game, reason=None):
+        existing = self.records.get(game['unique'])
+        if existing is not None:
+            return self.update(game['unique'], {k: v for k, v in game.items() if existing.get(k) != v}, reason=reason)
+        with self.lock:
+            self.records[game['unique']] = game
+            self.index(game)
+        self.emit('add', game, reason=reason)
+        return game
+
+    def update(self, unique, changes, reason=None):
+        """Kayıttaki alanları değiştirir; 'unique' değişirse kayıt yeni anahtarla listenin sonuna taşınır."""
+        with self.lock:
+            game = self.records.get(unique)
+            if game is None:
+                return None
+            self.unindex(game)
+            game.update(changes)
+            if game['unique'] != unique:
+                del self.records[unique]
+                self.records[game['unique']] = game
+            self.index(game)
+        self.emit('update', game, old_unique=unique, reason=reason)
+        return game
+
+    def remove(self, unique, reason=None):
+        with self.lock:
+            game = self.records.pop(unique, None)
+            if game is not None:
+                self.unindex(game)
+        if game is not None:
+            self.emit('remove', game, old_unique=unique, reason=reason)
+        return game
+
+    def replace_all(self, games, reason=None):
+        with self.lock:
+            self.records = {}
+            self.by_launcher, self.by_exe, self.by_name = {}, {}, {}
+            self.sort_keys = {}
+            for game in games:
+                if game['unique'] in self.records:
+                    self.unindex(self.records[game['unique']])
+                self.records[game['unique']] = game
+                self.index(game)
+        self.emit('reset', reason=reason)
+
+#########################################
+# Oyun Arama Motoru: Trigram/kelime-başı indeksi ve sıralama
+#########################################
+SEARCH_DEBOUNCE_MS = 120   # Tuş vuruşlarından sonra aramanın çalışması için beklenecek süre
+SEARCH_FUZZY_MIN = 0.5     # Bulanık eşleşme için sorgu trigramlarının en az bu oranı ortak olmalı
+
+
+def name_trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def prefix_edit_distance(query, text, limit):
+    """
+    query ile text'in herhangi bir başlangıç parçası arasındaki en küçük Damerau-Levenshtein (yer değiştirme
+    dahil) mesafesi. limit'i aşan mesafeler için limit + 1 döndürür.
+    """
+    n = len(query)
+    text = text[:n + limit]
+    previous2 = None
+    previous = list(range(n + 1))
+    best = previous[n]
+    for j in range(1, len(text) + 1):
+        current = [j] + [0] * n
+        ch = text[j - 1]
+        for i in range(1, n + 1):
+            cost = 0 if query[i - 1] == ch else 1
+            value = min(previous[i] + 1, current[i - 1] + 1, previous[i - 1] + cost)
+            if previous2 is not None and i > 1 and query[i - 1] == text[j - 2] and query[i - 2] == ch:
+                value = min(value, previous2[i - 2] + 1)
+            current[i] = value
+        best = min(best, current[n])
+        if min(current) > limit:
+            break
+        previous2, previous = previous, current
+    return best if best <= limit else limit + 1
+
+
+class GameSearchIndex:
+    """
+    Kütüphane olaylarıyla artımlı güncellenen arama indeksi. Sonuçlar şu sırayla önceliklendirilir:
+    isim başı > kelime başı > isim içinde > bulanık (yazım hatası toleranslı: trigram benzerliği ya da
+    bir kelimenin başına göre Damerau-Levenshtein mesafesi; 'hlao' gibi yer değiştirmeler de bulunur).
+    """
+
+    def __init__(self, library):
+        self.library = library
+        self.names = {}       # unique -> normalize isim
+        self.trigrams = {}    # trigram -> {unique}
+        self.prefixes = {}    # kelimelerin ilk 1-2 harfi -> {unique} (kısa sorgular için)
+        self.dirty = True
+        self.stats = {'queries': 0, 'last_ms': 0.0, 'last_candidates': 0}
+        library.subscribe(self.on_library_event)
+
+    def on_library_event(self, event, game, old_unique, reason):
+        if event == 'reset':
+            # Toplu değişiklikte indeks ilk aramada yeniden kurulur.
+            self.dirty = True
+            return
+        if self.dirty:
+            return
+        if old_unique is not None:
+            self.remove(old_unique)
+        if event != 'remove':
+            self.add(game)
+
+    def add(self, game):
+        unique = game['unique']
+        name = normalize_game_name(game.get('name', ''))
+        self.names[unique] = name
+        for gram in name_trigrams(name):
+            self.trigrams.setdefault(gram, set()).add(unique)
+        for word in name.split():
+            for length in (1, 2):
+                self.prefixes.setdefault(word[:length], set()).add(unique)
+
+    def remove(self, unique):
+        name = self.names.pop(unique, None)
+        if name is None:
+            return
+        for gram in name_trigrams(name):
+            bucket = self.trigrams.get(gram)
+            if bucket is not None:
+                bucket.discard(unique)
+                if not bucket:
+                    del self.trigrams[gram]
+        for word in name.split():
+            for length in (1, 2):
+                bucket = self.prefixes.get(word[:length])
+                if bucket is not None:
+                    bucket.discard(unique)
+                    if not bucket:
+                        del self.prefixes[word[:length]]
+
+    def rebuild(self):
+        self.names, self.trigrams, self.prefixes = {}, {}, {}
+        for game in self.library.snapshot():
+            self.add(game)
+        self.dirty = False
+
+    def candidates(self, query, grams):
+        if len(query) < 3:
+            # Kısa sorgularda trigram yok; isim içindeki eşleşmeler ('lo' -> Halo) için isimler taranır.
+            return {unique for unique, name in self.names.items() if query in name}
+        # Sorgunun iç trigramlarının hepsini içerenler alt dize adaylarıdır.
+        inner = [query[i:i + 3] for i in range(len(query) - 2)]
+        buckets = sorted((self.trigrams.get(gram, set()) for gram in inner), key=len)
+        exact = set(buckets[0]).intersection(*buckets[1:]) if buckets else set()
+        # Ortak trigram sayısı yeterli olanlar bulanık adaylardır.
+        counts = {}
+        for gram in grams:
+            for unique in self.trigrams.get(gram, ()):
+                counts[unique] = counts.get(unique, 0) + 1
+        needed = max(1, math.ceil(len(grams) * SEARCH_FUZZY_MIN))
+        exact.update(u for u, c in counts.items() if c >= needed)
+        # İlk iki harfi yer değiştirmiş ya da ikinci harfi fazla yazılmış sorgular için kelime başı adayları.
+        for key in {query[:2], query[1] + query[0], query[0] + query[2]}:
+            exact.update(self.prefixes.get(key, ()))
+        return exact
+
+    def edit_similarity(self, query, name, distances):
+        """Sorguya en yakın kelime başına göre benzerlik (1 - mesafe / uzunluk); yeterince yakın değilse None."""
+        limit = 1 if len(query) <= 4 else 2
+        best = limit + 1
+        first = query[:2]  # Adaylar da ilk iki harften biriyle başlayan kelimelerden gelir
+        start = 0
+        while start != -1:
+            if name[start:start + 1] in first:
+                window = name[start:start + len(query) + limit]
+                distance = distances.get(window)
+                if distance is None:
+                    distance = distances[window] = prefix_edit_distance(query, window, limit)
+                best = min(best, distance)
+            start = name.find(' ', start)
+            start = start if start == -1 else start + 1
+        return 1 - best / len(query) if best <= limit else None
+
+    def rank(self, query, grams, name, distances):
+        """(öncelik, benzerlik) döndürür; eşleşme yoksa None. distances, arama boyunca paylaşılan mesafe önbelleğidir."""
+        if name.startswith(query):
+            return 0, 1.0
+        position = name.find(query)
+        if position > 0:
+            return (1, 1.0) if name[position - 1] == ' ' else (2, 1.0)
+        if len(query) < 3:
+            return None
+        similarity = len(grams & name_trigrams(name)) / len(grams)
+        if similarity >= SEARCH_FUZZY_MIN:
+            return 3, similarity
+        similarity = self.edit_similarity(query, name, distances)
+        if similarity is not None:
+            return 3, similarity
+        return None
+
+    def search(self, text):
+        """Sorguya uyan oyunları en iyi eşleşme başta olacak şekilde döndürür."""
+        started = time.perf_counter()
+        if self.dirty:
+            self.rebuild()
+        query = normalize_game_name(text)
+        if not query:
+            return self.library.snapshot()
+        grams = name_trigrams(query)
+        candidates = self.candidates(query, grams)
+        names = self.names
+        ranked = []
+        distances = {}  # Aynı kelime başları tekrar tekrar hesaplanmasın
+        for unique in candidates:
+            name = names.get(unique, '')
+            rank = self.rank(query, grams, name, distances)
+            if rank is not None:
+                ranked.append((rank[0], -rank[1], len(name), name, unique))
+        ranked.sort()
+        records = self.library.records
+        results = [records[r[-1]] for r in ranked if r[-1] in records]
+        self.stats['queries'] += 1
+        self.stats['last_candidates'] = len(candidates)
+        self.stats['last_ms'] = round((time.perf_counter() - started) * 1000, 3)
+        return results
+
+
+def benchmark_search(sizes=(10000, 100000), queries=("h", "lo", "ha", "hal", "halo", "halo i", "hlao")):
+    """Sentetik kütüphanelerde tuş vuruşu başına arama süresini ölçüp yazdırır."""
+    words = ["halo", "forza", "witcher", "dark", "souls", "legend", "quest", "space", "racing", "city",
+             "empire", "war", "star", "dragon", "night", "hunter", "knight", "shadow", "craft", "simulator"]
+    for size in sizes:
+        library = GameLibrary()
+        library.replace_all([
+            {'unique': f"bench_{i}", 'name': f"{words[i % 20]} {words[(i // 20) % 20]} {words[(i // 400) % 20]} {i}",
+             'launcher': 'Diğer', 'path': f"game_{i}.exe"}
+            for i in range(size)
+        ])
+        index = GameSearchIndex(library)
+        started = time.perf_counter()
+        index.rebuild()
+        print(f"{size} oyun: indeks kurulumu {(time.perf_counter() - started) * 1000:.1f} ms")
+        for query in queries:
+            results = index.search(query)
+            print(f"  '{query}': {index.stats['last_ms']:.2f} ms, {len(results)} sonuç")
+
+#########################################
+# Sanal Oyun Listesi: Sadece görünen satırları Treeview'e koyar
+#########################################
+VIRTUAL_OVERSCAN = 10   # Pencere büyütülünce boşluk görünmesin diye görünen alanın altına eklenen satır
+# Liste sütunları: (sütun, başlık, varsayılan olarak görünür mü)
+LIST_COLUMNS = (
+    ('Name', 'Oyun Adı', True),
+    ('Launcher', 'Launcher', True),
+    ('Path', 'Yol', True),
+    ('Size', 'Boyut', False),
+    ('LastPlayed', 'Son Oynama', False),
+    ('PlayCount', 'Oynama Sayısı', False),
+)
+RECONCILE_CHUNK = 2000  # Tarama sonrası liste farkı uygulanırken bir Tk turunda işlenecek en fazla değişiklik
+
+
+def longest_increasing_indices(sequence):
+    """Dizinin en uzun artan alt dizisindeki elemanların indekslerini döndürür (yerinde kalacak satırlar)."""
+    tails, tail_indices, previous = [], [], [None] * len(sequence)
+    for i, value in enumerate(sequence):
+        pos = bisect.bisect_left(tails, value)
+        if pos == len(tails):
+            tails.append(value)
+            tail_indices.append(i)
+        else:
+            tails[pos] = value
+            tail_indices[pos] = i
+        previous[i] = tail_indices[pos - 1] if pos else None
+    result = set()
+    i = tail_indices[-1] if tail_indices else None
+    while i is not None:
+        result.add(i)
+        i = previous[i]
+    return result
+
+
+class VirtualGameList:
+    """
+    Oyun listesini Python tarafında tutup Treeview'de sadece görünen satırları (artı biraz fazlasını)
+    gösterir. Kaydırma kendi kaydırma çubuğumuzla, seçim ise unique üzerinden yapılır; böylece
+    100k oyunda da Tk'ya düşen satır sayısı pencere yüksekliği kadar kalır.
+    """
+
+    def __init__(self, parent, columns, headings, row_values, on_select, overscan=VIRTUAL_OVERSCAN, on_viewport=None):
+        self.frame = ttk.Frame(parent)
+        self.tree = ttk.Treeview(self.frame, columns=columns, show='headings', selectmode='browse')
+        for column, text in zip(columns, headings):
+            self.tree.heading(column, text=text)
+        self.scrollbar = ttk.Scrollbar(self.frame, orient='vertical', command=self.on_scrollbar)
+        self.scrollbar.pack(side='right', fill='y')
+        self.tree.pack(side='left', fill='both', expand=True)
+        self.row_values = row_values
+        self.on_select = on_select
+        self.on_viewport = on_viewport   # Ekrandaki satırlar değişince unique listesiyle çağrılır
+        self.overscan = overscan
+        self.rows = []          # Gösterilecek oyunlar (sıralı)
+        self.positions = None   # unique -> satır indeksi (gerektiğinde yeniden hesaplanır)
+        self.offset = 0         # Görünen ilk satırın indeksi
+        self.selected = None    # Seçili oyunun unique'i
+        self.reconcile_job = None   # Yarım kalan fark uygulaması (generator)
+        self.reconcile_after_id = None
+        self.reconcile_stats = {'inserts': 0, 'deletes': 0, 'moves': 0, 'updates': 0, 'ticks': 0, 'last_ms': 0.0}
+        self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+        self.tree.bind("<Configure>", lambda e: self.render())
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-3 if e.delta > 0 else 3))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(3))
+        self.tree.bind("<Up>", lambda e: self.move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self.move_selection(1))
+        self.tree.bind("<Prior>", lambda e: self.move_selection(-self.page_size()))
+        self.tree.bind("<Next>", lambda e: self.move_selection(self.page_size()))
+        self.tree.bind("<Home>", lambda e: self.move_selection(-len(self.rows)))
+        self.tree.bind("<End>", lambda e: self.move_selection(len(self.rows)))
+
+    def __len__(self):
+        return len(self.rows)
+
+    def index_of(self, unique):
+        if self.positions is None:
+            self.positions = {game['unique']: i for i, game in enumerate(self.rows)}
+        return self.positions.get(unique)
+
+    def page_size(self):
+        try:
+            row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        except (TclError, ValueError):
+            row_height = 20
+        # Başlık satırı için bir satırlık yer düşüyoruz.
+        return max(1, self.tree.winfo_height() // row_height - 1)
+
+    #########################################
+    # Model İşlemleri
+    #########################################
+    def set_rows(self, games, scroll_to_top=False):
+        """Listeyi tek seferde değiştirir (arama sonuçları için); seçim korunur."""
+        self.finish_reconcile()
+        self.rows = list(games)
+        self.positions = None
+        if scroll_to_top:
+            self.offset = 0
+        self.render()
+
+    #########################################
+    # Fark Uygulama (Tarama Sonrası)
+    #########################################
+    def reconcile(self, games, chunk=RECONCILE_CHUNK):
+        """
+        Mevcut satırları yeni listeye sadece gereken silme/ekleme/taşıma/güncellemelerle getirir.
+        İşler parça parça Tk turlarına yayılır; seçim ve görünen ilk satır korunur.
+        """
+        self.cancel_reconcile()
+        self.reconcile_job = self.reconcile_steps(list(games), chunk)
+        self.reconcile_tick()
+
+    def reconcile_steps(self, target, chunk):
+        started = time.perf_counter()
+        target_keys = {game['unique']: i for i, game in enumerate(target)}
+        # Kalan satırların yeni listedeki sıraları; en uzun artan kısım yerinde kalır, gerisi taşınır.
+        kept = [(i, target_keys[game['unique']]) for i, game in enumerate(self.rows) if game['unique'] in target_keys]
+        stable = {kept[i][1] for i in longest_increasing_indices([k[1] for k in kept])}
+        removals = [i for i, game in enumerate(self.rows) if target_keys.get(game['unique']) not in stable]
+        moves = len(kept) - len(stable)
+        stats = self.reconcile_stats
+        stats.update(deletes=len(removals) - moves, moves=moves, inserts=len(target) - len(kept), updates=0, ticks=0)
+
+        # 1) Silinen ve taşınacak satırlar sondan başa çıkarılır.
+        for n, index in enumerate(reversed(removals), 1):
+            del self.rows[index]
+            if n % chunk == 0:
+                yield
+        # 2) Yeni ve taşınan satırlar hedef konumlarına eklenir, kalanların verisi güncellenir.
+        work = 0
+        for i, game in enumerate(target):
+            if i in stable:
+                if self.rows[i] is not game:
+                    if self.row_values(self.rows[i]) != self.row_values(game):
+                        stats['updates'] += 1
+                    self.rows[i] = game
+                work += 1
+            else:
+                self.rows.insert(i, game)
+                work += 10
+            if work >= chunk * 10:
+                work = 0
+                yield
+        stats['last_ms'] = round((time.perf_counter() - started) * 1000, 3)
+
+    def reconcile_tick(self):
+        self.reconcile_after_id = None
+        anchor = self.rows[self.offset]['unique'] if self.offset < len(self.rows) else None
+        try:
+            next(self.reconcile_job)
+            finished = False
+        except StopIteration:
+            finished = True
+        self.reconcile_stats['ticks'] += 1
+        self.positions = None
+        # Kaydırma konumu indekse değil, görünen ilk oyuna bağlı kalsın.
+        anchor_index = self.index_of(anchor) if anchor is not None else None
+        if anchor_index is not None:
+            self.offset = anchor_index
+        if finished:
+            self.reconcile_job = None
+        else:
+            self.reconcile_after_id = self.tree.after(1, self.reconcile_tick)
+        self.render()
+
+    def cancel_reconcile(self):
+        if self.reconcile_after_id is not None:
+            self.tree.after_cancel(self.reconcile_after_id)
+            self.reconcile_after_id = None
+        self.reconcile_job = None
+
+    def finish_reconcile(self):
+        """Yarım kalmış fark uygulamasını hemen bitirir (tek satırlık değişikliklerden önce)."""
+        if self.reconcile_job is None:
+            return
+        if self.reconcile_after_id is not None:
+            self.tree.after_cancel(self.reconcile_after_id)
+            self.reconcile_after_id = None
+        for _ in self.reconcile_job:
+            pass
+        self.reconcile_job = None
+        self.positions = None
+
+    def insert(self, game, index=None):
+        self.finish_reconcile()
+        if index is None:
+            self.rows.append(game)
+            if self.positions is not None:
+                self.positions[game['unique']] = len(self.rows) - 1
+        else:
+            self.rows.insert(index, game)
+            self.positions = None
+        self.render()
+
+    def update(self, game):
+        self.finish_reconcile()
+        index = self.index_of(game['unique'])
+        if index is None:
+            return False
+        self.rows[index] = game
+        if self.tree.exists(game['unique']):
+            self.tree.item(game['unique'], values=self.row_values(game))
+        return True
+
+    def remove(self, unique):
+        self.finish_reconcile()
+        index = self.index_of(unique)
+        if index is None:
+            return
+        del self.rows[index]
+        self.positions = None
+        if self.selected == unique:
+            self.selected = None
+        self.render()
+
+    def selected_unique(self):
+        index = self.index_of(self.selected) if self.selected is not None else None
+        if index is not None and not self.rows[index].get('is_group'):
+            return self.selected
+        return None
+
+    def select(self, unique):
+        index = self.index_of(unique)
+        if index is None:
+            return
+        self.selected = unique
+        self.ensure_visible(index)
+        self.render()
+
+    #########################################
+    # Çizim ve Kaydırma
+    #########################################
+    def render(self):
+        page = self.page_size()
+        self.offset = max(0, min(self.offset, len(self.rows) - page))
+        window = self.rows[self.offset:self.offset + page + self.overscan]
+        wanted = [game['unique'] for game in window]
+        if list(self.tree.get_children()) == wanted:
+            for game in window:
+                self.tree.item(game['unique'], values=self.row_values(game))
+        else:
+            self.tree.delete(*self.tree.get_children())
+            for game in window:
+                self.tree.insert('', 'end', iid=game['unique'], values=self.row_values(game))
+            if self.on_viewport:
+                self.on_viewport(wanted)
+        if self.selected in wanted:
+            if self.tree.selection() != (self.selected,):
+                self.tree.selection_set(self.selected)
+        elif self.tree.selection():
+            self.tree.selection_set(())
+        self.tree.yview_moveto(0)
+        total = max(1, len(self.rows))
+        self.scrollbar.set(self.offset / total, min(1.0, (self.offset + page) / total))
+
+    def scroll(self, amount):
+        self.offset += amount
+        self.render()
+        return "break"
+
+    def on_scrollbar(self, action, amount, what=None):
+        if action == 'moveto':
+            self.offset = int(float(amount) * len(self.rows))
+        elif what == 'pages':
+            self.offset += int(amount) * self.page_size()
+        else:
+            self.offset += int(amount)
+        self.render()
+
+    def ensure_visible(self, index):
+        page = self.page_size()
+        if index < self.offset:
+            self.offset = index
+        elif index >= self.offset + page:
+            self.offset = index - page + 1
+
+    def move_selection(self, step):
+        if not self.rows:
+            return "break"
+        current = self.index_of(self.selected) if self.selected is not None else None
+        index = self.offset if current is None else max(0, min(len(self.rows) - 1, current + step))
+        self.select(self.rows[index]['unique'])
+        self.on_select(self.rows[index])
+        return "break"
+
+    def on_tree_select(self, event):
+        # Treeview olayı kuyruktan geldiği için kendi yaptığımız selection_set de buraya düşer;
+        # sadece seçim gerçekten değiştiyse bildiriyoruz.
+        selection = self.tree.selection()
+        if not selection or selection[0] == self.selected:
+            return
+        self.selected = selection[0]
+        index = self.index_of(self.selected)
+        if index is not None:
+            self.on_select(self.rows[index])
+
+
+#########################################
+# Önizleme Hattı: Arka planda çözme/küçültme ve hazır resim LRU'su
+#########################################
+PREVIEW_SIZE = (400, 300)
+PREVIEW_CACHE_SIZE = 64   # Bellekte tutulacak hazır önizleme resmi sayısı
+THUMBNAIL_FOLDER = os.path.join("image_cache", "thumbs")   # Önizleme boyutuna küçültülmüş kopyalar
+PREVIEW_HTTP_TIMEOUT = 3  # sn; önizleme için uzak resimler tekrar denenmez, kullanıcı beklemesin
+
+
+def thumbnail_path(image_path, folder=THUMBNAIL_FOLDER):
+    """
+    Resmin küçük kopyasının yolu (tam yolun özeti); kapak deposu da blob silerken bunu kullanır. Kopya,
+    saydamlık içeren kaynaklar için PNG, diğerleri için JPEG olarak yazıldığından uzantı verilmez.
+    """
+    digest = hashlib.sha1(os.path.abspath(image_path).encode('utf-8')).hexdigest()
+    return os.path.join(folder, f"{digest}.thumb")
+
+
+class PreviewPipeline:
+    """
+    Önizleme resimlerini arka planda indirip/çözüp küçültür; sonuç Tk thread'inde PhotoImage'a çevrilip
+    LRU'ya konur. Yerel dosyalar ve http adresleri ayrı thread'lerde işlenir, böylece yavaş bir indirme
+    diskteki resmin önizlemesini bekletmez. Seçim değişince eski istekler iptal sayılır (sadece en son
+    istek çizilir).
+    """
+
+    def __init__(self, schedule, http, size=PREVIEW_SIZE, cache_size=PREVIEW_CACHE_SIZE, thumb_folder=THUMBNAIL_FOLDER):
+        self.schedule = schedule        # Tk thread'inde çalıştırma (root.after(0, fn))
+        self.http = http
+        self.size = size
+        self.thumb_folder = thumb_folder
+        self.cache_size = cache_size
+        self.cache = collections.OrderedDict()   # (yol, mtime) -> PhotoImage
+        self.queues = {'local': queue.Queue(), 'remote': queue.Queue()}
+        self.generation = 0
+        self.threads = {}
+        self.stats = {'hits': 0, 'misses': 0, 'cancelled': 0, 'errors': 0, 'thumb_hits': 0, 'thumb_builds': 0,
+                      'last_latency_ms': 0.0, 'avg_latency_ms': 0.0, 'painted': 0}
+
+    def cache_key(self, image_path):
+        if image_path.startswith("http"):
+            return image_path, None
+        try:
+            return image_path, os.stat(image_path).st_mtime_ns
+        except OSError:
+            return image_path, None
+
+    def request(self, image_path, on_ready):
+        """on_ready(photo) Tk thread'inde çağrılır; resim yoksa photo None olur. Önceki istek iptal edilir."""
+        started = time.perf_counter()
+        self.generation += 1
+        key = self.cache_key(image_path)
+        photo = self.cache.get(key)
+        if photo is not None:
+            self.cache.move_to_end(key)
+            self.stats['hits'] += 1
+            self.painted(started)
+            on_ready(photo)
+            return
+        self.stats['misses'] += 1
+        kind = 'remote' if image_path.startswith("http") else 'local'
+        if kind not in self.threads:
+            self.threads[kind] = threading.Thread(target=self.run, args=(self.queues[kind],), daemon=True)
+            self.threads[kind].start()
+        self.queues[kind].put((self.generation, key, on_ready, started))
+
+    def cancel(self):
+        self.generation += 1
+
+    def run(self, requests):
+        while True:
+            item = requests.get()
+            # Kuyrukta biriken eski seçimler atlanır; sadece en yenisi çözülür.
+            while not requests.empty():
+                self.stats['cancelled'] += 1
+                item = requests.get()
+            generation, key, on_ready, started = item
+            if generation != self.generation:
+                self.stats['cancelled'] += 1
+                continue
+            try:
+                image = self.decode(key[0])
+            except Exception as e:
+                print(f"Önizleme resmi yüklenirken hata: {str(e)}")
+                self.stats['errors'] += 1
+                image = None
+            self.schedule(lambda: self.deliver(generation, key, image, on_ready, started))
+
+    def decode(self, image_path):
+        from PIL import Image
+        if image_path.startswith("http"):
+            response = self.http.get(image_path, retries=0, timeout=PREVIEW_HTTP_TIMEOUT)
+            if response.status_code != 200:
+                print(f"HTTP Hatası {response.status_code} URL: {image_path}")
+                return None
+            image = Image.open(BytesIO(response.content))
+        elif os.path.exists(image_path):
+            return self.load_thumbnail(image_path)
+        else:
+            return None
+        image.thumbnail(self.size)
+        image.load()
+        return image
+
+    def thumbnail_path(self, image_path):
+        return thumbnail_path(image_path, self.thumb_folder)
+
+    def load_thumbnail(self, image_path):
+        """
+        Diskteki küçük kopyayı döndürür. Kopyanın mtime'ı kaynağınkine eşitlenir; kaynak değişince
+        (mtime farklıysa) kopya ilk istekte yeniden üretilir.
+        """
+        from PIL import Image
+        source_mtime = os.stat(image_path).st_mtime_ns
+        thumb_path = self.thumbnail_path(image_path)
+        try:
+            if os.stat(thumb_path).st_mtime_ns == source_mtime:
+                image = Image.open(thumb_path)
+                image.load()
+                self.stats['thumb_hits'] += 1
+                return image
+        except OSError:
+            pass
+        image = Image.open(image_path)
+        # JPEG'lerde draft modu resmi çözme sırasında 1/2, 1/4, 1/8 ölçekte okur.
+        image.draft('RGB', self.size)
+        image.thumbnail(self.size)
+        # Saydam ikonlar (icon.png, logo.png) JPEG'e çevrilirse arka planları siyah olur; PNG olarak saklanır.
+        alpha = image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info)
+        image = image.convert('RGBA' if alpha else 'RGB')
+        try:
+            os.makedirs(self.thumb_folder, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.thumb_folder, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                if alpha:
+                    image.save(f, 'PNG')
+                else:
+                    image.save(f, 'JPEG', quality=90)
+            os.utime(temp_path, ns=(source_mtime, source_mtime))
+            os.replace(temp_path, thumb_path)
+            self.stats['thumb_builds'] += 1
+        except OSError as e:
+            print(f"Önizleme küçük kopyası kaydedilemedi ({image_path}): {e}")
+        return image
+
+    def deliver(self, generation, key, image, on_ready, started):
+        photo = None
+        if image is not None:
+            from PIL import ImageTk
+            photo = ImageTk.PhotoImage(image)
+            self.cache[key] = photo
+            while len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        if generation != self.generation:
+            self.stats['cancelled'] += 1
+            return
+        self.painted(started)
+        on_ready(photo)
+
+    def painted(self, started):
+        latency = (time.perf_counter() - started) * 1000
+        stats = self.stats
+        stats['painted'] += 1
+        stats['last_latency_ms'] = round(latency, 2)
+        stats['avg_latency_ms'] = round(stats['avg_latency_ms'] + (latency - stats['avg_latency_ms']) / stats['painted'], 2)
+
+
+#########################################
+# Kapak Deposu: İçerik adresli, boyut sınırlı resim önbelleği
+#########################################
+COVER_FOLDER = "image_cache"
+COVER_BLOB_FOLDER = os.path.join(COVER_FOLDER, "blobs")
+COVER_MANIFEST_FILE = os.path.join(COVER_FOLDER, "covers.json")
+COVER_CACHE_DEFAULT_MB = 500   # Ayarlarda cover_cache_mb ile değiştirilebilir
+
+
+class CoverStore:
+    """
+    İndirilen kapaklar içeriklerinin SHA-256 özetiyle (blobs/<özet>.jpg) saklanır; aynı resim bir kez tutulur.
+    Manifest hangi oyunun hangi blob'u kullandığını, blob boyutlarını ve son kullanım zamanını tutar.
+    Kimsenin kullanmadığı blob (ve önizleme küçük kopyası) hemen silinir; toplam boyut sınırı aşılınca en uzun
+    süredir kullanılmayanlar atılır.
+    """
+
+    def __init__(self, folder=COVER_BLOB_FOLDER, manifest_file=COVER_MANIFEST_FILE,
+                 max_bytes=COVER_CACHE_DEFAULT_MB * 1024 * 1024, on_change=None, on_evict=None,
+                 thumb_folder=THUMBNAIL_FOLDER):
+        self.folder = folder
+        self.manifest_file = manifest_file
+        self.thumb_folder = thumb_folder
+        self.max_bytes = max_bytes
+        self.on_change = on_change    # Manifest değişince (kaydetmek için) çağrılır
+        self.on_evict = on_evict      # Boyut sınırı yüzünden silinen blob'u kullanan oyunlar için çağrılır
+        self.lock = threading.RLock()
+        self.blobs = {}   # özet -> {'size': bayt, 'last_used': zaman}
+        self.games = {}   # unique -> özet
+        self.users = {}   # özet -> {unique}; games'in tersi, blob'un kullanılıp kullanılmadığı buradan bakılır
+        self.stats = {'stored': 0, 'deduplicated': 0, 'evicted': 0, 'released': 0}
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            self.blobs = manifest.get("blobs", {})
+            self.games = manifest.get("games", {})
+        except (OSError, ValueError):
+            self.blobs, self.games = {}, {}
+        self.users = {}
+        for unique, digest in self.games.items():
+            self.users.setdefault(digest, set()).add(unique)
+
+    def snapshot(self):
+        with self.lock:
+            return {"blobs": dict(self.blobs), "games": dict(self.games)}
+
+    def changed(self):
+        if self.on_change:
+            self.on_change()
+
+    def blob_path(self, digest):
+        return os.path.join(self.folder, f"{digest}.jpg")
+
+    def total_bytes(self):
+        return sum(blob['size'] for blob in self.blobs.values())
+
+    def refs(self, digest):
+        return list(self.users.get(digest, ()))
+
+    def link(self, unique, digest):
+        """Oyunu blob'a bağlar; önceki blob'unun özetini döndürür."""
+        previous = self.unlink(unique)
+        self.games[unique] = digest
+        self.users.setdefault(digest, set()).add(unique)
+        return previous
+
+    def unlink(self, unique):
+        digest = self.games.pop(unique, None)
+        if digest is not None:
+            users = self.users.get(digest)
+            if users is not None:
+                users.discard(unique)
+                if not users:
+                    del self.users[digest]
+        return digest
+
+    def put(self, unique, data):
+        """Oyunun kapağını saklar ve dosya yolunu döndürür; aynı içerik zaten varsa tekrar yazılmaz."""
+        fd, temp_path = self.temp_file()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        return self.put_file(unique, temp_path, hashlib.sha256(data).hexdigest(), len(data))
+
+    def temp_file(self):
+        """Depo klasöründe geçici dosya açar (indirmeler doğrudan buraya akıtılır)."""
+        os.makedirs(self.folder, exist_ok=True)
+        return tempfile.mkstemp(dir=self.folder, suffix='.tmp')
+
+    def put_file(self, unique, temp_path, digest, size):
+        """temp_file ile yazılmış dosyayı özetiyle depoya alır; aynı içerik varsa geçici dosya silinir."""
+        path = self.blob_path(digest)
+        with self.lock:
+            if digest in self.blobs and os.path.exists(path):
+                os.remove(temp_path)
+                self.stats['deduplicated'] += 1
+            else:
+                os.replace(temp_path, path)
+                self.stats['stored'] += 1
+            self.blobs[digest] = {'size': size, 'last_used': time.time()}
+            previous = self.link(unique, digest)
+            if previous and previous != digest:
+                self.drop_if_unused(previous)
+            self.enforce_limit(keep=digest)
+        self.changed()
+        return path
+
+    def adopt(self, unique, path):
+        """Eski sürümün oyun adıyla kaydettiği kapağı depoya taşır; yeni yolu döndürür."""
+        with open(path, "rb") as f:
+            data = f.read()
+        new_path = self.put(unique, data)
+        os.remove(path)
+        return new_path
+
+    def rename(self, old_unique, new_unique):
+        with self.lock:
+            digest = self.unlink(old_unique)
+            if digest is None:
+                return
+            previous = self.link(new_unique, digest)
+            if previous and previous != digest:
+                self.drop_if_unused(previous)
+        self.changed()
+
+    def touch(self, path):
+        """Önizlemede gösterilen blob'un son kullanım zamanını günceller (LRU için)."""
+        digest = os.path.splitext(os.path.basename(path))[0]
+        with self.lock:
+            blob = self.blobs.get(digest)
+            if blob is None or os.path.dirname(os.path.abspath(path)) != os.path.abspath(self.folder):
+                return
+            blob['last_used'] = time.time()
+        self.changed()
+
+    def release(self, unique):
+        """Oyun silindiğinde ya da resmi sıfırlandığında referansını bırakır; kullanılmayan blob silinir."""
+        with self.lock:
+            digest = self.unlink(unique)
+            if digest is None:
+                return
+            self.stats['released'] += 1
+            self.drop_if_unused(digest)
+        self.changed()
+
+    def drop_if_unused(self, digest):
+        if self.users.get(digest):
+            return
+        self.blobs.pop(digest, None)
+        path = self.blob_path(digest)
+        for file in (path, thumbnail_path(path, self.thumb_folder)):
+            try:
+                os.remove(file)
+            except OSError:
+                pass
+
+    def enforce_limit(self, keep=None):
+        total = self.total_bytes()
+        evicted = []
+        for digest, blob in sorted(self.blobs.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            if digest == keep:
+                continue
+            total -= blob['size']
+            users = self.refs(digest)
+            for unique in users:
+                self.unlink(unique)
+            self.drop_if_unused(digest)
+            self.stats['evicted'] += 1
+            evicted.extend(users)
+        if evicted and self.on_evict:
+            self.on_evict(evicted)
+
+    def gc(self, referenced_paths=(), live_uniques=None):
+        """
+        Eski sürümlerden kalan (oyun adıyla kaydedilmiş) ve hiçbir oyunun kullanmadığı resimleri,
+        manifestte olmayan blob'ları, artık gösterilmeyecek resimlerin küçük kopyalarını ve yarım kalmış
+        geçici dosyaları siler. live_uniques verilirse, içinde olmayan oyunların bağlantıları da bırakılır.
+        Silinen dosya sayısı ve boşalan bayt döndürülür.
+        """
+        referenced = {os.path.abspath(p) for p in referenced_paths if p}
+        removed, freed = 0, 0
+        with self.lock:
+            stale = [u for u in self.games if live_uniques is not None and u not in live_uniques]
+            for unique in stale:
+                self.unlink(unique)
+                self.stats['released'] += 1
+            orphans = [d for d in self.blobs if not self.users.get(d)]
+            for digest in orphans:
+                del self.blobs[digest]
+            known = {os.path.abspath(self.blob_path(d)) for d in self.blobs}
+            thumbs = {os.path.abspath(thumbnail_path(p, self.thumb_folder)) for p in known | referenced}
+            candidates = []
+            parent = os.path.dirname(os.path.abspath(self.folder))
+            for folder, keep in ((parent, referenced), (os.path.abspath(self.folder), known | referenced),
+                                 (os.path.abspath(self.thumb_folder), thumbs)):
+                try:
+                    entries = list(os.scandir(folder))
+                except OSError:
+                    continue
+                for entry in entries:
+                    if not entry.is_file() or entry.path == os.path.abspath(self.manifest_file) or entry.path in keep:
+                        continue
+                    # Yazılmakta olan geçici dosyalara dokunmuyoruz; sadece bir saatten eski olanlar yarım kalmıştır.
+                    if (entry.name.startswith('.tmp-') or entry.name.endswith('.tmp')) and \
+                            entry.stat().st_mtime > time.time() - 3600:
+                        continue
+                    candidates.append(entry)
+            for entry in candidates:
+                try:
+                    size = entry.stat().st_size
+                    os.remove(entry.path)
+                    removed += 1
+                    freed += size
+                except OSError as e:
+                    print(f"Önbellek dosyası silinemedi ({entry.path}): {e}")
+        if orphans or stale:
+            self.changed()
+        return removed, freed
+
+
+#########################################
+# Tek Uçuş (Single-Flight): Aynı oyun/kaynak için eşzamanlı istekleri birleştirme
+#########################################
+class SingleFlight:
+    """
+    Aynı anahtar (ör. (unique, 'image')) için aynı anda tek iş çalışır. Sonradan gelenler yeni istek
+    başlatmak yerine çalışan işi bekler ve onun sonucunu (ya da hatasını) alır.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}   # anahtar -> {'event', 'result', 'error', 'waiters'}
+        self.stats = {'started': 0, 'deduplicated': 0, 'failed': 0}
+
+    def do(self, key, fn):
+        with self.lock:
+            call = self.calls.get(key)
+            if call is not None:
+                self.stats['deduplicated'] += 1
+                leader = False
+            else:
+                call = self.calls[key] = {'event': threading.Event(), 'result': None, 'error': None}
+                self.stats['started'] += 1
+                leader = True
+        if not leader:
+            call['event'].wait()
+        else:
+            try:
+                call['result'] = fn()
+            except Exception as e:
+                call['error'] = e
+                self.stats['failed'] += 1
+            finally:
+                with self.lock:
+                    del self.calls[key]
+                call['event'].set()
+        if call['error'] is not None:
+            raise call['error']
+        return call['result']
+
+
+#########################################
+# Öncelikli Kapak Önbellekleme Kuyruğu
+#########################################
+PREFETCH_WORKERS = 4
+# Küçük sayı önce çalışır: seçili oyun > ekranda görünenler > son oynananlar > diğerleri
+PRIORITY_SELECTED, PRIORITY_VISIBLE, PRIORITY_RECENT, PRIORITY_BACKGROUND = range(4)
+PRIORITY_NAMES = ('selected', 'visible', 'recent', 'background')
+
+
+class PrefetchScheduler:
+    """
+    Oyun başına tek iş tutan öncelik kuyruğu. Bir oyun daha yüksek öncelikle tekrar istenirse (ör. seçildi
+    ya da ekrana girdi) kuyrukta öne alınır; ekrandan çıkınca kendi önceliğine döner. Silinen oyunların işi
+    iptal edilir. Heap'teki eski girdiler atılmaz, sırası gelince sessizce atlanır. Ayrıca yalnızca seçili
+    oyunların işine bakan bir işçi vardır; diğer işçiler kota beklerken bile seçilen oyun sıra beklemez.
+    """
+
+    def __init__(self, task, workers=PREFETCH_WORKERS):
+        self.task = task              # task(unique, öncelik) işçi thread'inde çağrılır
+        self.workers = workers
+        self.condition = threading.Condition()
+        self.heap = []                # (öncelik, sıra, unique)
+        self.entries = {}             # unique -> {'priority', 'base', 'seq', 'queued_at'}
+        self.running = set()
+        self.visible = set()
+        self.seq = 0
+        self.threads = []
+        self.stats = {'processed': 0, 'cancelled': 0, 'reprioritized': 0, 'errors': 0,
+                      'wait_ms': {name: 0.0 for name in PRIORITY_NAMES},
+                      'count': {name: 0 for name in PRIORITY_NAMES}}
+
+    def start(self):
+        while len(self.threads) < self.workers + 1:
+            # İlk thread sadece PRIORITY_SELECTED işlerini alır.
+            thread = threading.Thread(target=self.run, args=(not self.threads,), daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def push(self, unique, entry, priority):
+        self.seq += 1
+        entry['priority'], entry['seq'] = priority, self.seq
+        heapq.heappush(self.heap, (priority, self.seq, unique))
+
+    def submit(self, unique, priority=PRIORITY_BACKGROUND):
+        """İşi kuyruğa koyar; zaten bekliyorsa önceliği sadece yükseltilir."""
+        with self.condition:
+            if unique in self.running:
+                return
+            entry = self.entries.get(unique)
+            if entry is None:
+                entry = self.entries[unique] = {'base': priority, 'queued_at': time.perf_counter()}
+                if unique in self.visible:
+                    priority = min(priority, PRIORITY_VISIBLE)
+            elif priority < entry['priority']:
+                self.stats['reprioritized'] += 1
+            else:
+                return
+            self.push(unique, entry, priority)
+            # Uyanan thread yalnızca seçili işlere bakan işçi olabileceği için hepsi uyandırılır.
+            self.condition.notify_all()
+        self.start()
+
+    def set_visible(self, uniques):
+        """Ekrandaki satırlar değişti: yeni görünenler öne, ekrandan çıkanlar kendi önceliklerine."""
+        with self.condition:
+            uniques = set(uniques)
+            for unique in self.visible - uniques:
+                entry = self.entries.get(unique)
+                if entry is not None and entry['priority'] == PRIORITY_VISIBLE and entry['base'] > PRIORITY_VISIBLE:
+                    self.push(unique, entry, entry['base'])
+            for unique in uniques - self.visible:
+                entry = self.entries.get(unique)
+                if entry is not None and entry['priority'] > PRIORITY_VISIBLE:
+                    self.stats['reprioritized'] += 1
+                    self.push(unique, entry, PRIORITY_VISIBLE)
+            self.visible = uniques
+
+    def cancel(self, unique):
+        with self.condition:
+            if self.entries.pop(unique, None) is not None:
+                self.stats['cancelled'] += 1
+
+    def queue_depth(self):
+        with self.condition:
+            return len(self.entries)
+
+    def run(self, selected_only=False):
+        while True:
+            with self.condition:
+                while True:
+                    while not self.heap or (selected_only and self.heap[0][0] != PRIORITY_SELECTED):
+                        self.condition.wait()
+                    priority, seq, unique = heapq.heappop(self.heap)
+                    entry = self.entries.get(unique)
+                    if entry is not None and entry['seq'] == seq:
+                        break
+                del self.entries[unique]
+                self.running.add(unique)
+                name = PRIORITY_NAMES[priority]
+                wait_ms = (time.perf_counter() - entry['queued_at']) * 1000
+                count = self.stats['count'][name] = self.stats['count'][name] + 1
+                self.stats['wait_ms'][name] += (wait_ms - self.stats['wait_ms'][name]) / count
+            try:
+                self.task(unique, priority)
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"Error prefetching image: {str(e)}")
+            finally:
+                with self.condition:
+                    self.running.discard(unique)
+                    self.stats['processed'] += 1
+
+
+#########################################
+# Ortak HTTP İstemcisi: Bağlantı havuzu, tekrar deneme ve host istatistikleri
+#########################################
+HTTP_USER_AGENT = "GameLauncher/1.0"
+HTTP_TIMEOUT = 5
+HTTP_RETRIES = 3                      # İlk denemeden sonra en fazla bu kadar tekrar
+HTTP_BACKOFF_BASE = 0.5               # sn; her denemede iki katına çıkar
+HTTP_BACKOFF_MAX = 30.0
+HTTP_RETRY_STATUSES = {429, 500, 502, 503, 504}
+HTTP_CHUNK_SIZE = 64 * 1024
+
+
+class HttpClient:
+    """
+    Tüm ağ çağrıları için tek requests.Session. Bağlantılar (keep-alive) havuzda tutulur; havuz boyutu
+    önbellekleme işçi sayısına göre ayarlanır. 429/5xx ve bağlantı hatalarında rastgele sapmalı üstel
+    beklemeyle tekrar denenir (Retry-After başlığı varsa ona uyulur).
+    """
+
+    def __init__(self, pool_size=PREFETCH_WORKERS + 2, retries=HTTP_RETRIES, backoff_base=HTTP_BACKOFF_BASE,
+                 backoff_max=HTTP_BACKOFF_MAX, timeout=HTTP_TIMEOUT, sleep=time.sleep):
+        self.pool_size = pool_size
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.sleep = sleep
+        self.session = None
+        self.lock = threading.Lock()
+        self.hosts = {}   # host -> {'requests', 'errors', 'retries', 'bytes', 'seconds'}
+
+    def get_session(self):
+        with self.lock:
+            if self.session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["User-Agent"] = HTTP_USER_AGENT
+                self.session = session
+            return self.session
+
+    def host_stats(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            return self.hosts.setdefault(host, {'requests': 0, 'errors': 0, 'retries': 0, 'bytes': 0, 'seconds': 0.0})
+
+    def backoff(self, attempt, response=None):
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(self.backoff_max, float(retry_after))
+        # "Full jitter": aynı anda sınıra takılan işçiler aynı anda tekrar denemesin.
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def get(self, url, stream=False, retries=None, **kwargs):
+        """
+        GET isteği; geçici hatalarda tekrar dener. Son denemenin yanıtı (ya da hatası) döndürülür.
+        retries ve timeout verilirse istemcinin varsayılanları yerine bu istek için kullanılır.
+        """
+        import requests
+        kwargs.setdefault("timeout", self.timeout)
+        if retries is None:
+            retries = self.retries
+        session = self.get_session()
+        stats = self.host_stats(url)
+        for attempt in range(retries + 1):
+            started = time.perf_counter()
+            try:
+                response = session.get(url, stream=stream, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                stats['errors'] += 1
+                if attempt == retries:
+                    raise
+                stats['retries'] += 1
+                self.sleep(self.backoff(attempt))
+                continue
+            stats['requests'] += 1
+            stats['seconds'] += time.perf_counter() - started
+            if response.status_code in HTTP_RETRY_STATUSES and attempt < retries:
+                stats['retries'] += 1
+                delay = self.backoff(attempt, response)
+                response.close()
+                self.sleep(delay)
+                continue
+            if response.status_code >= 400:
+                stats['errors'] += 1
+            if not stream:
+                stats['bytes'] += len(response.content)
+            return response
+
+    def download(self, url, open_temp, **kwargs):
+        """
+        Yanıtı parça parça doğrudan diske yazar. open_temp() -> (fd, yol) geçici dosyayı açar.
+        (durum kodu, geçici yol, sha256 özeti, boyut) döndürür; başarısızsa yol None olur.
+        """
+        response = self.get(url, stream=True, **kwargs)
+        stats = self.host_stats(url)
+        try:
+            if response.status_code != 200:
+                return response.status_code, None, None, 0
+            started = time.perf_counter()
+            digest, size = hashlib.sha256(), 0
+            fd, temp_path = open_temp()
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    for chunk in response.iter_content(HTTP_CHUNK_SIZE):
+                        f.write(chunk)
+                        digest.update(chunk)
+                        size += len(chunk)
+            except BaseException:
+                os.remove(temp_path)
+                raise
+            stats['bytes'] += size
+            stats['seconds'] += time.perf_counter() - started
+            return response.status_code, temp_path, digest.hexdigest(), size
+        finally:
+            response.close()
+
+    def stats(self):
+        """Host başına istek/hata/tekrar sayısı, ortalama gecikme ve aktarım hızı."""
+        with self.lock:
+            report = {}
+            for host, stats in self.hosts.items():
+                report[host] = dict(stats)
+                report[host]['avg_ms'] = round(stats['seconds'] / stats['requests'] * 1000, 1) if stats['requests'] else 0.0
+                report[host]['kb_per_s'] = round(stats['bytes'] / 1024 / stats['seconds'], 1) if stats['seconds'] else 0.0
+            return report
+
+
+#########################################
+# GiantBomb İstek Kotası: Token Bucket
+#########################################
+GIANTBOMB_HOURLY_QUOTA = 200   # Ayarlarda giantbomb_hourly_quota ile değiştirilebilir
+GIANTBOMB_BURST = 10           # Ayarlarda giantbomb_burst ile değiştirilebilir
+GIANTBOMB_INTERACTIVE_RESERVE = 3   # Bu kadar token yalnızca kullanıcının beklediği (seçili oyun) isteklere ayrılır
+
+
+class TokenBucket:
+    """
+    Saatte rate_per_hour istek, aynı anda en fazla burst istek izni veren kova. Tüm API çağrıları
+    acquire() ile izin alır; izin yoksa bir token dolana kadar bekler. Arka plan istekleri son reserve
+    tokena dokunamaz, böylece önbellekleme kotayı bitirse de seçili oyunun isteği beklemeden çıkar.
+    Durum (kalan token ve zamanı) duvar saatine göre tutulur, böylece kaydedilip yeniden açılışta
+    kaldığı yerden devam edilir.
+    """
+
+    def __init__(self, rate_per_hour=GIANTBOMB_HOURLY_QUOTA, burst=GIANTBOMB_BURST, state=None,
+                 on_change=None, clock=time.time, sleep=time.sleep, reserve=GIANTBOMB_INTERACTIVE_RESERVE):
+        self.rate = max(1, rate_per_hour) / 3600.0   # saniyedeki token
+        self.burst = max(1, burst)
+        self.reserve = max(0, min(reserve, self.burst - 1))
+        self.clock = clock
+        self.sleep = sleep
+        self.on_change = on_change
+        self.lock = threading.Lock()
+        self.tokens = float(self.burst)
+        self.updated = clock()
+        if state:
+            self.tokens = min(self.burst, max(0.0, float(state.get('tokens', self.burst))))
+            self.updated = min(clock(), float(state.get('updated', self.updated)))
+        self.waiting = 0
+        self.stats = {'acquired': 0, 'interactive': 0, 'waited': 0, 'total_wait_s': 0.0, 'max_wait_s': 0.0}
+
+    def refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, interactive=False):
+        """
+        Bir istek izni alır; gerekirse bekler. Beklenen süreyi (sn) döndürür.
+        interactive=False (arka plan) ise en az reserve + 1 token varken izin verilir.
+        """
+        needed = 1 if interactive else 1 + self.reserve
+        started = self.clock()
+        waited = False
+        with self.lock:
+            self.waiting += 1
+        try:
+            while True:
+                with self.lock:
+                    self.refill()
+                    if self.tokens >= needed:
+                        self.tokens -= 1
+                        break
+                    delay = (needed - self.tokens) / self.rate
+                waited = True
+                self.sleep(delay)
+        finally:
+            with self.lock:
+                self.waiting -= 1
+        wait = self.clock() - started
+        with self.lock:
+            self.stats['acquired'] += 1
+            if interactive:
+                self.stats['interactive'] += 1
+            if waited:
+                self.stats['waited'] += 1
+                self.stats['total_wait_s'] += wait
+                self.stats['max_wait_s'] = max(self.stats['max_wait_s'], wait)
+        if self.on_change:
+            self.on_change()
+        return wait
+
+    def state(self):
+        with self.lock:
+            return {'tokens': self.tokens, 'updated': self.updated}
+
+    def status(self):
+        """Kalan istek hakkı, sıradaki tokenın dolma süresi ve bekleme bilgileri."""
+        with self.lock:
+            self.refill()
+            return {
+                'remaining': int(self.tokens),
+                'reserve': self.reserve,
+                'next_token_in_s': round(0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate, 1),
+                'waiting': self.waiting,
+                'avg_wait_s': round(self.stats['total_wait_s'] / self.stats['waited'], 2) if self.stats['waited'] else 0.0,
+                **{k: round(v, 2) if isinstance(v, float) else v for k, v in self.stats.items()},
+            }
+
+
+#########################################
+# Bellekte tutulacak oyun açıklaması sayısı (cold veri LRU)
+#########################################
+COLD_CACHE_SIZE = 256
 
 #########################################
 # Ana Sınıf: GameLauncher
 #########################################
 class GameLauncher:
-    def __init__(self):
+    def __init__(self, headless=False, print_stats=False):
         self.api_key = ""
+        self.print_stats = print_stats  # Çıkışta çalışma istatistikleri yazdırılsın mı (--stats)
         # Launcher tarama fonksiyonlarını güncelliyoruz, Xbox da eklendi.
         self.launchers = {
             'Steam': self.scan_steam,
@@ -59,18 +2523,69 @@ class GameLauncher:
             'Origin': self.scan_origin,
             'Xbox': self.scan_xbox_games
         }
-        self.games = []         # Tarama sonucu + manuel eklenen oyunların birleşimi
+        # Her launcher taraması için zaman aşımı (saniye). Süresi dolan launcher atlanır.
+        self.default_scan_timeout = 120
+        self.scan_timeouts = {
+            'Xbox': 60
+        }
+        self.scan_timings = {}  # Son taramada launcher başına geçen süre (saniye)
+        # find_exe için toplu istatistikler (tarayıcılar paralel çalıştığı için kilitli)
+        self.find_exe_lock = threading.Lock()
+        self.find_exe_totals = {'calls': 0, 'visited': 0, 'elapsed': 0.0}
+        # Klasör parmak izi (mtime + inode) ile önceki tarama sonuçlarını saklayan indeks
+        self.scan_index = None
+        self.scan_index_lock = threading.Lock()
+        # Steam appmanifest önbelleği: dosya yolu -> (mtime_ns, manifest bilgisi)
+        self.steam_manifest_cache = {}
+        self.steam_manifest_lock = threading.Lock()
+        # Klasör -> kütüphanede kayıtlı exe (load_known_exes); indeksi olmayan klasörlerde anahtar korunur.
+        self.known_exes = None
+        # Tarayıcıların bulduğu kütüphane klasörleri (launcher -> klasörler); canlı izleme bunları kullanır.
+        self.library_roots = {}
+        self.library_watcher = None
+        # Tarama sonucu + manuel eklenen oyunların birleşimi; tüm değişiklikler bu model üzerinden yapılır.
+        self.library = GameLibrary()
+        self.cold_loaded = collections.OrderedDict()  # Açıklaması bellekte olan oyunlar (unique -> oyun), LRU
         self.manual_games = []  # Manuel eklenen oyunlar (ayrı dosyada saklanıyor)
         self.error_logs = []    # Tarama sırasında oluşan hata mesajlarını toplayacağız
         self.load_settings()
         # Launcher istemci bilgileri (yol ve process adı)
-        self.clients = {
-            'Steam': {'path': self.get_steam_client_path(), 'process': 'steam.exe'},
-            'Epic Games': {'path': self.get_epic_client_path(), 'process': 'EpicGamesLauncher.exe'},
-            'GOG Galaxy': {'path': self.get_gog_client_path(), 'process': os.path.basename(self.get_gog_client_path()) if self.get_gog_client_path() else None},
-            'Ubisoft Connect': {'path': self.get_ubisoft_client_path(), 'process': 'UbisoftConnect.exe'},
-            'Origin': {'path': self.get_origin_client_path(), 'process': os.path.basename(self.get_origin_client_path()) if self.get_origin_client_path() else None}
-        }
+        # Registry okumaları ClientLocator üzerinden tek sefer yapılıp önbelleklenir.
+        self.locator = ClientLocator()
+        self.clients = {}  # Açılıştan sonra arka planda doldurulur (background_startup)
+        # Get-StartApps sonucu, paket klasörleri değişmedikçe önbellekten kullanılır.
+        self.xbox_catalog = XboxAppCatalog()
+        self.scan_profiler = ScanProfiler()
+        # Oyunlar, manuel kayıtlar ve bilgiler SQLite veritabanında; eski JSON dosyaları bir kez aktarılır.
+        self.store = LibraryStore()
+        self.store.migrate_from_json()
+        # Kayıt istekleri birleştirilip arka planda (ya da çıkışta) yazılır.
+        self.persistence = PersistenceService()
+        self.persistence.register_json('settings', "settings.json", self.settings_snapshot, compact=False)
+        self.persistence.register('scan_results', lambda: self.store.replace_games(list(self.games)))
+        self.persistence.register('manual_games', lambda: self.store.replace_manual_games(list(self.manual_games)))
+        # İndirilen kapaklar içerik adresli depoda; manifest diğer kayıtlar gibi birleştirilerek yazılır.
+        self.cover_store = CoverStore(max_bytes=self.cover_cache_mb * 1024 * 1024,
+                                      on_change=lambda: self.persistence.mark_dirty('covers'),
+                                      on_evict=self.on_covers_evicted)
+        self.persistence.register_json('covers', COVER_MANIFEST_FILE, self.cover_store.snapshot)
+        self.single_flight = SingleFlight()
+        self.http = HttpClient(pool_size=PREFETCH_WORKERS + 2)
+        self.api_cache_stats = {'hits': 0, 'misses': 0, 'revalidated': 0, 'stale': 0}
+        # Tüm GiantBomb API çağrıları ortak kotadan izin alır; kota durumu yeniden açılışta da geçerli.
+        try:
+            rate_state = json.loads(self.store.get_meta('giantbomb_rate') or 'null')
+        except ValueError:
+            rate_state = None
+        self.giantbomb_limiter = TokenBucket(self.giantbomb_hourly_quota, self.giantbomb_burst, state=rate_state,
+                                             on_change=lambda: self.persistence.mark_dirty('giantbomb_rate'))
+        self.persistence.register('giantbomb_rate', lambda: self.store.set_meta(
+            'giantbomb_rate', json.dumps(self.giantbomb_limiter.state())))
+        self.prefetch_scheduler = PrefetchScheduler(self.prefetch_worker)
+        self.library.subscribe(self.persist_library_event)
+        # Başsız (--scan-only) modda pencere, tepsi ve resim önbellekleme başlatılmaz.
+        if headless:
+            return
         
         # Karanlık tema "cyborg" ile modern pencere oluşturuyoruz.
         self.root = tb.Window(themename="solar")
@@ -88,14 +2603,46 @@ class GameLauncher:
         self.root.config(menu=menu_bar)
 
 
-        # Stil ayarları
-        style = ttk.Style()
-        style.configure("Treeview", rowheight=30, font=('Segoe UI', 10))
-        style.configure("Treeview.Heading", font=('Segoe UI', 11, 'bold'))
+        # Stil ayarları
+        style = ttk.Style()
+        style.configure("Treeview", rowheight=30, font=('Segoe UI', 10))
+        style.configure("Treeview.Heading", font=('Segoe UI', 11, 'bold'))
+
+        self.create_widgets()
+        # Şu an izlenen oyunun unique ID'sini tutmak için:
+        self.current_monitored_game = None
+        #########################################
+        # Tema Seçici (ttkbootstrap tüm temaları)
+        #########################################
+        theme_label = ttk.Label(self.right_frame, text="Tema Seçici:", font=('Segoe UI', 10, 'bold'))
+        theme_label.pack(pady=5)
+
+        available_themes = self.style.theme_names()
+        self.theme_selector = ttk.Combobox(self.right_frame, values=available_themes, state="readonly")
+        self.theme_selector.set(self.style.theme_use())
+        self.theme_selector.pack(pady=5)
+        self.theme_selector.bind("<<ComboboxSelected>>", self.on_theme_change)
+
+        # Arama indeksi kütüphane olaylarını listeden önce işlemeli.
+        self.search_index = GameSearchIndex(self.library)
+        self.search_after_id = None
+        self.list_refresh_after_id = None
+        self.library.subscribe(self.on_library_event)
+
+        # 1. aşama: Kayıtlı oyun listesini hemen gösteriyoruz.
+        self.load_manual_games()  # Manuel eklenen oyunları veritabanından yükle
+        self.load_scan_results()
+        # 2. aşama: Ağır işler (API key sorusu, istemci yolları, tarama, resimler) ilk çizimden sonra.
+        self.startup_metrics = {}
+        self.root.after(0, self.finish_startup)
+
+    #########################################
+    # Aşamalı Açılış ve Açılış Süresi Ölçümü
+    #########################################
+    def finish_startup(self):
+        self.root.update_idletasks()
+        self.record_startup_metric('first_paint_ms')
 
-        self.create_widgets()
-        self.load_manual_games()  # Manuel eklenen oyunları dosyadan yükle
-        
         # Eğer API key girilmemişse, başta soruyoruz.
         if not self.api_key:
             key = simpledialog.askstring(
@@ -109,31 +2656,52 @@ class GameLauncher:
                 messagebox.showwarning("Uyarı", "API key girilmedi. Resim ve açıklama alınmayacak.")
                 self.api_key = ""
 
-        self.load_manual_games()  # Manuel eklenen oyunları dosyadan yükle
-
-
-        # Tarama sonuçlarını, eğer varsa, yükle; yoksa tarama yap.
-        self.load_scan_results()
-        if not self.games:
+        # Kayıtlı sonuç yoksa tarama yap.
+        if not len(self.library):
             self.threaded_scan_games()
+        else:
+            self.sync_library_watch()
+        threading.Thread(target=self.background_startup, daemon=True).start()
 
-        # Resim ve GiantBomb bilgileri, scan_results.json ile kalıcı olarak saklanıyor.
-        threading.Thread(target=self.prefetch_images, daemon=True).start()
-        
-        # Şu an izlenen oyunun unique ID'sini tutmak için:
-        self.current_monitored_game = None
-        #########################################
-        # Tema Seçici (ttkbootstrap tüm temaları)
-        #########################################
-        theme_label = ttk.Label(self.right_frame, text="Tema Seçici:", font=('Segoe UI', 10, 'bold'))
-        theme_label.pack(pady=5)
+    def background_startup(self):
+        # Launcher istemci bilgileri (yol ve process adı)
+        self.clients = self.locator.clients()
+        # Tepsi, ağ ve resim modüllerini ilk kullanımda beklememek için önceden yüklüyoruz.
+        for module_name in ("requests", "PIL.Image", "PIL.ImageTk", "PIL.ImageOps", "psutil", "pystray"):
+            try:
+                importlib.import_module(module_name)
+            except Exception as e:
+                print(f"{module_name} yüklenemedi:", e)
+        self.root.after(0, lambda: self.record_startup_metric('ready_ms'))
+        self.collect_image_garbage()
+        # Resim ve GiantBomb bilgileri veritabanında kalıcı olarak saklanıyor.
+        self.prefetch_images()
 
-        available_themes = self.style.theme_names()
-        self.theme_selector = ttk.Combobox(self.right_frame, values=available_themes, state="readonly")
-        self.theme_selector.set(self.style.theme_use())
-        self.theme_selector.pack(pady=5)
-        self.theme_selector.bind("<<ComboboxSelected>>", self.on_theme_change)
+    def record_startup_metric(self, name):
+        elapsed_ms = round((time.perf_counter() - STARTUP_STARTED) * 1000, 1)
+        self.startup_metrics[name] = elapsed_ms
+        print(f"Açılış ölçümü: {name} = {elapsed_ms} ms")
+        if name == 'ready_ms':
+            threading.Thread(target=self.save_startup_metrics, args=(dict(self.startup_metrics),), daemon=True).start()
 
+    def save_startup_metrics(self, metrics):
+        """Son açılış ölçümlerini startup_metrics.json'a ekler; ilk çizim süresi belirgin şekilde uzadıysa uyarır."""
+        try:
+            with open(STARTUP_METRICS_FILE, "r", encoding="utf-8") as f:
+                history = json.load(f)
+        except (OSError, ValueError):
+            history = []
+        previous = sorted(h['first_paint_ms'] for h in history if 'first_paint_ms' in h)
+        if len(previous) >= 3 and 'first_paint_ms' in metrics:
+            median = previous[len(previous) // 2]
+            if metrics['first_paint_ms'] > median * STARTUP_REGRESSION_FACTOR:
+                print(f"Uyarı: Açılış yavaşladı! İlk çizim {metrics['first_paint_ms']} ms (önceki medyan {median} ms)")
+        metrics['time'] = time.time()
+        history = (history + [metrics])[-STARTUP_METRICS_HISTORY:]
+        try:
+            atomic_write_json(STARTUP_METRICS_FILE, history, compact=False)
+        except Exception as e:
+            print("Açılış ölçümleri kaydedilemedi:", e)
 
     def on_theme_change(self, event):
         new_theme = self.theme_selector.get()
@@ -148,13 +2716,31 @@ class GameLauncher:
             with open("settings.json", "r", encoding="utf-8") as f:
                 settings = json.load(f)
             self.api_key = settings.get("api_key", "")
+            self.watch_libraries = bool(settings.get("watch_libraries", False))
+            self.list_view = dict(settings.get("list_view", {}))
+            self.cover_cache_mb = int(settings.get("cover_cache_mb", COVER_CACHE_DEFAULT_MB))
+            self.giantbomb_hourly_quota = int(settings.get("giantbomb_hourly_quota", GIANTBOMB_HOURLY_QUOTA))
+            self.giantbomb_burst = int(settings.get("giantbomb_burst", GIANTBOMB_BURST))
         except Exception:
             self.api_key = ""
+            self.watch_libraries = False
+            self.list_view = {}
+            self.cover_cache_mb = COVER_CACHE_DEFAULT_MB
+            self.giantbomb_hourly_quota = GIANTBOMB_HOURLY_QUOTA
+            self.giantbomb_burst = GIANTBOMB_BURST
+        # Liste görünümü: sıralama sütunu/yönü, launcher'a göre gruplama ve ek sütunlar.
+        self.list_view.setdefault("sort_column", None)
+        self.list_view.setdefault("descending", False)
+        self.list_view.setdefault("group_by_launcher", False)
+        self.list_view.setdefault("columns", [c for c, _, visible in LIST_COLUMNS if visible])
+
+    def settings_snapshot(self):
+        return {"api_key": self.api_key, "watch_libraries": self.watch_libraries, "list_view": self.list_view,
+                "cover_cache_mb": self.cover_cache_mb, "giantbomb_hourly_quota": self.giantbomb_hourly_quota,
+                "giantbomb_burst": self.giantbomb_burst}
 
     def save_settings(self):
-        settings = {"api_key": self.api_key}
-        with open("settings.json", "w", encoding="utf-8") as f:
-            json.dump(settings, f, indent=4, ensure_ascii=False)
+        self.persistence.mark_dirty('settings')
 
     def open_api_key_settings(self):
         settings_win = tb.Toplevel(self.root)
@@ -187,44 +2773,259 @@ class GameLauncher:
 
     
     #########################################
-    # Steam manifest'larından appid bilgisini alma
+    # Steam manifest indeksi (appmanifest_*.acf)
     #########################################
-    def get_steam_appid(self, manifest_dir, game_folder):
-        import glob, re
-        pattern = os.path.join(manifest_dir, "appmanifest_*.acf")
-        for manifest_file in glob.glob(pattern):
+    def get_steam_manifest_index(self, manifest_dir):
+        """
+        Kütüphanedeki tüm appmanifest_*.acf dosyalarını tek geçişte okuyup installdir (küçük harf) ->
+        {appid, name, installdir, size_on_disk, last_updated} indeksini döndürür.
+        Dosyalar mtime'a göre önbelleklenir; değişmeyen manifest tekrar parse edilmez.
+        """
+        index = {}
+        try:
+            entries = list(os.scandir(manifest_dir))
+        except OSError:
+            return index
+        for entry in entries:
+            lower = entry.name.lower()
+            if not (lower.startswith("appmanifest_") and lower.endswith(".acf")):
+                continue
             try:
-                with open(manifest_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                # Basit bir kontrol: "installdir" alanı game_folder ile eşleşiyor mu?
-                if f'"installdir"\t"{game_folder}"' in content or f'"installdir"    "{game_folder}"' in content:
-                    m = re.search(r'"appid"\s+"(\d+)"', content)
-                    if m:
-                        return m.group(1)
-            except Exception as e:
-                print("Error parsing manifest", manifest_file, e)
-        return None
+                mtime = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+            with self.steam_manifest_lock:
+                cached = self.steam_manifest_cache.get(entry.path)
+            if cached and cached[0] == mtime:
+                info = cached[1]
+            else:
+                with self.scan_profiler.phase('manifest'):
+                    info = self.parse_steam_manifest(entry.path)
+                with self.steam_manifest_lock:
+                    self.steam_manifest_cache[entry.path] = (mtime, info)
+            if info and info.get('installdir'):
+                index[info['installdir'].lower()] = info
+        return index
+
+    def parse_steam_manifest(self, manifest_file):
+        try:
+            with open(manifest_file, "r", encoding="utf-8", errors="replace") as f:
+                state = vdf_get(parse_vdf(f.read()), "AppState")
+            if not isinstance(state, dict):
+                return None
+
+            def as_int(value):
+                try:
+                    return int(value)
+                except (TypeError, ValueError):
+                    return None
+            return {
+                'appid': vdf_get(state, "appid"),
+                'name': vdf_get(state, "name"),
+                'installdir': vdf_get(state, "installdir"),
+                'size_on_disk': as_int(vdf_get(state, "SizeOnDisk")),
+                'last_updated': as_int(vdf_get(state, "LastUpdated"))
+            }
+        except Exception as e:
+            print("Error parsing manifest", manifest_file, e)
+            return None
+
+    def get_steam_appid(self, manifest_dir, game_folder):
+        info = self.get_steam_manifest_index(manifest_dir).get(game_folder.lower())
+        return info.get('appid') if info else None
+
+    def get_steam_library_paths(self, steam_path):
+        """libraryfolders.vdf içindeki tüm kütüphane yollarını (eski ve yeni format) döndürür."""
+        paths = [steam_path]
+        library_folders = os.path.join(steam_path, "steamapps", "libraryfolders.vdf")
+        with open(library_folders, 'r', encoding='utf-8') as f:
+            data = parse_vdf(f.read())
+        folders = vdf_get(data, "libraryfolders")
+        if isinstance(folders, dict):
+            for key, value in folders.items():
+                if isinstance(value, dict):
+                    path = vdf_get(value, "path")
+                elif key.isdigit():
+                    # Eski format: "1"  "D:\\SteamLibrary"
+                    path = value
+                else:
+                    path = None
+                if path and os.path.normcase(os.path.normpath(path)) not in {
+                        os.path.normcase(os.path.normpath(p)) for p in paths}:
+                    paths.append(path)
+        return paths
 
     #########################################
     # Scan Sonuçlarını Yükle / Kaydet
     #########################################
+    @property
+    def games(self):
+        """Kütüphanedeki oyunların anlık listesi (kopya). Değişiklikler self.library üzerinden yapılmalı."""
+        return self.library.snapshot()
+
+    @games.setter
+    def games(self, games):
+        self.library.replace_all(games)
+
     def load_scan_results(self):
         try:
-            with open("scan_results.json", "r", encoding="utf-8") as f:
-                self.games = json.load(f)
-            self.update_treeview(self.games)
+            # Açılışta sadece liste alanları yüklenir; açıklama/resim bilgisi seçimde (ensure_cold_loaded) gelir.
+            games = self.store.load_games(hot_only=True)
         except Exception as e:
             print("Scan sonuçları yüklenemedi:", e)
-            self.games = []
+            games = []
+        self.cold_loaded.clear()
+        self.library.replace_all(games, reason='load')
+
+    def persist_library_event(self, event, game, old_unique, reason):
+        """Kütüphane değişikliklerini veritabanına satır bazında yansıtır; toplu değişiklikler birleştirilerek yazılır."""
+        if event == 'reset':
+            if reason not in ('load', 'scan_progress'):
+                self.save_scan_results()
+                # Taramada artık bulunmayan oyunların kapakları bırakılır (başka oyun kullanmıyorsa silinir).
+                keys = self.library.keys()
+                for unique in [u for u in self.cover_store.snapshot()['games'] if u not in keys]:
+                    self.cover_store.release(unique)
+            return
+        try:
+            if event == 'remove' or (old_unique and old_unique != game['unique']):
+                self.store.delete_game(old_unique)
+                if event == 'remove':
+                    self.cover_store.release(old_unique)
+                else:
+                    self.cover_store.rename(old_unique, game['unique'])
+            if event != 'remove':
+                self.store.upsert_game(game)
+        except Exception as e:
+            print("Oyun kaydı güncellenirken hata:", e)
 
     def save_scan_results(self):
+        # Yazma, PersistenceService tarafından birleştirilerek arka planda yapılır.
+        self.persistence.mark_dirty('scan_results')
+
+    def ensure_cold_loaded(self, game):
+        """
+        Oyunun açıklama/resim bilgilerini (cold veri) gerekiyorsa veritabanından yükler. Bellekte en fazla
+        COLD_CACHE_SIZE oyunun açıklaması tutulur; eskiler bellekten atılır (veritabanında durur).
+        """
+        unique = game.get('unique')
+        if self.cold_loaded.get(unique) is game:
+            self.cold_loaded.move_to_end(unique)
+            return
+        try:
+            cold = self.store.load_metadata(unique)
+        except Exception as e:
+            print("Oyun bilgisi yüklenemedi:", e)
+            cold = {}
+        for field, value in cold.items():
+            # Kayıtlı dolu değer, bellekteki boş değerin (ör. taramadan gelen image='') önüne geçer.
+            if game.get(field) in (None, ''):
+                game[field] = value
+        self.cold_loaded[unique] = game
+        while len(self.cold_loaded) > COLD_CACHE_SIZE:
+            _, old_game = self.cold_loaded.popitem(last=False)
+            old_game.pop('giantbomb_info', None)
+
+    def save_game_metadata(self, game):
+        """Tek oyunun resim/GiantBomb bilgilerini, tüm listeyi yazmadan günceller."""
         try:
-            with open("scan_results.json", "w", encoding="utf-8") as f:
-                json.dump(self.games, f, indent=4, ensure_ascii=False)
+            self.store.upsert_metadata(game)
         except Exception as e:
-            print("Scan sonuçları kaydedilirken hata:", e)
+            print("Oyun bilgisi kaydedilirken hata:", e)
     
     
+    #########################################
+    # Artımlı Tarama İndeksi (scan_index.json)
+    #########################################
+    def load_scan_index(self):
+        with self.scan_index_lock:
+            if self.scan_index is not None:
+                return
+            try:
+                with open(SCAN_INDEX_FILE, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+                if index.get('version') != SCAN_INDEX_VERSION:
+                    raise ValueError("indeks sürümü uyumsuz")
+            except Exception:
+                index = {'version': SCAN_INDEX_VERSION, 'libraries': {}, 'folders': {}}
+            self.scan_index = index
+
+    def save_scan_index(self):
+        with self.scan_index_lock:
+            if self.scan_index is None:
+                return
+            # Uzun süredir görülmeyen (kaldırılmış) klasörleri indeksten atıyoruz.
+            cutoff = time.time() - SCAN_INDEX_MAX_AGE
+            for section in ('libraries', 'folders'):
+                entries = self.scan_index[section]
+                for path in [p for p, e in entries.items() if e.get('seen', 0) < cutoff]:
+                    del entries[path]
+            if self.library_roots:
+                self.scan_index['roots'] = {name: sorted(paths) for name, paths in self.library_roots.items()}
+            try:
+                atomic_write_json(SCAN_INDEX_FILE, self.scan_index)
+            except Exception as e:
+                print("Tarama indeksi kaydedilirken hata:", e)
+
+    def folder_fingerprint(self, path):
+        st = os.stat(path)
+        return [st.st_mtime_ns, st.st_ino]
+
+    def list_library(self, library_path):
+        """Kütüphane klasörünün içeriğini döndürür; klasör değişmediyse önceki listeyi kullanır."""
+        self.load_scan_index()
+        with self.scan_profiler.phase('listing'):
+            fingerprint = self.folder_fingerprint(library_path)
+            with self.scan_index_lock:
+                cached = self.scan_index['libraries'].get(library_path)
+                if cached and cached['fp'] == fingerprint:
+                    cached['seen'] = time.time()
+                    return list(cached['entries'])
+            entries = os.listdir(library_path)
+        with self.scan_index_lock:
+            self.scan_index['libraries'][library_path] = {'fp': fingerprint, 'entries': entries, 'seen': time.time()}
+        return entries
+
+    def resolve_game_folder(self, game_path):
+        """
+        Oyun klasörü için (exe, resim) döndürür. Klasörün mtime/inode bilgisi indeksteki ile aynıysa
+        find_exe/find_game_image tekrar çalıştırılmaz, kayıtlı sonuç kullanılır.
+        """
+        self.load_scan_index()
+        try:
+            fingerprint = self.folder_fingerprint(game_path)
+        except OSError:
+            return None, ""
+        with self.scan_index_lock:
+            cached = self.scan_index['folders'].get(game_path)
+        # exe'si bulunamamış kayıt kısa süre geçerlidir: yerinde kurulumda exe sonradan alt klasöre
+        # (ör. Binaries/Win64) düşer ve üst klasörün mtime'ı değişmez.
+        if cached and cached['fp'] == fingerprint and (
+                os.path.exists(cached['exe']) if cached['exe'] is not None
+                else time.time() - cached.get('checked', 0) < SCAN_INDEX_MISS_TTL):
+            cached['seen'] = time.time()
+            self.scan_profiler.count('index_hits')
+            return cached['exe'], cached['image']
+        self.scan_profiler.count('index_misses')
+        exe = None
+        if cached is None:
+            # İndekste hiç yoksa kütüphanedeki exe korunur; puanlama farklı exe seçip oyunu yeniden anahtarlamasın.
+            if self.known_exes is None:
+                self.known_exes = self.load_known_exes()
+            known = self.known_exes.get(os.path.normcase(os.path.normpath(game_path)))
+            if known and os.path.isfile(known):
+                exe = known
+                self.scan_profiler.count('known_exe_reused')
+        if exe is None:
+            with self.scan_profiler.phase('find_exe'):
+                exe = self.find_exe(game_path)
+        image = (self.find_game_image(exe) or "") if exe else ""
+        with self.scan_index_lock:
+            now = time.time()
+            self.scan_index['folders'][game_path] = {'fp': fingerprint, 'exe': exe, 'image': image,
+                                                     'seen': now, 'checked': now}
+        return exe, image
+
     def on_closing(self):
         """
         Pencerenin kapatılma (X) butonuna basıldığında, uygulama gizlenir ve sistem tepsisine yerleştirilir.
@@ -232,6 +3033,8 @@ class GameLauncher:
         self.root.withdraw()
         if not hasattr(self, 'tray_icon'):
             try:
+                import pystray  # Sistem tepsisi için
+                from PIL import Image, ImageOps
                 if os.path.exists("game.ico"):
                     icon_image = Image.open("game.ico")
                 else:
@@ -258,14 +3061,29 @@ class GameLauncher:
         """Sistem tepsisindeki 'Çıkış' seçeneği tıklandığında uygulamayı tamamen kapatır."""
         if hasattr(self, 'tray_icon'):
             self.tray_icon.stop()
+        self.persistence.close()
+        if self.print_stats:
+            self.print_runtime_stats()
         self.root.destroy()
 
     def full_exit(self):
         """Uygulama içindeki 'Tamamen Kapat' seçeneği çağrıldığında çalışır."""
         if hasattr(self, 'tray_icon'):
             self.tray_icon.stop()
+        self.persistence.close()
+        if self.print_stats:
+            self.print_runtime_stats()
         self.root.destroy()
 
+    def print_runtime_stats(self):
+        """Önbellek, ağ ve kuyruk sayaçlarını yazdırır (--stats ile açılınca çıkışta çağrılır)."""
+        print("Önizleme istatistikleri:", self.preview_pipeline.stats)
+        print("Birleştirilen istekler:", self.single_flight.stats)
+        print("HTTP istatistikleri:", self.http.stats())
+        print("GiantBomb önbelleği:", self.api_cache_stats)
+        print("GiantBomb kotası:", self.giantbomb_limiter.status())
+        print("Kapak kuyruğu:", self.prefetch_scheduler.queue_depth(), "bekleyen,", self.prefetch_scheduler.stats)
+
     #########################################
     # Arayüz Oluşturma
     #########################################
@@ -294,16 +3112,37 @@ class GameLauncher:
         self.root.config(menu=menu_bar)
         settings_menu = tb.Menu(menu_bar, tearoff=0)
         settings_menu.add_command(label="API Key Ayarları", command=self.open_api_key_settings)
+        self.watch_var = tb.BooleanVar(value=self.watch_libraries)
+        settings_menu.add_checkbutton(label="Kütüphaneleri Canlı İzle", variable=self.watch_var,
+                                      command=self.toggle_library_watch)
+        settings_menu.add_command(label="Resim Önbelleğini Temizle", command=self.clean_image_cache)
         settings_menu.add_command(label="Tamamen Kapat", command=self.full_exit)
         menu_bar.add_cascade(label="Ayarlar", menu=settings_menu)
 
-        # Sol tarafta: Treeview (oyun listesi)
-        self.tree = ttk.Treeview(self.left_frame, columns=('Name', 'Launcher', 'Path'), show='headings')
-        self.tree.heading('Name', text='Oyun Adı')
-        self.tree.heading('Launcher', text='Launcher')
-        self.tree.heading('Path', text='Yol')
-        self.tree.pack(fill='both', expand=True, padx=5, pady=5)
-        self.tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+        view_menu = tb.Menu(menu_bar, tearoff=0)
+        self.column_vars = {}
+        for column, heading, _ in LIST_COLUMNS[3:]:
+            self.column_vars[column] = tb.BooleanVar(value=column in self.list_view["columns"])
+            view_menu.add_checkbutton(label=f"{heading} Sütunu", variable=self.column_vars[column],
+                                      command=self.apply_list_columns)
+        view_menu.add_separator()
+        self.group_var = tb.BooleanVar(value=self.list_view["group_by_launcher"])
+        view_menu.add_checkbutton(label="Launcher'a Göre Grupla", variable=self.group_var,
+                                  command=self.toggle_group_by_launcher)
+        menu_bar.add_cascade(label="Görünüm", menu=view_menu)
+
+        # Sol tarafta: Sanal liste (sadece görünen satırlar Treeview'e konur)
+        self.game_list = VirtualGameList(
+            self.left_frame, [c for c, _, _ in LIST_COLUMNS], [h for _, h, _ in LIST_COLUMNS],
+            row_values=self.row_values,
+            on_select=self.on_tree_select,
+            on_viewport=lambda uniques: self.prefetch_scheduler.set_visible(uniques),
+        )
+        for column, _, _ in LIST_COLUMNS:
+            self.game_list.tree.heading(column, command=lambda c=column: self.sort_by_column(c))
+        self.apply_list_columns(refresh=False)
+        self.update_sort_headings()
+        self.game_list.frame.pack(fill='both', expand=True, padx=5, pady=5)
 
         btn_frame = ttk.Frame(self.left_frame)
         btn_frame.pack(pady=10)
@@ -328,6 +3167,7 @@ class GameLauncher:
         preview_label.pack(pady=10)
 
         self.preview_canvas = tb.Canvas(self.right_frame, width=400, height=300, background='#343a40', bd=0, highlightthickness=0)
+        self.preview_pipeline = PreviewPipeline(lambda fn: self.root.after(0, fn), self.http)
         self.preview_canvas.pack(pady=10, anchor="n")
 
         self.info_label = ttk.Label(self.right_frame, text="", wraplength=380, justify="left")
@@ -339,16 +3179,122 @@ class GameLauncher:
     
     def on_search(self, event):
         """
-        Arama çubuğuna girilen metne göre, self.all_games (tam liste) üzerinden filtreleme yapar.
+        Arama çubuğuna yazıldıkça aramayı erteler; sadece yazma durunca bir kez çalışır.
         """
-        query = self.search_var.get().lower()
-        if query:
-            filtered = [g for g in self.all_games if query in g.get('name', '').lower()]
+        if self.search_after_id is not None:
+            self.root.after_cancel(self.search_after_id)
+        self.search_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.run_search)
+
+    def run_search(self):
+        self.search_after_id = None
+        self.game_list.set_rows(self.visible_games(), scroll_to_top=True)
+
+    def search_query(self):
+        return self.search_var.get().strip() if hasattr(self, 'search_var') else ""
+
+    def visible_games(self):
+        """Aramaya uyan oyunlar ya da tüm kütüphane; seçili sıralama ve gruplama uygulanmış olarak."""
+        query = self.search_query()
+        games = self.search_index.search(query) if query else self.library.snapshot()
+        view = self.list_view
+        games = self.library.sorted_games(games, view["sort_column"], view["descending"], view["group_by_launcher"])
+        if view["group_by_launcher"]:
+            games = self.with_group_rows(games)
+        return games
+
+    def list_is_arranged(self):
+        """Liste kütüphane sırasından farklı mı (arama, sıralama ya da gruplama açık)?"""
+        return bool(self.search_query() or self.list_view["sort_column"] or self.list_view["group_by_launcher"])
+
+    #########################################
+    # Liste Sütunları, Sıralama ve Gruplama
+    #########################################
+    def row_values(self, game):
+        if game.get('is_group'):
+            return (game['name'],) + ('',) * (len(LIST_COLUMNS) - 1)
+        size = game.get('size_on_disk')
+        last_played = game.get('launch_time')
+        return (
+            game['name'],
+            game.get('launcher', ''),
+            game['path'],
+            f"{int(size) / 1024 ** 3:.1f} GB" if size else "",
+            time.strftime("%Y-%m-%d %H:%M", time.localtime(last_played)) if last_played else "",
+            game.get('play_count', 0) or "",
+        )
+
+    def with_group_rows(self, games):
+        """Launcher'a göre sıralanmış listeye her grubun başına seçilemeyen bir başlık satırı ekler."""
+        counts = collections.Counter(game.get('launcher', '') for game in games)
+        result, current = [], None
+        for game in games:
+            launcher_name = game.get('launcher', '')
+            if launcher_name != current:
+                current = launcher_name
+                result.append({'unique': f"group::{launcher_name}", 'is_group': True,
+                               'name': f"▾ {launcher_name or 'Diğer'} ({counts[launcher_name]})",
+                               'launcher': launcher_name, 'path': ''})
+            result.append(game)
+        return result
+
+    def apply_list_columns(self, refresh=True):
+        columns = self.list_view["columns"]
+        for column, var in self.column_vars.items():
+            if var.get() and column not in columns:
+                columns.append(column)
+            elif not var.get() and column in columns:
+                columns.remove(column)
+        self.game_list.tree.configure(displaycolumns=[c for c, _, _ in LIST_COLUMNS if c in self.list_view["columns"]])
+        if refresh:
+            self.save_settings()
+
+    def sort_by_column(self, column):
+        """Başlığa tıklanınca o sütuna göre sıralar; aynı başlığa tekrar tıklamak yönü çevirir."""
+        view = self.list_view
+        if view["sort_column"] == column:
+            view["descending"] = not view["descending"]
         else:
-            filtered = self.all_games
-        self.tree.delete(*self.tree.get_children())
-        for game in filtered:
-            self.tree.insert('', 'end', iid=game['unique'], values=(game['name'], game.get('launcher', ''), game['path']))
+            view["sort_column"], view["descending"] = column, column in ('Size', 'LastPlayed', 'PlayCount')
+        self.update_sort_headings()
+        self.save_settings()
+        self.update_treeview()
+
+    def update_sort_headings(self):
+        view = self.list_view
+        for name, heading, _ in LIST_COLUMNS:
+            arrow = (" ▼" if view["descending"] else " ▲") if name == view["sort_column"] else ""
+            self.game_list.tree.heading(name, text=heading + arrow)
+
+    def toggle_group_by_launcher(self):
+        self.list_view["group_by_launcher"] = self.group_var.get()
+        self.save_settings()
+        self.update_treeview()
+
+    def schedule_list_refresh(self):
+        # Sıralı/gruplu/aramalı listede değişen kayıt yerini değiştirebilir; toplu olarak yeniden dizilir.
+        if self.list_refresh_after_id is None:
+            self.list_refresh_after_id = self.root.after(SEARCH_DEBOUNCE_MS, self.run_list_refresh)
+
+    def run_list_refresh(self):
+        self.list_refresh_after_id = None
+        self.update_treeview()
+
+    def on_library_event(self, event, game, old_unique, reason):
+        """Kütüphane değişikliklerini listeye sadece ilgili satırlar olarak uygular."""
+        if event == 'reset':
+            self.update_treeview()
+            return
+        if old_unique and (event == 'remove' or old_unique != game['unique']):
+            self.game_list.remove(old_unique)
+            # Silinen oyunun bekleyen kapak işi iptal edilir.
+            self.prefetch_scheduler.cancel(old_unique)
+        if event == 'remove':
+            return
+        if self.list_is_arranged():
+            self.game_list.update(game)
+            self.schedule_list_refresh()
+        elif not self.game_list.update(game):
+            self.game_list.insert(game)
     
     #########################################
     # Yenileme (Refresh) Metodu - Değişiklikleri saklama/sıfırlama sorusu ekleniyor.
@@ -358,71 +3304,54 @@ class GameLauncher:
             self.save_manual_games()
         else:
             self.load_manual_games()
+        # Launcher'lar kurulmuş/kaldırılmış olabilir; konumları yeniden çözülsün.
+        self.locator.invalidate()
+        self.clients = self.locator.clients()
         self.threaded_scan_games()
 
     #########################################
     # Treeview Seçiminde Önizleme Güncelleme
     #########################################
-    def on_tree_select(self, event):
-        selected = self.tree.selection()
-        if not selected:
+    def on_tree_select(self, row=None):
+        unique_id = self.selected_unique()
+        if not unique_id:
             return
-        unique_id = selected[0]
         game = self.get_game_by_unique(unique_id)
         if game:
             self.update_preview(game)
 
+    def selected_unique(self):
+        """Seçili oyunun unique'i; liste sanal olduğu için Treeview seçimi yerine bu kullanılır."""
+        return self.game_list.selected_unique()
+
     def get_game_by_unique(self, unique):
-        for game in self.games:
-            if game.get('unique') == unique:
-                return game
-        return None
+        return self.library.get(unique)
 
     #########################################
     # Önizleme Güncelleme: Resim ve GiantBomb Bilgileri
     #########################################
     def update_preview(self, game):
+        self.ensure_cold_loaded(game)
         self.preview_canvas.delete("all")
         # Önce resmi güncelleyelim:
         image_path = game.get('image', '')
 
-        if (not image_path) and not game.get('image_attempted', False):
-            self.preview_canvas.create_text(200, 150, text="Yükleniyor...", fill="white", font=('Segoe UI', 16))
-            threading.Thread(
-                target=lambda: (
-                    self.prefetch_image_for_game(game),
-                    self.root.after(0, lambda: self.update_preview(game))
-                ),
-                daemon=True
-            ).start()
+        # Boş yol + image_attempted, eski sürümlerin taramada bozduğu kayıtlardır; onlar da yeniden istenir.
+        if not image_path and game.get('next_request_time', 0) <= time.time():
+            self.preview_pipeline.cancel()
+            self.show_preview_text("Yükleniyor...")
+            # Seçili oyunun kapağı kuyrukta en öne alınır; bitince önizleme yenilenir.
+            self.prefetch_scheduler.submit(game['unique'], PRIORITY_SELECTED)
             return
 
-        if image_path == "not_found":
-            self.preview_canvas.create_text(200, 150, text="Resim Yok", fill="white", font=('Segoe UI', 16))
+        if image_path in ("", "not_found"):
+            self.preview_pipeline.cancel()
+            self.show_preview_text("Resim Yok")
         else:
-            try:
-                if image_path.startswith("http"):
-                    response = requests.get(image_path, timeout=5)
-                    if response.status_code == 200:
-                        img_data = BytesIO(response.content)
-                        img = Image.open(img_data)
-                    else:
-                        print(f"HTTP Hatası {response.status_code} URL: {image_path}")
-                        img = None
-                else:
-                    if os.path.exists(image_path):
-                        img = Image.open(image_path)
-                    else:
-                        img = None
-                if img:
-                    img.thumbnail((400, 300))
-                    self.preview_image = ImageTk.PhotoImage(img)
-                    self.preview_canvas.create_image(200, 150, image=self.preview_image)
-                else:
-                    self.preview_canvas.create_text(200, 150, text="Resim Yok", fill="white", font=('Segoe UI', 16))
-            except Exception as e:
-                print(f"Önizleme resmi yüklenirken hata: {str(e)}")
-                self.preview_canvas.create_text(200, 150, text="Resim Yok", fill="white", font=('Segoe UI', 16))
+            # Çözme/küçültme arka planda; hazır resim LRU'dan gelirse hemen çizilir.
+            self.show_preview_text("Yükleniyor...")
+            self.cover_store.touch(image_path)
+            self.preview_pipeline.request(image_path, lambda photo: self.paint_preview(game['unique'], photo))
 
         # GiantBomb bilgilerini güncelleyelim:
         if game.get("giantbomb_info"):
@@ -444,6 +3373,21 @@ class GameLauncher:
         self.current_monitored_game = game['unique']
         self.monitor_game_status(game)
 
+    def show_preview_text(self, text):
+        self.preview_canvas.delete("all")
+        self.preview_canvas.create_text(200, 150, text=text, fill="white", font=('Segoe UI', 16))
+
+    def paint_preview(self, unique, photo):
+        # Bu arada seçim değiştiyse eski oyunun resmi çizilmez.
+        if self.selected_unique() != unique:
+            return
+        if photo is None:
+            self.show_preview_text("Resim Yok")
+            return
+        self.preview_canvas.delete("all")
+        self.preview_image = photo
+        self.preview_canvas.create_image(200, 150, image=self.preview_image)
+
     #########################################
     # GiantBomb API ile Oyun Bilgisi Çekme
     #########################################
@@ -452,32 +3396,83 @@ class GameLauncher:
         if not self.api_key:
             game["giantbomb_info"] = "API key girilmedi. Resim ve açıklama alınmayacak."
             return
+        # Aynı oyun için devam eden bir sorgu varsa onun sonucunu kullanıyoruz.
+        result = self.single_flight.do((game['unique'], 'info'), lambda: self.download_giantbomb_info(game))
+        if result is not None and result is not game and result.get("giantbomb_info"):
+            game["giantbomb_info"] = result["giantbomb_info"]
+
+    def download_giantbomb_info(self, game):
         try:
-            url = "https://www.giantbomb.com/api/search/"
-            params = {
-                "api_key": self.api_key,
-                "format": "json",
-                "query": game.get("name", ""),
-                "resources": "game",
-                "limit": 1
-            }
-            headers = {"User-Agent": "GameLauncher/1.0"}
-            response = requests.get(url, params=params, headers=headers, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get("results", [])
-                if results and len(results) > 0:
-                    result = results[0]
-                    deck = result.get("deck", "Açıklama yok.")
-                    release_date = result.get("original_release_date", "Bilinmiyor")
-                    detail_url = result.get("site_detail_url", "")
-                    info_text = f"{deck}\nÇıkış Tarihi: {release_date}\nDetaylar: {detail_url}"
-                    game["giantbomb_info"] = info_text
-                    self.save_scan_results()
-            else:
-                print("HTTP Hatası", response.status_code, "giantbomb info aranırken", game.get("name", ""))
+            # Açıklama sadece oyun seçilince istenir; kullanıcı beklediği için ayrılmış kotadan yararlanır.
+            result = self.giantbomb_search(game.get("name", ""), interactive=True)
+            if result:
+                deck = result.get("deck", "Açıklama yok.")
+                release_date = result.get("original_release_date", "Bilinmiyor")
+                detail_url = result.get("site_detail_url", "")
+                info_text = f"{deck}\nÇıkış Tarihi: {release_date}\nDetaylar: {detail_url}"
+                game["giantbomb_info"] = info_text
+                self.save_game_metadata(game)
         except Exception as e:
             print(f"Error fetching giantbomb info for {game.get('name', '')}: {str(e)}")
+        return game
+
+    def giantbomb_search(self, game_name, interactive=False):
+        """
+        Oyun adı için GiantBomb'daki ilk sonucu tüm alanlarıyla döndürür (bulunamazsa None). Açıklama ve kapak
+        aynı yanıttan okunur; aynı isim için eşzamanlı aramalar birleştirilir ve yanıt kalıcı önbellekte tutulur.
+        interactive=True, kullanıcının beklediği istekler içindir (kotanın ayrılmış kısmını kullanabilir).
+        """
+        key = f"giantbomb:search:{normalize_game_name(game_name)}"
+        return self.single_flight.do(('giantbomb', key),
+                                     lambda: self.cached_giantbomb_search(key, game_name, interactive))
+
+    def cached_giantbomb_search(self, key, game_name, interactive=False):
+        stats = self.api_cache_stats
+        cached = self.store.get_api_cache(key)
+        if cached is not None:
+            ttl = GIANTBOMB_CACHE_TTL if cached['body'] else GIANTBOMB_MISS_TTL
+            if time.time() - cached['fetched_at'] < ttl:
+                stats['hits'] += 1
+                return cached['body']
+        # Süresi dolmuş kayıt varsa sunucuya "değiştiyse gönder" diye soruyoruz.
+        headers = {}
+        if cached is not None and cached['etag']:
+            headers["If-None-Match"] = cached['etag']
+        if cached is not None and cached['last_modified']:
+            headers["If-Modified-Since"] = cached['last_modified']
+        params = {
+            "api_key": self.api_key,
+            "format": "json",
+            "query": game_name,
+            "resources": "game",
+            "limit": 1
+        }
+        wait = self.giantbomb_limiter.acquire(interactive=interactive)
+        if wait > 1:
+            print(f"GiantBomb kotası: {wait:.1f} sn beklendi ({game_name}), kalan: {self.giantbomb_limiter.status()['remaining']}")
+        try:
+            response = self.http.get(GIANTBOMB_SEARCH_URL, params=params, headers=headers)
+        except Exception as e:
+            if cached is None:
+                raise
+            print(f"GiantBomb'a ulaşılamadı, önbellekteki yanıt kullanılıyor ({game_name}):", e)
+            stats['stale'] += 1
+            return cached['body']
+        if response.status_code == 304 and cached is not None:
+            self.store.touch_api_cache(key)
+            stats['revalidated'] += 1
+            return cached['body']
+        if response.status_code != 200:
+            print("HTTP Hatası", response.status_code, "GiantBomb'da aranırken", game_name)
+            if cached is not None:
+                stats['stale'] += 1
+                return cached['body']
+            return None
+        results = response.json().get("results") or []
+        result = results[0] if results else None
+        self.store.put_api_cache(key, result, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        stats['misses'] += 1
+        return result
 
     def sanitize_filename(self, filename):
         invalid_chars = '<>:"/\\|?*'
@@ -492,39 +3487,59 @@ class GameLauncher:
         cache_folder = "image_cache"
         if not os.path.exists(cache_folder):
             os.makedirs(cache_folder)
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            futures = []
-            for game in self.games:
-                if game.get('source') == "manual" and game.get('image'):
-                    continue
-                image_path = game.get('image', '')
-                if image_path and image_path.startswith(cache_folder) and os.path.exists(image_path):
-                    continue
-                futures.append(executor.submit(self.fetch_and_save_image, game, cache_folder))
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    print(f"Error prefetching image: {str(e)}")
+        # Karar için sadece resim durum alanları gerekiyor; açıklamalar belleğe alınmıyor.
+        try:
+            image_state = self.store.load_metadata_fields(('image', 'image_attempted', 'next_request_time'))
+        except Exception as e:
+            print("Resim bilgileri yüklenemedi:", e)
+            image_state = {}
+        # İşler öncelik kuyruğuna konur; seçilen ve ekrandaki oyunlar kuyrukta öne geçer.
+        for game in list(self.games):
+            for field, value in image_state.get(game.get('unique'), {}).items():
+                game.setdefault(field, value)
+            if game.get('source') == "manual" and game.get('image'):
+                continue
+            image_path = game.get('image', '')
+            if image_path and image_path.startswith(COVER_FOLDER) and os.path.exists(image_path):
+                continue
+            priority = PRIORITY_RECENT if game.get('launch_time') else PRIORITY_BACKGROUND
+            self.prefetch_scheduler.submit(game['unique'], priority)
 
-    def fetch_and_save_image(self, game, cache_folder):
+    def prefetch_worker(self, unique, priority=PRIORITY_BACKGROUND):
+        game = self.library.get(unique)
+        if game is not None:
+            self.fetch_and_save_image(game, "image_cache", interactive=priority == PRIORITY_SELECTED)
+
+    def fetch_and_save_image(self, game, cache_folder, interactive=False):
+        self.fetch_cover(game, interactive)
+        # Seçili oyunsa önizleme yenilenir (bulunamadıysa "Resim Yok" gösterilir).
+        if game.get('image_attempted') and self.selected_unique() == game['unique']:
+            self.root.after(0, lambda: self.update_preview(game))
+
+    def fetch_cover(self, game, interactive=False):
+        """
+        Oyunun kapağını indirir. Aynı oyun için önizleme, önbellekleme ve 'Resmi Sıfırla' aynı anda
+        isterse tek indirme yapılır; sonradan gelenler onun sonucunu kendi kayıtlarına kopyalar.
+        """
         if game.get('next_request_time', 0) > time.time():
             return
-        fetched_url = self.fetch_game_image_from_internet(game.get('name', ''))
+        result = self.single_flight.do((game['unique'], 'image'), lambda: self.download_cover(game, interactive))
+        if result is not None and result is not game:
+            for field in ('image', 'image_attempted', 'next_request_time'):
+                if field in result:
+                    game[field] = result[field]
+
+    def download_cover(self, game, interactive=False):
+        fetched_url = self.fetch_game_image_from_internet(game.get('name', ''), interactive)
         if fetched_url:
             try:
-                response = requests.get(fetched_url, timeout=5)
-                if response.status_code == 200:
-                    local_filename = self.sanitize_filename(f"{game['unique']}.jpg")
-                    local_path = os.path.join(cache_folder, local_filename)
-                    with open(local_path, "wb") as f:
-                        f.write(response.content)
-                    game['image'] = local_path
+                # Resim belleğe alınmadan doğrudan depo klasörüne akıtılır.
+                status, temp_path, digest, size = self.http.download(fetched_url, self.cover_store.temp_file)
+                if temp_path:
+                    game['image'] = self.cover_store.put_file(game['unique'], temp_path, digest, size)
                     game['image_attempted'] = True
-                    if self.tree.selection() and self.tree.selection()[0] == game['unique']:
-                        self.root.after(0, lambda: self.update_preview(game))
                 else:
-                    print(f"HTTP Hatası {response.status_code} indirirken {game.get('name', '')}")
+                    print(f"HTTP Hatası {status} indirirken {game.get('name', '')}")
                     game['image'] = "not_found"
                     game['image_attempted'] = True
                     game['next_request_time'] = time.time() + 30
@@ -537,89 +3552,85 @@ class GameLauncher:
             game['image'] = "not_found"
             game['image_attempted'] = True
             game['next_request_time'] = time.time() + 30
+        self.save_game_metadata(game)
+        return game
     # GiantBomb API'den resim URL'si almak için metot:
     #########################################
     # GiantBomb API ile Oyun Resmi Çekme
     #########################################
-    def fetch_game_image_from_internet(self, game_name):
+    def fetch_game_image_from_internet(self, game_name, interactive=False):
         # API key girilmemişse, resim getirilmeyecek.
         if not self.api_key:
             return None
         try:
-            url = "https://www.giantbomb.com/api/search/"
-            params = {
-                "api_key": self.api_key,
-                "format": "json",
-                "query": game_name,
-                "resources": "game",
-                "limit": 1
-            }
-            headers = {"User-Agent": "GameLauncher/1.0"}
-            response = requests.get(url, params=params, headers=headers, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                results = data.get("results", [])
-                if results and len(results) > 0:
-                    image_info = results[0].get("image", {})
-                    image_url = image_info.get("medium_url")
-                    return image_url
-            else:
-                print("HTTP Hatası", response.status_code, "oyun resmi aranırken", game_name)
+            result = self.giantbomb_search(game_name, interactive)
+            if result:
+                return (result.get("image") or {}).get("medium_url")
         except Exception as e:
             print(f"Error fetching image for {game_name}: {str(e)}")
         return None
 
+    #########################################
+    # Kapak Deposu Bakımı
+    #########################################
+    def collect_image_garbage(self):
+        """Eski sürümün kapaklarını depoya taşır, sonra kimsenin kullanmadığı dosyaları siler."""
+        try:
+            image_state = self.store.load_metadata_fields(('image',))
+        except Exception as e:
+            print("Resim bilgileri yüklenemedi:", e)
+            return 0, 0
+        legacy_folder = os.path.abspath(COVER_FOLDER)
+        referenced = []
+        for unique, state in image_state.items():
+            path = state.get('image') or ''
+            if path and os.path.dirname(os.path.abspath(path)) == legacy_folder and os.path.isfile(path):
+                try:
+                    path = self.cover_store.adopt(unique, path)
+                    game = self.library.get(unique) or {'unique': unique}
+                    game['image'] = path
+                    self.save_game_metadata(game)
+                except Exception as e:
+                    print(f"Eski kapak taşınamadı ({path}):", e)
+            referenced.append(path)
+        # Elle verilen resimler başka klasörlerde olabilir; kütüphanedeki yollar da korunur.
+        referenced.extend(game.get('image', '') for game in self.library.snapshot())
+        # Kütüphanede ve veritabanında kaydı kalmamış oyunların kapak bağlantıları da bırakılır.
+        live = set(image_state) | self.library.keys()
+        removed, freed = self.cover_store.gc(referenced, live)
+        if removed:
+            print(f"Resim önbelleği: {removed} dosya silindi, {freed / 1024 ** 2:.1f} MB boşaldı.")
+        return removed, freed
 
+    def clean_image_cache(self):
+        def task():
+            removed, freed = self.collect_image_garbage()
+            self.root.after(0, lambda: messagebox.showinfo(
+                "Resim Önbelleği", f"{removed} dosya silindi, {freed / 1024 ** 2:.1f} MB boşaldı."))
+        threading.Thread(target=task, daemon=True).start()
 
-    def prefetch_image_for_game(self, game):
-        cache_folder = "image_cache"
-        if not os.path.exists(cache_folder):
-            os.makedirs(cache_folder)
-        if game.get('next_request_time', 0) > time.time():
-            return
-        fetched_url = self.fetch_game_image_from_internet(game.get('name', ''))
-        if fetched_url:
-            try:
-                response = requests.get(fetched_url, timeout=5)
-                if response.status_code == 200:
-                    local_filename = self.sanitize_filename(f"{game['unique']}.jpg")
-                    local_path = os.path.join(cache_folder, local_filename)
-                    with open(local_path, "wb") as f:
-                        f.write(response.content)
-                    game['image'] = local_path
-                    game['image_attempted'] = True
-                else:
-                    print(f"HTTP Hatası {response.status_code} indirirken {game.get('name', '')}")
-                    game['image'] = "not_found"
-                    game['image_attempted'] = True
-                    game['next_request_time'] = time.time() + 30
-            except Exception as e:
-                print(f"Error downloading image for {game.get('name', '')}: {str(e)}")
-                game['image'] = "not_found"
-                game['image_attempted'] = True
-                game['next_request_time'] = time.time() + 30
-        else:
-            game['image'] = "not_found"
-            game['image_attempted'] = True
-            game['next_request_time'] = time.time() + 30
+    def on_covers_evicted(self, uniques):
+        # Boyut sınırı yüzünden kapağı silinen oyunlar seçildiğinde resim yeniden indirilir.
+        for unique in uniques:
+            game = self.library.get(unique)
+            if game is None:
+                continue
+            game['image'] = ""
+            game['image_attempted'] = False
+            self.save_game_metadata(game)
 
     #########################################
     # "Resmi Sıfırla" fonksiyonu, Düzenleme penceresinde kullanılacak
     #########################################
     def reset_image_in_edit(self, game, image_entry):
+        self.cover_store.release(game['unique'])
+        # Kayıttaki eski yol ve deneme bilgisi de sıfırlanır; yoksa sonraki yüklemede geri gelir.
         game['image'] = ""
-        if 'next_request_time' in game:
-            del game['next_request_time']
-        if 'image_attempted' in game:
-            del game['image_attempted']
+        game['image_attempted'] = False
+        game['next_request_time'] = 0
+        self.save_game_metadata(game)
         image_entry.delete(0, 'end')
-        threading.Thread(
-            target=lambda: (
-                self.prefetch_image_for_game(game),
-                self.root.after(0, lambda: self.update_preview(game))
-            ),
-            daemon=True
-        ).start()
+        self.prefetch_scheduler.submit(game['unique'], PRIORITY_SELECTED)
 
     #########################################
     # Oyun Tarama ve UI Güncelleme (Arka Planda)
@@ -633,22 +3644,129 @@ class GameLauncher:
             counter += 1
         return unique
 
-    def scan_games_thread(self):
+    def scan_games_thread(self, on_progress=None):
+        """
+        Tüm launcher tarayıcılarını paralel çalıştırır. Her launcher'ın kendi zaman aşımı vardır;
+        biten her launcher'ın oyunları, on_progress verilmişse, birleştirilmiş ara liste ve taraması süren
+        launcher'lar olarak hemen bildirilir: on_progress(ara_liste, bekleyenler).
+        """
         scanned_games = []
         used_keys = set()
-        for launcher_name, scanner in self.launchers.items():
+        results = queue.Queue()
+        # Oynama bilgileri taramada bulunmaz; ara listeler kütüphaneyi değiştirmeden önce bir kez alınır.
+        self.previous_play_stats = self.load_play_stats()
+        self.known_exes = self.load_known_exes()
+        self.load_scan_index()
+        self.library_roots = {}
+        self.scan_profiler.reset()
+        self.scan_timings = {}
+
+        def run_scanner(launcher_name, scanner):
+            self.scan_profiler.set_launcher(launcher_name)
+            start = time.perf_counter()
             try:
                 games = scanner()
-                for game in games:
-                    game['launcher'] = launcher_name
-                    game['source'] = 'scanned'
-                    game['unique'] = self.generate_unique_key(launcher_name, game['path'], used_keys)
-                    used_keys.add(game['unique'])
-                scanned_games.extend(games)
+                error = None
             except Exception as e:
-                err = f"{launcher_name} tarama hatası: {str(e)}"
+                games = []
+                error = e
+            results.put((launcher_name, games, error, time.perf_counter() - start))
+
+        started = time.perf_counter()
+        deadlines = {}
+        for launcher_name, scanner in self.launchers.items():
+            deadlines[launcher_name] = started + self.scan_timeouts.get(launcher_name, self.default_scan_timeout)
+            threading.Thread(target=run_scanner, args=(launcher_name, scanner), daemon=True).start()
+
+        pending = set(self.launchers)
+        while pending:
+            wait = max(0.0, min(deadlines[name] for name in pending) - time.perf_counter())
+            try:
+                launcher_name, games, error, duration = results.get(timeout=wait)
+            except queue.Empty:
+                # Süresi dolan launcher'ları bırakıyoruz; thread'leri daemon olduğu için arka planda sönecekler.
+                now = time.perf_counter()
+                for name in [n for n in pending if deadlines[n] <= now]:
+                    pending.discard(name)
+                    self.scan_timings[name] = now - started
+                    err = f"{name} tarama hatası: zaman aşımı ({self.scan_timeouts.get(name, self.default_scan_timeout)} sn)"
+                    self.error_logs.append(err)
+                    print(err)
+                continue
+            if launcher_name not in pending:
+                # Zaman aşımından sonra gelen sonuçları yok sayıyoruz.
+                continue
+            pending.discard(launcher_name)
+            self.scan_timings[launcher_name] = duration
+            if error is not None:
+                err = f"{launcher_name} tarama hatası: {str(error)}"
                 self.error_logs.append(err)
                 print(err)
+                continue
+            self.tag_scanned_games(launcher_name, games, used_keys)
+            scanned_games.extend(games)
+            if on_progress and pending:
+                on_progress(self.merge_with_manual_games(scanned_games), set(pending))
+        self.save_scan_index()
+        return self.merge_with_manual_games(scanned_games)
+
+    def tag_scanned_games(self, launcher_name, games, used_keys):
+        for game in games:
+            game['launcher'] = launcher_name
+            game['source'] = 'scanned'
+            # Yerel resim bulunamadıysa boş alan taşınmaz; yoksa kayıtta indirilmiş kapağın üzerine yazılır.
+            if not game.get('image'):
+                game.pop('image', None)
+            game['unique'] = self.generate_unique_key(launcher_name, game['path'], used_keys)
+            used_keys.add(game['unique'])
+        return games
+
+    def load_known_exes(self):
+        """
+        Klasör -> kayıtlı exe. unique anahtarı taramada bulunan exe yolundan üretildiği için, indeksi olmayan
+        bir klasörde (ör. sürüm yükseltmesinden sonraki ilk tarama) aynı exe seçilirse oyunun anahtarı,
+        bilgileri ve manuel düzenlemeleri korunur. Birden fazla exe'yi kapsayan üst klasörler None olur.
+        """
+        try:
+            sources = self.store.load_games(hot_only=True) + self.store.load_manual_games()
+        except Exception as e:
+            print("Kayıtlı oyun yolları yüklenemedi:", e)
+            sources = []
+        exes = {}
+        for game in sources + self.library.snapshot():
+            prefix = f"{game.get('launcher')}_"
+            unique = game.get('unique') or ''
+            # Manuel düzenlemede yol değişmiş olabilir; taramanın bulduğu yol anahtarın içindedir.
+            exe = unique[len(prefix):] if unique.startswith(prefix) else None
+            if not exe or not exe.lower().endswith('.exe'):
+                continue
+            folder = os.path.dirname(os.path.normcase(os.path.normpath(exe)))
+            for _ in range(EXE_SEARCH_MAX_DEPTH + 1):
+                if exes.get(folder, exe) != exe:
+                    exes[folder] = None
+                else:
+                    exes[folder] = exe
+                parent = os.path.dirname(folder)
+                if parent == folder:
+                    break
+                folder = parent
+        return exes
+
+    def load_play_stats(self):
+        """unique -> {launch_time, play_count}; veritabanındaki kayıtlar, üzerine bellekteki kütüphane."""
+        stats = {}
+        try:
+            sources = self.store.load_games(hot_only=True) + self.store.load_manual_games()
+        except Exception as e:
+            print("Oynama bilgileri yüklenemedi:", e)
+            sources = []
+        for game in sources + self.library.snapshot():
+            fields = {f: game[f] for f in PLAY_STAT_FIELDS if game.get(f) is not None}
+            if fields:
+                stats.setdefault(game['unique'], {}).update(fields)
+        return stats
+
+    def merge_with_manual_games(self, scanned_games):
         manual_overrides = {g['unique']: g for g in self.manual_games if 'unique' in g}
         final_games = []
         for game in scanned_games:
@@ -664,40 +3782,126 @@ class GameLauncher:
         deduped = {}
         for game in final_games:
             deduped[game['unique']] = game
+        # Taramada bulunmayan oynama bilgileri tarama başındaki kayıtlardan taşınır.
+        previous_stats = getattr(self, 'previous_play_stats', {})
+        for unique, game in deduped.items():
+            for field, value in previous_stats.get(unique, {}).items():
+                if game.get(field) is None:
+                    game[field] = value
         return list(deduped.values())
 
-    def update_treeview(self, games):
-        # Taranan tüm oyunları saklamak için:
-        self.all_games = games
-        query = self.search_var.get().lower() if hasattr(self, 'search_var') else ""
-        if query:
-            filtered = [g for g in games if query in g.get('name', '').lower()]
-        else:
-            filtered = games
-        self.tree.delete(*self.tree.get_children())
-        for game in filtered:
-            self.tree.insert('', 'end', iid=game['unique'], values=(game['name'], game.get('launcher', ''), game['path']))
+    def update_treeview(self, games=None):
+        # Liste, kütüphanenin (ya da verilen oyunların) arama sonucuna fark uygulanarak getirilir;
+        # seçim ve kaydırma konumu korunur, büyük değişiklikler birkaç Tk turuna yayılır.
+        if games is None:
+            games = self.visible_games()
+        self.game_list.reconcile(games)
 
 
     def threaded_scan_games(self):
         def task():
-            games = self.scan_games_thread()
-            self.games = games
-            self.save_scan_results()
+            # Her launcher bittikçe o ana kadarki sonuçları listeye aktarıyoruz.
+            games = self.scan_games_thread(
+                on_progress=lambda partial, pending: self.root.after(
+                    0, lambda: self.apply_scan_progress(partial, pending))
+            )
             if self.error_logs:
                 try:
-                    with open("scan_errors.json", "w", encoding="utf-8") as f:
-                        json.dump(self.error_logs, f, indent=4, ensure_ascii=False)
+                    atomic_write_json("scan_errors.json", self.error_logs, compact=False)
                 except Exception as e:
                     print("Error saving scan errors:", e)
-            self.root.after(0, lambda: self.update_treeview(games))
+            try:
+                atomic_write_json("scan_timings.json", {k: round(v, 3) for k, v in self.scan_timings.items()}, compact=False)
+            except Exception as e:
+                print("Error saving scan timings:", e)
+            self.root.after(0, lambda: self.library.replace_all(games, reason='scan'))
+            self.root.after(0, self.sync_library_watch)
         threading.Thread(target=task, daemon=True).start()
 
+    def apply_scan_progress(self, partial, pending):
+        """
+        Biten launcher'ların sonuçlarını kütüphaneye uygular. Taraması süren launcher'ların mevcut kayıtları
+        korunur; böylece tarama sırasında da her oyun başlatılabilir, düzenlenebilir ve seçili kalır.
+        """
+        keys = {game['unique'] for game in partial}
+        kept = [game for game in self.library.snapshot()
+                if game.get('launcher') in pending and game['unique'] not in keys]
+        self.library.replace_all(partial + kept, reason='scan_progress')
+
+    #########################################
+    # Canlı Kütüphane İzleme
+    #########################################
+    def add_library_root(self, launcher_name, path):
+        self.library_roots.setdefault(launcher_name, set()).add(os.path.normpath(path))
+
+    def toggle_library_watch(self):
+        self.watch_libraries = self.watch_var.get()
+        self.save_settings()
+        self.sync_library_watch()
+
+    def sync_library_watch(self):
+        """İzleme açıksa izleyiciyi son taramanın bulduğu kütüphane klasörleriyle günceller, kapalıysa durdurur."""
+        if not self.watch_libraries:
+            if self.library_watcher:
+                self.library_watcher.stop()
+                self.library_watcher = None
+            return
+        if not self.library_roots:
+            # Açılışta tarama yapılmadıysa kütüphane klasörlerini indeksten alıyoruz.
+            self.load_scan_index()
+            self.library_roots = {name: set(paths) for name, paths in self.scan_index.get('roots', {}).items()}
+        if self.library_watcher is None:
+            self.library_watcher = LibraryWatcher(self.on_library_change)
+            print("Kütüphane izleyici backend:", self.library_watcher.backend.name)
+        roots = set()
+        for paths in self.library_roots.values():
+            roots |= paths
+        self.library_watcher.set_paths(roots)
+        self.library_watcher.start()
+
+    def on_library_change(self, changed_paths):
+        """İzleyici thread'inden çağrılır: sadece etkilenen launcher'lar yeniden taranır."""
+        affected = [name for name, roots in self.library_roots.items() if roots & changed_paths]
+        for launcher_name in affected:
+            scanner = self.launchers.get(launcher_name)
+            if not scanner:
+                continue
+            try:
+                games = self.tag_scanned_games(launcher_name, scanner(), set())
+            except Exception as e:
+                err = f"{launcher_name} tarama hatası: {str(e)}"
+                self.error_logs.append(err)
+                print(err)
+                continue
+            self.root.after(0, lambda n=launcher_name, g=games: self.apply_launcher_rescan(n, g))
+        if affected:
+            self.save_scan_index()
+
+    def apply_launcher_rescan(self, launcher_name, scanned):
+        """Tek bir launcher'ın yeni tarama sonucunu kütüphaneye sadece farklar olarak uygular."""
+        manual_keys = {g['unique'] for g in self.manual_games if 'unique' in g}
+        new_games = {g['unique']: g for g in scanned if g['unique'] not in manual_keys}
+        old_games = {g['unique']: g for g in self.library.games_by_launcher(launcher_name)
+                     if g.get('source') == 'scanned'}
+        for unique in old_games:
+            if unique not in new_games:
+                self.library.remove(unique, reason='watch')
+        for unique, game in new_games.items():
+            old = old_games.get(unique)
+            if old is None:
+                self.library.add(game, reason='watch')
+                continue
+            # Kalıcı bilgileri (resim, GiantBomb vb.) koruyarak sadece taranan alanları güncelliyoruz.
+            changed = {k: v for k, v in game.items() if k != 'image' and old.get(k) != v}
+            if changed:
+                self.library.update(unique, changed, reason='watch')
+
     #########################################
     # Yeni: Oyunun çalışıp çalışmadığını kontrol eden metotlar
     #########################################
     def check_game_running(self, game):
         try:
+            import psutil  # Çalışan süreçleri kontrol etmek için
             exe_name = os.path.basename(game['path']).lower()
             for proc in psutil.process_iter(['name']):
                 if proc.info['name'] and proc.info['name'].lower() == exe_name:
@@ -728,12 +3932,11 @@ class GameLauncher:
     # Oyun Başlatma, Ekleme, Düzenleme, Silme İşlemleri
     #########################################
     def launch_game(self):
-        selected = self.tree.selection()
-        if not selected:
+        unique_id = self.selected_unique()
+        if not unique_id:
             messagebox.showwarning("Uyarı", "Lütfen bir oyun seçin")
             return
 
-        unique_id = selected[0]
         game = self.get_game_by_unique(unique_id)
         if not game:
             return
@@ -744,11 +3947,11 @@ class GameLauncher:
 
         # Eğer launcher Steam ise ve appid varsa:
         if launcher_name == "Steam" and game.get("appid"):
-            game['launch_time'] = time.time()
             steam_client = self.clients.get("Steam", {}).get("path")
             if steam_client and os.path.exists(steam_client):
                 try:
                     subprocess.Popen(["steam://rungameid/" + str(game["appid"])])
+                    self.record_launch(game)
                     self.current_monitored_game = game['unique']
                     # 15 saniyelik gecikme: Steam'in oyunu başlatması için zaman tanıyacağız.
                     self.root.after(15000, lambda: self.monitor_game_status(game))
@@ -757,7 +3960,7 @@ class GameLauncher:
                     print("Steam launcher ile oyunu başlatmada hata:", e)
             try:
                 os.startfile("steam://rungameid/" + str(game["appid"]))
-                game['launch_time'] = time.time()
+                self.record_launch(game)
                 self.current_monitored_game = game['unique']
                 self.root.after(15000, lambda: self.monitor_game_status(game))
                 return
@@ -765,11 +3968,11 @@ class GameLauncher:
                 print("Steam protokolüyle başlatmada hata:", e)
         # Eğer launcher Epic Games ise ve appid varsa:
         if launcher_name == "Epic" and game.get("appid"):
-            game['launch_time'] = time.time()
             epic_client = self.clients.get("Epic Games", {}).get("path")
             if epic_client and os.path.exists(epic_client):
                 try:
                     subprocess.Popen(["com.epicgames.launcher://apps/" + str(game["appid"])])
+                    self.record_launch(game)
                     self.current_monitored_game = game['unique']
                     self.root.after(15000, lambda: self.monitor_game_status(game))
                     return
@@ -777,7 +3980,7 @@ class GameLauncher:
                     print("Epic Games launcher ile oyunu başlatmada hata:", e)
             try:
                 subprocess.Popen(["com.epicgames.launcher://apps/" + str(game["appid"])])
-                game['launch_time'] = time.time()
+                self.record_launch(game)
                 self.current_monitored_game = game['unique']
                 self.root.after(15000, lambda: self.monitor_game_status(game))
                 return
@@ -788,7 +3991,7 @@ class GameLauncher:
             try:
                 # explorer.exe'yi argüman ile birlikte çağırıyoruz.
                 subprocess.Popen([game['path'], game.get("args")])
-                game['launch_time'] = time.time()
+                self.record_launch(game)
                 self.current_monitored_game = game['unique']
                 self.root.after(15000, lambda: self.monitor_game_status(game))
                 return
@@ -799,20 +4002,23 @@ class GameLauncher:
         # Diğer durumlarda, doğrudan oyunun exe'si çalıştırılsın.
         try:
             subprocess.Popen(game_path, cwd=os.path.dirname(game_path))
-            game['launch_time'] = time.time()
-            self.current_monitored_game = game['unique']
-            self.monitor_game_status(game)
-        except Exception as e:
-            messagebox.showerror("Hata", f"Oyun başlatılamadı: {str(e)}")
-        # Diğer durumlarda oyun exe'si doğrudan çalıştırılsın.
-        try:
-            subprocess.Popen(game_path, cwd=os.path.dirname(game_path))
-            game['launch_time'] = time.time()
+            self.record_launch(game)
             self.current_monitored_game = game['unique']
             self.monitor_game_status(game)
         except Exception as e:
             messagebox.showerror("Hata", f"Oyun başlatılamadı: {str(e)}")
 
+    def record_launch(self, game):
+        """Son oynama zamanını ve oynama sayısını kaydeder (liste sütunları ve sıralama için)."""
+        changes = {'launch_time': time.time(), 'play_count': (game.get('play_count') or 0) + 1}
+        self.library.update(game['unique'], changes, reason='launch')
+        # Manuel/düzenlenmiş oyunlar taramada manual_games'ten geldiği için bilgi orada da tutulur.
+        manual = [g for g in self.manual_games if g.get('unique') == game['unique']]
+        for entry in manual:
+            entry.update(changes)
+        if manual:
+            self.save_manual_games()
+
     def add_application(self):
         add_win = tb.Toplevel(self.root)
         add_win.title("Uygulama Ekle")
@@ -873,8 +4079,7 @@ class GameLauncher:
             if not name or not path:
                 messagebox.showwarning("Uyarı", "Lütfen oyun adını ve yolunu girin.")
                 return
-            existing_keys = set(self.tree.get_children())
-            new_unique = self.generate_unique_key(launcher, path, existing_keys)
+            new_unique = self.generate_unique_key(launcher, path, self.library.keys())
             new_game = {
                 'name': name,
                 'launcher': launcher,
@@ -886,8 +4091,7 @@ class GameLauncher:
             }
             self.manual_games.append(new_game)
             self.save_manual_games()
-            self.games.append(new_game)
-            self.tree.insert('', 'end', iid=new_unique, values=(name, launcher, path))
+            self.library.add(new_game)
             add_win.destroy()
 
         save_btn = ttk.Button(frm, text="Ekle", command=save_app, bootstyle=SUCCESS)
@@ -895,14 +4099,14 @@ class GameLauncher:
 
 
     def edit_game(self):
-        selected = self.tree.selection()
-        if not selected:
+        unique_id = self.selected_unique()
+        if not unique_id:
             messagebox.showwarning("Uyarı", "Lütfen düzenlenecek oyunu seçin.")
             return
-        unique_id = selected[0]
         game = self.get_game_by_unique(unique_id)
         if not game:
             return
+        self.ensure_cold_loaded(game)
 
         edit_win = tb.Toplevel(self.root)
         edit_win.title("Oyunu Düzenle")
@@ -971,17 +4175,18 @@ class GameLauncher:
                 messagebox.showwarning("Uyarı", "Lütfen oyun adını ve yolunu girin.")
                 return
             old_unique = game.get('unique')
-            game['name'] = new_name
-            game['launcher'] = new_launcher
-            game['path'] = new_path
-            game['image'] = new_image
-            game['giantbomb_info'] = new_info
-            existing_keys = set(self.tree.get_children())
+            existing_keys = self.library.keys()
             existing_keys.discard(old_unique)
             new_unique = self.generate_unique_key(new_launcher, new_path, existing_keys)
-            game['unique'] = new_unique
-            self.tree.delete(old_unique)
-            self.tree.insert('', 'end', iid=new_unique, values=(new_name, new_launcher, new_path))
+            # Kütüphane; Treeview satırını ve veritabanı kaydını olaylarla günceller.
+            self.library.update(old_unique, {
+                'name': new_name,
+                'launcher': new_launcher,
+                'path': new_path,
+                'image': new_image,
+                'giantbomb_info': new_info,
+                'unique': new_unique
+            })
             updated = False
             for idx, g in enumerate(self.manual_games):
                 if g.get('unique') == old_unique:
@@ -999,19 +4204,18 @@ class GameLauncher:
 
 
     def delete_game(self):
-        selected = self.tree.selection()
-        if not selected:
+        unique_id = self.selected_unique()
+        if not unique_id:
             messagebox.showwarning("Uyarı", "Lütfen silinecek oyunu seçin.")
             return
         confirm = messagebox.askyesno("Onay", "Seçilen oyunu silmek istediğinize emin misiniz?")
         if not confirm:
             return
 
-        unique_id = selected[0]
-        self.games = [g for g in self.games if g.get('unique') != unique_id]
         self.manual_games = [g for g in self.manual_games if g.get('unique') != unique_id]
+        self.library.remove(unique_id)
         self.save_manual_games()
-        self.tree.delete(unique_id)
+        self.preview_pipeline.cancel()
         self.preview_canvas.delete("all")
         self.preview_canvas.create_text(200, 150, text="Resim Yok", fill="white", font=('Segoe UI', 16))
         self.info_label.config(text="")
@@ -1021,18 +4225,20 @@ class GameLauncher:
             self.save_manual_games()
         else:
             self.load_manual_games()
+        # Launcher'lar kurulmuş/kaldırılmış olabilir; konumları yeniden çözülsün.
+        self.locator.invalidate()
+        self.clients = self.locator.clients()
         self.threaded_scan_games()
 
     def load_manual_games(self):
         try:
-            with open("manual_games.json", "r", encoding="utf-8") as f:
-                self.manual_games = json.load(f)
-        except FileNotFoundError:
+            self.manual_games = self.store.load_manual_games()
+        except Exception as e:
+            print("Manuel oyunlar yüklenemedi:", e)
             self.manual_games = []
 
     def save_manual_games(self):
-        with open("manual_games.json", "w", encoding="utf-8") as f:
-            json.dump(self.manual_games, f, indent=4, ensure_ascii=False)
+        self.persistence.mark_dirty('manual_games')
 
     #########################################
     # Launcher Tarama Fonksiyonları
@@ -1040,33 +4246,27 @@ class GameLauncher:
     def scan_steam(self):
         games = []
         try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam")
-            steam_path = winreg.QueryValueEx(key, "InstallPath")[0].strip('"')
-            library_folders = os.path.join(steam_path, "steamapps", "libraryfolders.vdf")
-            with open(library_folders, 'r', encoding='utf-8') as f:
-                data = f.read()
-            paths = [steam_path]
-            for line in data.splitlines():
-                if '"path"' in line:
-                    try:
-                        path = line.split('"')[3].replace('\\\\', '\\').strip('"')
-                        paths.append(path)
-                    except IndexError:
-                        continue
+            steam_path = self.locate_root('Steam')
+            paths = self.get_steam_library_paths(steam_path)
             for path in paths:
                 apps_path = os.path.join(path, "steamapps", "common")
                 if os.path.exists(apps_path):
-                    for folder in os.listdir(apps_path):
+                    self.add_library_root('Steam', os.path.join(path, "steamapps"))
+                    # Kütüphanedeki tüm manifest'ları tek geçişte indeksliyoruz.
+                    manifests = self.get_steam_manifest_index(os.path.join(path, "steamapps"))
+                    for folder in self.list_library(apps_path):
                         game_path = os.path.join(apps_path, folder)
-                        exe = self.find_exe(game_path)
+                        exe, image = self.resolve_game_folder(game_path)
                         if exe:
-                            game = {'name': folder, 'path': exe}
-                            game['image'] = self.find_game_image(exe) or ""
-                            # Steam manifest'larından appid bilgisini alalım:
-                            manifest_dir = os.path.join(path, "steamapps")
-                            appid = self.get_steam_appid(manifest_dir, folder)
-                            if appid:
-                                game['appid'] = appid
+                            info = manifests.get(folder.lower()) or {}
+                            game = {'name': info.get('name') or folder, 'path': exe}
+                            game['image'] = image
+                            if info.get('appid'):
+                                game['appid'] = info['appid']
+                            if info.get('size_on_disk') is not None:
+                                game['size_on_disk'] = info['size_on_disk']
+                            if info.get('last_updated') is not None:
+                                game['last_updated'] = info['last_updated']
                             games.append(game)
         except Exception as e:
             err = f"Steam tarama hatası: {str(e)}"
@@ -1077,21 +4277,22 @@ class GameLauncher:
     def scan_epic_games(self):
         games = []
         try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Epic Games\EpicGamesLauncher")
-            epic_path = winreg.QueryValueEx(key, "AppDataPath")[0].strip('"')
+            epic_path = self.locate_root('Epic Games')
             manifest_path = os.path.join(epic_path, "Manifests")
             if os.path.exists(manifest_path):
+                self.add_library_root('Epic Games', manifest_path)
                 for file in os.listdir(manifest_path):
                     if file.endswith('.item'):
-                        with open(os.path.join(manifest_path, file), 'r', encoding='utf-8') as f:
+                        with self.scan_profiler.phase('manifest'), \
+                                open(os.path.join(manifest_path, file), 'r', encoding='utf-8') as f:
                             data = json.load(f)
                             game_path = data.get('InstallLocation')
                             if game_path:
                                 game_path = game_path.strip('"')
-                                exe = self.find_exe(game_path)
+                                exe, image = self.resolve_game_folder(game_path)
                                 if exe:
                                     game = {'name': data.get('DisplayName', 'Bilinmiyor'), 'path': exe}
-                                    game['image'] = self.find_game_image(exe) or ""
+                                    game['image'] = image
                                     games.append(game)
         except Exception as e:
             err = f"Epic Games tarama hatası: {str(e)}"
@@ -1102,16 +4303,15 @@ class GameLauncher:
     def scan_gog(self):
         games = []
         try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\GOG.com\GalaxyClient\paths")
-            gog_client = winreg.QueryValueEx(key, "client")[0].strip('"')
-            games_path = os.path.join(os.path.dirname(gog_client), "Games")
+            games_path = os.path.join(self.locate_root('GOG Galaxy'), "Games")
             if os.path.exists(games_path):
-                for folder in os.listdir(games_path):
+                self.add_library_root('GOG Galaxy', games_path)
+                for folder in self.list_library(games_path):
                     game_path = os.path.join(games_path, folder)
-                    exe = self.find_exe(game_path)
+                    exe, image = self.resolve_game_folder(game_path)
                     if exe:
                         game = {'name': folder, 'path': exe}
-                        game['image'] = self.find_game_image(exe) or ""
+                        game['image'] = image
                         games.append(game)
         except Exception as e:
             err = f"GOG Galaxy tarama hatası: {str(e)}"
@@ -1122,37 +4322,22 @@ class GameLauncher:
     def scan_xbox_games(self):
         games = []
         try:
-            output = subprocess.check_output(
-                ["powershell", "-Command", "Get-StartApps | ConvertTo-Json"],
-                universal_newlines=True,
-                encoding="utf-8",
-                errors="replace"
-            )
-            apps = json.loads(output)
-            # apps, bir sözlük ya da liste olabilir; listeye dönüştürelim:
-            if isinstance(apps, dict):
-                apps = [apps]
-            # Oyunları tanımlamak için örnek anahtar kelime listesi:
-            game_keywords = [
-                "halo", "forza", "minecraft", "gears", "sea of thieves", 
-                "destiny", "witcher", "assassin", "battlefield", "cod", "persona", "no man's sky"
-            ]
-            for app in apps:
-                name = app.get("Name", "")
-                appid = app.get("AppID", "")
-                # Eğer isim, belirlenen anahtar kelimelerden herhangi birini içeriyorsa oyuna ekleyelim:
-                if any(keyword in name.lower() for keyword in game_keywords):
-                    unique = self.generate_unique_key("Xbox", appid, set(g.get('unique', '') for g in self.games))
-                    game = {
-                        "name": name,
-                        "launcher": "Xbox",
-                        "path": "explorer.exe",  # UWP oyunları explorer.exe ile başlatılır.
-                        "args": f"shell:AppsFolder\\{appid}",  # Bu argüman ilgili uygulamayı başlatır.
-                        "image": "",
-                        "source": "scanned",
-                        "unique": unique
-                    }
-                    games.append(game)
+            existing_keys = self.library.keys()
+            with self.scan_profiler.phase('xbox_enumeration'):
+                matches = self.xbox_catalog.find_games()
+            for name, appid in matches:
+                unique = self.generate_unique_key("Xbox", appid, existing_keys)
+                existing_keys.add(unique)
+                game = {
+                    "name": name,
+                    "launcher": "Xbox",
+                    "path": "explorer.exe",  # UWP oyunları explorer.exe ile başlatılır.
+                    "args": f"shell:AppsFolder\\{appid}",  # Bu argüman ilgili uygulamayı başlatır.
+                    "image": "",
+                    "source": "scanned",
+                    "unique": unique
+                }
+                games.append(game)
         except Exception as e:
             err = f"Xbox oyunları tarama hatası: {str(e)}"
             self.error_logs.append(err)
@@ -1162,16 +4347,16 @@ class GameLauncher:
     def scan_ubisoft(self):
         games = []
         try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Ubisoft\Launcher")
-            ubisoft_path = winreg.QueryValueEx(key, "InstallDir")[0].strip('"')
+            ubisoft_path = self.locate_root('Ubisoft Connect')
             games_path = os.path.join(ubisoft_path, "games")
             if os.path.exists(games_path):
-                for folder in os.listdir(games_path):
+                self.add_library_root('Ubisoft Connect', games_path)
+                for folder in self.list_library(games_path):
                     game_path = os.path.join(games_path, folder)
-                    exe = self.find_exe(game_path)
+                    exe, image = self.resolve_game_folder(game_path)
                     if exe:
                         game = {'name': folder, 'path': exe}
-                        game['image'] = self.find_game_image(exe) or ""
+                        game['image'] = image
                         games.append(game)
         except Exception as e:
             err = f"Ubisoft Connect tarama hatası: {str(e)}"
@@ -1182,16 +4367,17 @@ class GameLauncher:
     def scan_origin(self):
         games = []
         try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Origin")
-            origin_client = winreg.QueryValueEx(key, "ClientPath")[0].strip('"')
+            # Origin kayıtlı değilse tarama yapılmaz (install_root hata fırlatır).
+            self.locate_root('Origin')
             local_content = r"C:\ProgramData\Origin\LocalContent"
             if os.path.exists(local_content):
-                for folder in os.listdir(local_content):
+                self.add_library_root('Origin', local_content)
+                for folder in self.list_library(local_content):
                     game_path = os.path.join(local_content, folder)
-                    exe = self.find_exe(game_path)
+                    exe, image = self.resolve_game_folder(game_path)
                     if exe:
                         game = {'name': folder, 'path': exe}
-                        game['image'] = self.find_game_image(exe) or ""
+                        game['image'] = image
                         games.append(game)
         except Exception as e:
             err = f"Origin tarama hatası: {str(e)}"
@@ -1199,12 +4385,94 @@ class GameLauncher:
             print(err)
         return games
 
-    def find_exe(self, folder):
-        for root, dirs, files in os.walk(folder):
-            for file in files:
-                if file.endswith('.exe') and not file.lower().startswith('unins'):
-                    return os.path.join(root, file).strip('"')
-        return None
+    def find_exe(self, folder, max_depth=None, stats=None):
+        """
+        Oyun klasöründe os.scandir ile genişlik öncelikli (BFS) arama yapar ve en olası .exe dosyasını döndürür.
+        Asset/redist klasörleri atlanır, adaylar puanlanır ve yeterince emin bir eşleşme bulununca arama durur.
+        stats sözlüğü verilirse ziyaret edilen girdi sayısı, süre vb. bilgiler içine yazılır.
+        """
+        if max_depth is None:
+            max_depth = EXE_SEARCH_MAX_DEPTH
+        start = time.perf_counter()
+        target = self.normalize_exe_name(os.path.basename(os.path.normpath(folder)))
+        visited = 0
+        candidates = 0
+        best_score, best_path = None, None
+        confident = False
+        depth = 0
+        level = [folder]
+        while level and depth <= max_depth and not confident:
+            next_level = []
+            for directory in level:
+                try:
+                    entries = os.scandir(directory)
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        visited += 1
+                        lower = entry.name.lower()
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if lower not in EXE_SKIP_DIRS and not lower.endswith('_data') and not lower.startswith('.'):
+                                    next_level.append(entry.path)
+                                continue
+                        except OSError:
+                            continue
+                        if not lower.endswith('.exe') or lower.startswith('unins'):
+                            continue
+                        candidates += 1
+                        score = self.score_exe_candidate(entry, target, depth)
+                        if best_score is None or score > best_score:
+                            best_score, best_path = score, entry.path
+                        if best_score >= EXE_CONFIDENT_SCORE:
+                            confident = True
+                            break
+                if confident:
+                    break
+            level = next_level
+            depth += 1
+
+        elapsed = time.perf_counter() - start
+        if stats is not None:
+            stats.update({
+                'visited': visited,
+                'candidates': candidates,
+                'depth_reached': depth - 1,
+                'early_stop': confident,
+                'score': best_score,
+                'elapsed': elapsed
+            })
+        with self.find_exe_lock:
+            self.find_exe_totals['calls'] += 1
+            self.find_exe_totals['visited'] += visited
+            self.find_exe_totals['elapsed'] += elapsed
+        return best_path.strip('"') if best_path else None
+
+    def normalize_exe_name(self, name):
+        return ''.join(ch for ch in name.lower() if ch.isalnum())
+
+    def score_exe_candidate(self, entry, target, depth):
+        """Aday .exe için puan: klasör adına benzerlik, dosya boyutu ve üst seviyede olması öne çıkarır."""
+        stem = entry.name[:-4].lower()
+        norm = self.normalize_exe_name(stem)
+        similarity = 0.0
+        if norm and target:
+            if norm == target:
+                similarity = 1.0
+            else:
+                similarity = difflib.SequenceMatcher(None, norm, target).ratio()
+                if len(norm) >= 3 and (norm in target or target in norm):
+                    similarity = max(similarity, 0.85)
+        score = similarity * 100 - depth * 8
+        try:
+            size_mb = entry.stat().st_size / (1024 * 1024)
+            score += min(20.0, math.log2(size_mb + 1) * 4)
+        except OSError:
+            pass
+        if any(word in stem for word in EXE_PENALTY_WORDS):
+            score -= 60
+        return score
 
     def find_game_image(self, exe_path):
         directory = os.path.dirname(exe_path)
@@ -1214,58 +4482,24 @@ class GameLauncher:
                 return image_path
         return None
 
+    def locate_root(self, launcher_name):
+        with self.scan_profiler.phase('registry'):
+            return self.locator.install_root(launcher_name)
+
     def get_steam_client_path(self):
-        try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam")
-            steam_path = winreg.QueryValueEx(key, "InstallPath")[0].strip('"')
-            client_exe = os.path.join(steam_path, "steam.exe")
-            if os.path.exists(client_exe):
-                return client_exe
-        except Exception as e:
-            print(f"Steam client yolu alınamadı: {str(e)}")
-        return None
+        return self.locator.client_path('Steam')
 
     def get_epic_client_path(self):
-        try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Epic Games\EpicGamesLauncher")
-            appdata_path = winreg.QueryValueEx(key, "AppDataPath")[0].strip('"')
-            potential_path = os.path.join(os.path.dirname(appdata_path), "Portal", "Binaries", "Win32", "EpicGamesLauncher.exe")
-            if os.path.exists(potential_path):
-                return potential_path
-        except Exception as e:
-            print(f"Epic Games client yolu alınamadı: {str(e)}")
-        return None
+        return self.locator.client_path('Epic Games')
 
     def get_gog_client_path(self):
-        try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\GOG.com\GalaxyClient\paths")
-            gog_client = winreg.QueryValueEx(key, "client")[0].strip('"')
-            if os.path.exists(gog_client):
-                return gog_client
-        except Exception as e:
-            print(f"GOG Galaxy client yolu alınamadı: {str(e)}")
-        return None
+        return self.locator.client_path('GOG Galaxy')
 
     def get_ubisoft_client_path(self):
-        try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Ubisoft\Launcher")
-            ubisoft_path = winreg.QueryValueEx(key, "InstallDir")[0].strip('"')
-            client_exe = os.path.join(ubisoft_path, "UbisoftConnect.exe")
-            if os.path.exists(client_exe):
-                return client_exe
-        except Exception as e:
-            print(f"Ubisoft Connect client yolu alınamadı: {str(e)}")
-        return None
+        return self.locator.client_path('Ubisoft Connect')
 
     def get_origin_client_path(self):
-        try:
-            key = winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Origin")
-            origin_client = winreg.QueryValueEx(key, "ClientPath")[0].strip('"')
-            if os.path.exists(origin_client):
-                return origin_client
-        except Exception as e:
-            print(f"Origin client yolu alınamadı: {str(e)}")
-        return None
+        return self.locator.client_path('Origin')
 
     def is_process_running(self, process_name):
         try:
@@ -1279,8 +4513,6 @@ class GameLauncher:
 #########################################
 # Programın Başlatılması
 #########################################
-import ctypes
-import sys
 
 def is_admin():
     try:
@@ -1288,12 +4520,65 @@ def is_admin():
     except:
         return False
 
+def run_headless_scan(output_path, report_path):
+    """
+    Pencere açmadan tarama yapar: birleşik oyun listesini output_path'e, launcher/aşama bazlı
+    süre ve sayaç raporunu report_path'e yazar. Hata yoksa 0, tarama hatası varsa 1 döndürür.
+    """
+    started = time.perf_counter()
+    app = GameLauncher(headless=True)
+    app.load_manual_games()
+    games = app.scan_games_thread()
+    app.library.replace_all(games, reason='scan')
+    total = time.perf_counter() - started
+    atomic_write_json(output_path, games, compact=False)
+    phases = app.scan_profiler.report()
+    report = {
+        'total_seconds': round(total, 3),
+        'game_count': len(games),
+        'launchers': {
+            name: {
+                'seconds': round(app.scan_timings.get(name, 0.0), 3),
+                'games': sum(1 for g in games if g.get('launcher') == name),
+                **phases.get(name, {'phases': {}, 'counters': {}})
+            }
+            for name in app.launchers
+        },
+        'find_exe': dict(app.find_exe_totals),
+        'registry': dict(app.locator.backend.stats),
+        'persistence': dict(app.persistence.stats),
+        'errors': app.error_logs
+    }
+    app.persistence.close()
+    atomic_write_json(report_path, report, compact=False)
+    print(f"{len(games)} oyun bulundu ({total:.2f} sn). Sonuçlar: {output_path}, rapor: {report_path}")
+    return 1 if app.error_logs else 0
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BGame Launcher")
+    parser.add_argument("--scan-only", action="store_true",
+                        help="Arayüzü açmadan oyunları tara ve sonuçları dosyaya yaz")
+    parser.add_argument("--output", default="scan_results.json",
+                        help="--scan-only için oyun listesi dosyası (varsayılan: scan_results.json)")
+    parser.add_argument("--report", default="scan_report.json",
+                        help="--scan-only için süre raporu dosyası (varsayılan: scan_report.json)")
+    parser.add_argument("--bench-search", action="store_true",
+                        help="10k ve 100k sentetik oyunla arama süresini ölç")
+    parser.add_argument("--stats", action="store_true",
+                        help="Çıkışta önbellek, HTTP ve kuyruk istatistiklerini yazdır")
+    args = parser.parse_args()
+    if args.bench_search:
+        benchmark_search()
+        sys.exit(0)
+    if args.scan_only:
+        # Zamanlanmış görevlerde çalışabilmesi için yönetici izni istenmez.
+        sys.exit(run_headless_scan(args.output, args.report))
     try:
         if not is_admin():
             ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
         else:
-            app = GameLauncher()
+            app = GameLauncher(print_stats=args.stats)
             app.root.mainloop()
     except Exception as e:
         print("Hata oluştu:", e)
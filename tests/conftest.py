@@ -0,0 +1,22 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """GL.py ayar/veritabanı dosyalarını çalışma klasörüne yazdığı için her test geçici klasörde çalışır."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def app(workdir):
+    """Pencere açmadan kurulan GameLauncher; bekleyen kayıtlar geçici klasördeyken yazılır."""
+    import GL
+    launcher = GL.GameLauncher(headless=True)
+    yield launcher
+    launcher.persistence.close()
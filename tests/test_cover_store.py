@@ -0,0 +1,92 @@
+import os
+import time
+
+import GL
+
+
+def make_store(tmp_path, **kwargs):
+    return GL.CoverStore(folder=str(tmp_path / "blobs"), manifest_file=str(tmp_path / "covers.json"),
+                         thumb_folder=str(tmp_path / "thumbs"), **kwargs)
+
+
+def make_thumb(store, path):
+    thumb = GL.thumbnail_path(path, store.thumb_folder)
+    os.makedirs(store.thumb_folder, exist_ok=True)
+    with open(thumb, "wb") as f:
+        f.write(b"thumb")
+    return thumb
+
+
+def test_shared_blob_is_dropped_with_its_thumbnail_after_last_release(tmp_path):
+    store = make_store(tmp_path)
+    path = store.put("a", b"cover")
+    assert store.put("b", b"cover") == path
+    thumb = make_thumb(store, path)
+    assert sorted(store.refs(os.path.splitext(os.path.basename(path))[0])) == ["a", "b"]
+
+    store.rename("a", "c")
+    store.release("b")
+    assert os.path.exists(path) and os.path.exists(thumb)
+    store.release("c")
+    assert not os.path.exists(path) and not os.path.exists(thumb)
+    assert store.blobs == {} and store.games == {} and store.users == {}
+
+
+def test_replacing_cover_drops_previous_blob(tmp_path):
+    store = make_store(tmp_path)
+    old = store.put("a", b"old")
+    thumb = make_thumb(store, old)
+    new = store.put("a", b"new")
+    assert old != new and not os.path.exists(old) and not os.path.exists(thumb)
+
+
+def test_eviction_and_reload_keep_refcounts(tmp_path):
+    evicted = []
+    store = make_store(tmp_path, max_bytes=10, on_evict=evicted.extend)
+    first = store.put("a", b"12345678")
+    time.sleep(0.01)
+    store.put("b", b"abcdefgh")
+    assert evicted == ["a"] and not os.path.exists(first)
+    assert "a" not in store.games
+
+    GL.atomic_write_json(store.manifest_file, store.snapshot())
+    reloaded = make_store(tmp_path)
+    assert reloaded.users == {reloaded.games["b"]: {"b"}}
+
+
+def test_gc_removes_unreferenced_thumbnails(tmp_path):
+    store = make_store(tmp_path)
+    kept_blob = store.put("a", b"cover")
+    manual = str(tmp_path / "manual.png")
+    open(manual, "wb").close()
+    kept = [make_thumb(store, kept_blob), make_thumb(store, manual)]
+    stale = make_thumb(store, str(tmp_path / "deleted.png"))
+
+    removed, _ = store.gc([manual])
+    assert removed == 1
+    assert all(os.path.exists(p) for p in kept) and not os.path.exists(stale)
+
+
+def test_gc_releases_links_of_games_that_are_gone(tmp_path):
+    store = make_store(tmp_path)
+    path = store.put("gone", b"cover")
+    kept = store.put("kept", b"other")
+    removed, _ = store.gc(live_uniques={"kept"})
+    assert removed == 1 and not os.path.exists(path) and os.path.exists(kept)
+    assert list(store.games) == ["kept"]
+
+
+def test_games_dropped_by_rescan_release_their_covers(app):
+    games = [{'unique': u, 'name': u, 'launcher': 'Steam', 'path': f"{u}.exe", 'source': 'scanned'}
+             for u in ("a", "b", "c")]
+    app.library.replace_all(games, reason='load')
+    paths = {u: app.cover_store.put(u, u.encode()) for u in ("a", "b", "c")}
+
+    app.library.replace_all(games[1:], reason='scan')
+    assert "a" not in app.cover_store.games and not os.path.exists(paths["a"])
+
+    app.library.remove("b", reason='watch')
+    assert "b" not in app.cover_store.games and not os.path.exists(paths["b"])
+
+    app.library.replace_all([], reason='scan_progress')
+    assert os.path.exists(paths["c"])
@@ -0,0 +1,101 @@
+import hashlib
+import http.server
+import os
+import tempfile
+import threading
+
+import pytest
+
+import GL
+
+pytest.importorskip("requests")
+
+
+class StubHandler(http.server.BaseHTTPRequestHandler):
+    """Her yol için sıradaki (durum, başlıklar, gövde) yanıtını döndüren sunucu."""
+    responses = {}
+    hits = {}
+
+    def do_GET(self):
+        self.hits[self.path] = self.hits.get(self.path, 0) + 1
+        queue = self.responses.get(self.path) or [(404, {}, b"")]
+        status, headers, body = queue.pop(0) if len(queue) > 1 else queue[0]
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    StubHandler.responses, StubHandler.hits = {}, {}
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield httpd, "http://127.0.0.1:%d" % httpd.server_address[1]
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_get_retries_503_and_honours_retry_after(server):
+    _, base = server
+    StubHandler.responses["/api"] = [(503, {"Retry-After": "7"}, b""), (503, {}, b""), (200, {}, b"ok")]
+    sleeps = []
+    client = GL.HttpClient(retries=3, backoff_base=0.5, sleep=sleeps.append)
+
+    response = client.get(base + "/api")
+    assert response.status_code == 200 and response.content == b"ok"
+    assert StubHandler.hits["/api"] == 3
+    assert sleeps[0] == 7.0
+    assert 0 <= sleeps[1] <= 1.0  # Retry-After yoksa base * 2 ** 1 sınırlı rastgele bekleme
+    stats = client.stats()["127.0.0.1:%d" % server[0].server_address[1]]
+    assert stats['requests'] == 3 and stats['retries'] == 2 and stats['errors'] == 0
+    assert stats['bytes'] == 2
+
+
+def test_get_returns_last_response_when_retries_run_out(server):
+    _, base = server
+    StubHandler.responses["/down"] = [(503, {"Retry-After": "120"}, b"")]
+    sleeps = []
+    client = GL.HttpClient(retries=2, backoff_max=30.0, sleep=sleeps.append)
+
+    assert client.get(base + "/down").status_code == 503
+    assert StubHandler.hits["/down"] == 3
+    assert sleeps == [30.0, 30.0]  # Retry-After, backoff_max ile sınırlanır
+
+
+def test_download_streams_to_temp_file_after_retry(server, tmp_path):
+    _, base = server
+    body = os.urandom(GL.HTTP_CHUNK_SIZE * 2 + 123)
+    StubHandler.responses["/cover.jpg"] = [(503, {"Retry-After": "1"}, b""), (200, {}, body)]
+    sleeps = []
+    client = GL.HttpClient(sleep=sleeps.append)
+
+    status, path, digest, size = client.download(
+        base + "/cover.jpg", lambda: tempfile.mkstemp(dir=str(tmp_path)))
+    assert (status, size, sleeps) == (200, len(body), [1.0])
+    with open(path, "rb") as f:
+        assert f.read() == body
+    assert digest == hashlib.sha256(body).hexdigest()
+
+    opened = []
+    status, path, digest, size = client.download(base + "/missing", lambda: opened.append(1))
+    assert (status, path, digest, size) == (404, None, None, 0)
+    assert opened == []
+
+
+def test_per_request_retry_and_timeout_override(server):
+    _, base = server
+    StubHandler.responses["/preview"] = [(503, {"Retry-After": "5"}, b""), (200, {}, b"late")]
+    sleeps = []
+    client = GL.HttpClient(retries=3, sleep=sleeps.append)
+
+    assert client.get(base + "/preview", retries=0, timeout=1).status_code == 503
+    assert StubHandler.hits["/preview"] == 1 and sleeps == []
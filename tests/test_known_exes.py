@@ -0,0 +1,45 @@
+import os
+
+import GL
+
+
+def touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, "wb").close()
+
+
+def test_unindexed_folder_keeps_exe_recorded_in_library(app, workdir):
+    game_dir = str(workdir / "common" / "Portal")
+    old_exe = os.path.join(game_dir, "bin", "launcher.exe")
+    touch(old_exe)
+    touch(os.path.join(game_dir, "Portal.exe"))  # Yeni puanlama bunu seçerdi
+    unique = f"Steam_{old_exe}"
+    app.store.replace_games([{'unique': unique, 'name': "Portal", 'launcher': 'Steam', 'path': old_exe,
+                              'source': 'scanned'}])
+
+    app.known_exes = app.load_known_exes()
+    exe, _ = app.resolve_game_folder(game_dir)
+    assert exe == old_exe
+    games = app.tag_scanned_games('Steam', [{'name': "Portal", 'path': exe}], set())
+    assert games[0]['unique'] == unique
+
+    # Kayıt indekse girdikten sonra klasör değişirse normal arama yapılır.
+    os.remove(old_exe)
+    os.utime(game_dir, ns=(0, 1))
+    exe, _ = app.resolve_game_folder(game_dir)
+    assert exe == os.path.join(game_dir, "Portal.exe")
+
+
+def test_manual_override_key_and_shared_parents(app, workdir):
+    a = str(workdir / "common" / "A" / "a.exe")
+    b = str(workdir / "common" / "B" / "b.exe")
+    touch(a)
+    touch(b)
+    app.store.replace_manual_games([{'unique': f"Epic Games_{a}", 'launcher': 'Epic Games',
+                                     'path': "D:\\edited.exe", 'source': 'manual'}])
+    app.library.replace_all([{'unique': f"Epic Games_{b}", 'launcher': 'Epic Games', 'path': b}], reason='load')
+    known = app.load_known_exes()
+    norm = lambda p: os.path.normcase(os.path.normpath(p))
+    assert known[norm(os.path.dirname(a))] == a
+    assert known[norm(os.path.dirname(b))] == b
+    assert known[norm(str(workdir / "common"))] is None
@@ -0,0 +1,115 @@
+import os
+import threading
+import time
+
+import pytest
+
+import GL
+
+
+def make_backends():
+    backends = [pytest.param(lambda: GL.PollingWatchBackend(interval=0.05), id="polling")]
+    backends.append(pytest.param(GL.InotifyWatchBackend, id="inotify", marks=pytest.mark.skipif(
+        not GL.InotifyWatchBackend.available(), reason="inotify yok")))
+    return backends
+
+
+def wait_for_change(backend, timeout=3.0):
+    changed = set()
+    deadline = time.monotonic() + timeout
+    while not changed and time.monotonic() < deadline:
+        changed = backend.wait(0.1)
+    return changed
+
+
+@pytest.mark.parametrize("factory", make_backends())
+def test_backend_reports_created_and_removed_entries(tmp_path, factory):
+    watched, other = tmp_path / "watched", tmp_path / "other"
+    watched.mkdir()
+    other.mkdir()
+    backend = factory()
+    try:
+        backend.add(str(watched))
+        backend.add(str(other))
+        assert backend.wait(0.1) == set()
+
+        (watched / "Game").mkdir()
+        assert wait_for_change(backend) == {str(watched)}
+
+        os.rmdir(watched / "Game")
+        assert wait_for_change(backend) == {str(watched)}
+
+        backend.remove(str(watched))
+        (watched / "Ignored").mkdir()
+        assert backend.wait(0.2) == set()
+    finally:
+        backend.close()
+
+
+class ScriptedBackend:
+    """Önceden verilen değişiklik listesini wait() çağrılarında sırayla döndüren sahte backend."""
+
+    def __init__(self, script):
+        self.script = list(script)
+        self.added = set()
+        self.closed = False
+
+    def add(self, path):
+        self.added.add(path)
+
+    def remove(self, path):
+        self.added.discard(path)
+
+    def wait(self, timeout):
+        time.sleep(0.01)
+        return self.script.pop(0) if self.script else set()
+
+    def close(self):
+        self.closed = True
+
+
+def test_watcher_debounces_bursts_into_one_callback(tmp_path):
+    a, b, c = (str(tmp_path / name) for name in "abc")
+    for path in (a, b, c):
+        os.mkdir(path)
+    backend = ScriptedBackend([{a}, {b}, {a}])
+    batches = []
+    done = threading.Event()
+
+    def callback(changed):
+        batches.append(changed)
+        done.set()
+
+    watcher = GL.LibraryWatcher(callback, backend=backend, debounce=0.1)
+    watcher.set_paths([a, b, str(tmp_path / "missing")])
+    assert backend.added == {a, b}
+    watcher.set_paths([b, c])
+    assert backend.added == {b, c}
+
+    watcher.start()
+    try:
+        assert done.wait(3)
+        time.sleep(0.2)
+    finally:
+        watcher.stop()
+    assert batches == [{a, b}]
+    assert backend.closed
+
+
+def test_watcher_with_polling_backend_on_real_folder(tmp_path):
+    library = tmp_path / "common"
+    library.mkdir()
+    batches = []
+    done = threading.Event()
+    watcher = GL.LibraryWatcher(lambda changed: (batches.append(changed), done.set()),
+                                backend=GL.PollingWatchBackend(interval=0.05), debounce=0.2)
+    watcher.set_paths([str(library)])
+    watcher.start()
+    try:
+        for name in ("One", "Two", "Three"):
+            (library / name).mkdir()
+            time.sleep(0.06)
+        assert done.wait(5)
+    finally:
+        watcher.stop()
+    assert batches == [{str(library)}]
@@ -0,0 +1,56 @@
+import threading
+
+import pytest
+
+import GL
+
+
+def test_slow_remote_preview_does_not_block_local_preview(tmp_path):
+    remote_started, release_remote = threading.Event(), threading.Event()
+    delivered = {}
+    done = threading.Event()
+
+    pipeline = GL.PreviewPipeline(lambda fn: fn(), http=None, thumb_folder=str(tmp_path / "thumbs"))
+
+    def decode(image_path):
+        if image_path.startswith("http"):
+            remote_started.set()
+            release_remote.wait(5)
+        return None
+
+    pipeline.decode = decode
+    pipeline.deliver = lambda generation, key, image, on_ready, started: on_ready(key[0])
+
+    pipeline.request("http://example.invalid/cover.jpg", lambda path: delivered.setdefault('remote', path))
+    assert remote_started.wait(2)
+    local = str(tmp_path / "local.jpg")
+    pipeline.request(local, lambda path: (delivered.setdefault('local', path), done.set()))
+    try:
+        assert done.wait(2)
+        assert delivered == {'local': local}
+    finally:
+        release_remote.set()
+
+
+def test_transparent_icon_thumbnail_keeps_alpha(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    icon = str(tmp_path / "icon.png")
+    source = Image.new("RGBA", (800, 600), (0, 0, 0, 0))
+    source.paste((255, 0, 0, 255), (300, 200, 500, 400))
+    source.save(icon)
+    photo = str(tmp_path / "cover.jpg")
+    Image.new("RGB", (800, 600), (10, 200, 30)).save(photo)
+
+    pipeline = GL.PreviewPipeline(lambda fn: fn(), http=None, thumb_folder=str(tmp_path / "thumbs"))
+    for _ in range(2):  # İlk çağrı kopyayı üretir, ikincisi diskten okur
+        thumb = pipeline.load_thumbnail(icon)
+        assert thumb.mode == "RGBA"
+        assert thumb.getpixel((0, 0))[3] == 0
+        assert thumb.getpixel((thumb.width // 2, thumb.height // 2)) == (255, 0, 0, 255)
+    assert pipeline.stats['thumb_builds'] == 1 and pipeline.stats['thumb_hits'] == 1
+    with Image.open(pipeline.thumbnail_path(icon)) as saved:
+        assert saved.format == "PNG"
+
+    assert pipeline.load_thumbnail(photo).mode == "RGB"
+    with Image.open(pipeline.thumbnail_path(photo)) as saved:
+        assert saved.format == "JPEG"
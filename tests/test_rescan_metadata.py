@@ -0,0 +1,40 @@
+import GL
+
+
+def scan(app, found):
+    """Tarayıcı sonucu gibi (yerel resim yoksa image='') kayıtları kütüphaneye ve veritabanına yazar."""
+    games = [dict(game) for game in found]
+    app.tag_scanned_games('Steam', games, set())
+    games = app.merge_with_manual_games(games)
+    app.library.replace_all(games, reason='load')
+    app.store.replace_games(app.library.snapshot())
+    return games
+
+
+def test_rescan_keeps_downloaded_cover(app):
+    found = [{'name': "Portal", 'path': "C:\\Games\\Portal\\portal.exe", 'image': ""}]
+    game = scan(app, found)[0]
+    assert 'image' not in game
+
+    cover = app.cover_store.put(game['unique'], b"cover")
+    game.update(image=cover, image_attempted=True)
+    app.save_game_metadata(game)
+
+    rescanned = scan(app, found)[0]
+    assert app.store.load_metadata(rescanned['unique']) == {'image': cover, 'image_attempted': True}
+    app.ensure_cold_loaded(rescanned)
+    assert rescanned['image'] == cover
+
+
+def test_stored_cover_replaces_empty_value_in_memory(app):
+    game = scan(app, [{'name': "Portal", 'path': "portal.exe", 'image': ""}])[0]
+    app.save_game_metadata(dict(game, image="image_cache/blobs/x.jpg", image_attempted=True))
+
+    stale = dict(game, image="")
+    app.ensure_cold_loaded(stale)
+    assert stale['image'] == "image_cache/blobs/x.jpg"
+
+
+def test_local_icon_from_scan_is_still_written(app):
+    game = scan(app, [{'name': "Portal", 'path': "portal.exe", 'image': "C:\\Games\\Portal\\icon.png"}])[0]
+    assert app.store.load_metadata(game['unique'])['image'] == "C:\\Games\\Portal\\icon.png"
@@ -0,0 +1,27 @@
+import os
+
+import GL
+
+
+def test_missing_exe_is_searched_again_after_miss_ttl(app, workdir, monkeypatch):
+    game_dir = workdir / "Epic" / "Fortnite"
+    (game_dir / "Binaries" / "Win64").mkdir(parents=True)
+    now = [1_000_000.0]
+    monkeypatch.setattr(GL.time, "time", lambda: now[0])
+
+    assert app.resolve_game_folder(str(game_dir)) == (None, "")
+    # Kurulum sürerken exe alt klasöre düşer; oyun klasörünün mtime'ı değişmez.
+    top = os.stat(game_dir)
+    exe = game_dir / "Binaries" / "Win64" / "Fortnite.exe"
+    exe.write_bytes(b"MZ")
+    os.utime(game_dir, ns=(top.st_atime_ns, top.st_mtime_ns))
+
+    assert app.resolve_game_folder(str(game_dir))[0] is None  # Negatif kayıt henüz geçerli
+    now[0] += GL.SCAN_INDEX_MISS_TTL + 1
+    assert app.resolve_game_folder(str(game_dir))[0] == str(exe)
+
+    # Bulunan exe süresiz önbellekte kalır.
+    now[0] += GL.SCAN_INDEX_MAX_AGE / 2
+    calls = app.find_exe_totals['calls']
+    assert app.resolve_game_folder(str(game_dir))[0] == str(exe)
+    assert app.find_exe_totals['calls'] == calls
@@ -0,0 +1,50 @@
+import pytest
+
+import GL
+
+NAMES = ["Halo Infinite", "Halo: The Master Chief Collection", "Forza Horizon 5", "The Witcher 3",
+         "Sea of Thieves", "Shadow Warrior", "Hades"]
+
+
+@pytest.fixture
+def index():
+    library = GL.GameLibrary()
+    library.replace_all([{'unique': f"g{i}", 'name': name, 'launcher': 'Diğer', 'path': f"g{i}.exe"}
+                         for i, name in enumerate(NAMES)])
+    return GL.GameSearchIndex(library)
+
+
+def names(results):
+    return [game['name'] for game in results]
+
+
+def test_prefix_and_word_matches_rank_first(index):
+    assert names(index.search("halo")) == ["Halo Infinite", "Halo: The Master Chief Collection"]
+    assert names(index.search("witcher"))[0] == "The Witcher 3"
+
+
+def test_short_queries_match_inside_names(index):
+    assert set(names(index.search("lo"))) == {"Halo Infinite", "Halo: The Master Chief Collection"}
+    result = names(index.search("ha"))
+    assert result[:3] == ["Hades", "Halo Infinite", "Halo: The Master Chief Collection"]
+    assert "Shadow Warrior" in result
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("hlao", "Halo Infinite"),        # yer değiştirme
+    ("ahlo", "Halo Infinite"),        # ilk iki harf yer değiştirmiş
+    ("witchr", "The Witcher 3"),      # eksik harf
+    ("froza horizon", "Forza Horizon 5"),
+])
+def test_typos_still_match(index, query, expected):
+    assert expected in names(index.search(query))
+
+
+def test_unrelated_query_finds_nothing(index):
+    assert index.search("zzzz") == []
+
+
+def test_prefix_edit_distance():
+    assert GL.prefix_edit_distance("hlao", "halo infinite", 1) == 1
+    assert GL.prefix_edit_distance("halo", "halo infinite", 1) == 0
+    assert GL.prefix_edit_distance("xyz", "halo", 1) == 2
@@ -0,0 +1,153 @@
+import os
+
+import GL
+
+
+def write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def manifest(appid, name, installdir, size=1024, updated=1700000000):
+    return ('"AppState"\n{\n'
+            f'\t"appid"\t\t"{appid}"\n'
+            f'\t"name"\t\t"{name}"\n'
+            f'\t"installdir"\t\t"{installdir}"\n'
+            f'\t"SizeOnDisk"\t\t"{size}"\n'
+            f'\t"LastUpdated"\t\t"{updated}"\n'
+            '}\n')
+
+
+#########################################
+# VDF
+#########################################
+def test_tokenize_vdf_escapes_and_comments():
+    text = '// yorum\n"key" "a \\"quoted\\" C:\\\\Games\\nnext" { }'
+    assert list(GL.tokenize_vdf(text)) == [
+        ('str', 'key'),
+        ('str', 'a "quoted" C:\\Games\nnext'),
+        ('open', '{'),
+        ('close', '}'),
+    ]
+
+
+def test_parse_vdf_skips_conditionals_and_unquoted_tokens():
+    text = '''
+    "root"
+    {
+        "win"   "1"     [$WIN32]
+        bare    value
+        "child" { "Inner" "x" }
+    }
+    '''
+    data = GL.parse_vdf(text)
+    assert data == {'root': {'win': '1', 'bare': 'value', 'child': {'Inner': 'x'}}}
+    assert GL.vdf_get(data['root'], 'CHILD') == {'Inner': 'x'}
+    assert GL.vdf_get(data['root'], 'missing', 'yok') == 'yok'
+
+
+def test_parse_vdf_tolerates_unbalanced_braces():
+    data = GL.parse_vdf('"a" { "b" "1" } } } "c" { "d" "2"')
+    assert data == {'a': {'b': '1'}, 'c': {'d': '2'}}
+
+
+def test_library_paths_old_and_new_format(workdir):
+    app = GL.GameLauncher(headless=True)
+    steam = str(workdir / "Steam")
+    write(os.path.join(steam, "steamapps", "libraryfolders.vdf"), '''
+    "LibraryFolders"
+    {
+        "TimeNextStatsReport"   "1700000000"
+        "ContentStatsID"        "-123"
+        "1"     "D:\\\\SteamLibrary"
+    }
+    ''')
+    assert app.get_steam_library_paths(steam) == [steam, "D:\\SteamLibrary"]
+
+    write(os.path.join(steam, "steamapps", "libraryfolders.vdf"), f'''
+    "libraryfolders"
+    {{
+        "0" {{ "path" "{steam}" "apps" {{ "10" "1" }} }}
+        "1" {{ "path" "E:\\\\Games" "label" "" }}
+    }}
+    ''')
+    assert app.get_steam_library_paths(steam) == [steam, "E:\\Games"]
+
+
+#########################################
+# Manifest indeksi
+#########################################
+def test_manifest_index_reuses_cache_until_mtime_changes(workdir, monkeypatch):
+    app = GL.GameLauncher(headless=True)
+    steamapps = workdir / "steamapps"
+    first = str(steamapps / "appmanifest_10.acf")
+    write(first, manifest(10, "Counter-Strike", "Half-Life"))
+    write(str(steamapps / "appmanifest_20.acf"), manifest(20, "Team Fortress", "TF Classic", size="x"))
+    write(str(steamapps / "notes.txt"), "appmanifest olmayan dosya")
+
+    parsed = []
+    original = app.parse_steam_manifest
+    monkeypatch.setattr(app, "parse_steam_manifest", lambda path: parsed.append(path) or original(path))
+
+    index = app.get_steam_manifest_index(str(steamapps))
+    assert set(index) == {"half-life", "tf classic"}
+    assert index["half-life"] == {'appid': '10', 'name': 'Counter-Strike', 'installdir': 'Half-Life',
+                                  'size_on_disk': 1024, 'last_updated': 1700000000}
+    assert index["tf classic"]['size_on_disk'] is None
+    assert len(parsed) == 2
+
+    parsed.clear()
+    assert app.get_steam_manifest_index(str(steamapps)) == index
+    assert parsed == []
+
+    write(first, manifest(10, "Counter-Strike 1.6", "Half-Life"))
+    stat = os.stat(first)
+    os.utime(first, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    index = app.get_steam_manifest_index(str(steamapps))
+    assert parsed == [first]
+    assert index["half-life"]['name'] == "Counter-Strike 1.6"
+
+
+def test_manifest_index_missing_folder(workdir):
+    app = GL.GameLauncher(headless=True)
+    assert app.get_steam_manifest_index(str(workdir / "yok")) == {}
+
+
+#########################################
+# scan_steam
+#########################################
+def test_scan_steam_with_in_memory_registry(workdir):
+    steam = str(workdir / "Steam")
+    extra = str(workdir / "Library2")
+    write(os.path.join(steam, "steamapps", "libraryfolders.vdf"),
+          '"libraryfolders" { "0" { "path" "%s" } "1" { "path" "%s" } }'
+          % (steam.replace("\\", "\\\\"), extra.replace("\\", "\\\\")))
+    write(os.path.join(steam, "steamapps", "appmanifest_10.acf"), manifest(10, "Half-Life", "Half-Life"))
+    write(os.path.join(steam, "steamapps", "common", "Half-Life", "hl.exe"), "")
+    write(os.path.join(steam, "steamapps", "common", "Empty", "readme.txt"), "")
+    write(os.path.join(extra, "steamapps", "common", "Portal", "portal.exe"), "")
+
+    app = GL.GameLauncher(headless=True)
+    backend = GL.InMemoryRegistryBackend(
+        values={(GL.LAUNCHER_LOCATIONS['Steam'][0], "InstallPath"): steam},
+        existing_paths={os.path.join(steam, "steam.exe")})
+    app.locator = GL.ClientLocator(backend)
+
+    games = sorted(app.scan_steam(), key=lambda g: g['name'])
+    assert app.error_logs == []
+    assert [(g['name'], os.path.basename(g['path'])) for g in games] == [
+        ("Half-Life", "hl.exe"), ("Portal", "portal.exe")]
+    assert games[0]['appid'] == '10'
+    assert games[0]['size_on_disk'] == 1024
+    assert 'appid' not in games[1]
+    assert app.library_roots['Steam'] == {os.path.join(steam, "steamapps"), os.path.join(extra, "steamapps")}
+    assert app.locator.client_path('Steam') == os.path.join(steam, "steam.exe")
+    assert backend.stats['registry_reads'] == 1
+
+
+def test_scan_steam_logs_missing_registry(workdir):
+    app = GL.GameLauncher(headless=True)
+    app.locator = GL.ClientLocator(GL.InMemoryRegistryBackend())
+    assert app.scan_steam() == []
+    assert len(app.error_logs) == 1 and app.error_logs[0].startswith("Steam tarama hatası")
@@ -0,0 +1,62 @@
+import threading
+
+import GL
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_background_requests_leave_reserve_for_interactive():
+    clock = FakeClock()
+    bucket = GL.TokenBucket(3600, 5, clock=clock, sleep=clock.sleep, reserve=3)
+    assert bucket.acquire() == 0 and bucket.acquire() == 0
+    assert bucket.status()['remaining'] == 3
+
+    # Arka plan isteği ayrılmış tokenlara dokunmaz, bir token dolana kadar bekler.
+    assert bucket.acquire() == 1.0
+    assert clock.sleeps == [1.0]
+
+    # Etkileşimli istekler ayrılmış kısmı beklemeden kullanır.
+    assert [bucket.acquire(interactive=True) for _ in range(3)] == [0, 0, 0]
+    status = bucket.status()
+    assert status['remaining'] == 0 and status['interactive'] == 3 and status['acquired'] == 6
+
+
+def test_reserve_is_capped_below_burst():
+    clock = FakeClock()
+    bucket = GL.TokenBucket(3600, 1, clock=clock, sleep=clock.sleep, reserve=3)
+    assert bucket.reserve == 0
+    assert bucket.acquire() == 0
+
+
+def test_selected_job_runs_while_background_workers_are_blocked():
+    release = threading.Event()
+    selected_done = threading.Event()
+    seen = []
+
+    def task(unique, priority):
+        seen.append((unique, priority))
+        if priority == GL.PRIORITY_SELECTED:
+            selected_done.set()
+        else:
+            release.wait(5)
+
+    scheduler = GL.PrefetchScheduler(task, workers=2)
+    try:
+        for i in range(4):
+            scheduler.submit(f"bg{i}")
+        scheduler.submit("chosen", GL.PRIORITY_SELECTED)
+        assert selected_done.wait(2)
+        assert ("chosen", GL.PRIORITY_SELECTED) in seen
+    finally:
+        release.set()
@@ -0,0 +1,83 @@
+import json
+import os
+
+import GL
+
+
+APPS = [
+    {'Name': "Halo Infinite", 'AppID': "Microsoft.254428597CFE2_8wekyb3d8bbwe!App"},
+    {'Name': "Forza Horizon 5", 'AppID': "Microsoft.624F8B84B80_8wekyb3d8bbwe!App"},
+    {'Name': "Forza Hub Companion", 'AppID': "Microsoft.ForzaHub_8wekyb3d8bbwe!App"},
+    {'Name': "Calculator", 'AppID': "Microsoft.WindowsCalculator_8wekyb3d8bbwe!App"},
+]
+
+
+def make_catalog(tmp_path, apps=APPS):
+    packages = tmp_path / "Packages"
+    packages.mkdir(exist_ok=True)
+    calls = []
+
+    def runner(command):
+        calls.append(command)
+        return json.dumps(apps)
+
+    catalog = GL.XboxAppCatalog(runner=runner, cache_file=str(tmp_path / "apps.json"),
+                                rules_file=str(tmp_path / "rules.json"), signature_paths=[str(packages)])
+    return catalog, calls, packages
+
+
+def test_find_games_uses_cache_until_packages_change(tmp_path):
+    catalog, calls, packages = make_catalog(tmp_path)
+
+    assert catalog.find_games() == [
+        ("Halo Infinite", APPS[0]['AppID']),
+        ("Forza Horizon 5", APPS[1]['AppID']),
+        ("Forza Hub Companion", APPS[2]['AppID']),
+    ]
+    assert len(calls) == 1
+    with open(tmp_path / "rules.json", encoding="utf-8") as f:
+        assert json.load(f) == GL.DEFAULT_XBOX_RULES
+
+    # Yeni bir catalog nesnesi de diskteki önbelleği kullanmalı.
+    fresh, fresh_calls, _ = make_catalog(tmp_path)
+    assert fresh.find_games() == catalog.find_games()
+    assert fresh_calls == [] and fresh.stats == {'runs': 0, 'cache_hits': 1}
+
+    (packages / "Microsoft.NewGame_8wekyb3d8bbwe").mkdir()
+    stat = os.stat(packages)
+    os.utime(packages, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    catalog.find_games()
+    assert len(calls) == 2
+    assert catalog.stats == {'runs': 2, 'cache_hits': 1}
+
+
+def test_rules_file_changes_are_picked_up(tmp_path):
+    catalog, _, _ = make_catalog(tmp_path)
+    assert len(catalog.find_games()) == 3
+
+    rules = tmp_path / "rules.json"
+    rules.write_text(json.dumps({"keywords": ["forza", "calc"], "exclude": ["hub"]}), encoding="utf-8")
+    stat = os.stat(rules)
+    os.utime(rules, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert [name for name, _ in catalog.find_games()] == ["Forza Horizon 5", "Calculator"]
+
+    rules.write_text(json.dumps({"keywords": []}), encoding="utf-8")
+    os.utime(rules, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+    assert catalog.find_games() == []
+
+
+def test_single_app_output_and_missing_signature_paths(tmp_path):
+    calls = []
+
+    def runner(command):
+        calls.append(command)
+        return json.dumps({'Name': "Minecraft", 'AppID': "Microsoft.MinecraftUWP!App"})
+
+    catalog = GL.XboxAppCatalog(runner=runner, cache_file=str(tmp_path / "apps.json"),
+                                rules_file=str(tmp_path / "rules.json"),
+                                signature_paths=[str(tmp_path / "missing")])
+    assert catalog.find_games() == [("Minecraft", "Microsoft.MinecraftUWP!App")]
+    assert catalog.find_games() == [("Minecraft", "Microsoft.MinecraftUWP!App")]
+    # Paket klasörleri okunamıyorsa değişiklik sinyali yok; her seferinde komut çalıştırılır, önbellek yazılmaz.
+    assert len(calls) == 2
+    assert not os.path.exists(tmp_path / "apps.json")